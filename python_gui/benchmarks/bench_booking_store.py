@@ -0,0 +1,108 @@
+"""
+Benchmark: BookingStore insert and query throughput
+
+Usage:
+    python benchmarks/bench_booking_store.py [--count 1000000] [--batch 10000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.booking_store import BookingStore
+from models.types import Booking, TIME_SLOTS
+
+SERVICE_IDS = [f'service_{i:02d}' for i in range(1, 6)]
+START_DATE = date(2020, 1, 1)
+DAYS = 365 * 6
+
+
+def random_booking(rng, user_count):
+    """Generate a booking spread over services, users and six years of dates"""
+    return Booking(
+        service_id=rng.choice(SERVICE_IDS),
+        date=(START_DATE + timedelta(days=rng.randrange(DAYS))).isoformat(),
+        time_slot=rng.choice(TIME_SLOTS),
+        user_id=str(rng.randrange(user_count)),
+        status='confirmed' if rng.random() < 0.9 else 'cancelled'
+    )
+
+
+def report(label, count, seconds):
+    """Print throughput for count operations"""
+    print(f"  {label:<36} {count / seconds:14,.0f} ops/s   ({seconds * 1000 / count:.4f} ms/op)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=1_000_000, help='bookings to insert')
+    parser.add_argument('--batch', type=int, default=10_000, help='bookings per transaction')
+    parser.add_argument('--users', type=int, default=50_000, help='distinct user ids')
+    parser.add_argument('--queries', type=int, default=2_000, help='queries per measurement')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = BookingStore(os.path.join(tmp, 'bookings.db'))
+
+        print(f"Inserting {args.count:,} bookings")
+        start = time.perf_counter()
+        inserted = 0
+        while inserted < args.count:
+            size = min(args.batch, args.count - inserted)
+            with store.batch():
+                for _ in range(size):
+                    store.add(random_booking(rng, args.users))
+            inserted += size
+        report(f"batched insert ({args.batch:,}/txn)", args.count, time.perf_counter() - start)
+
+        single = 200
+        start = time.perf_counter()
+        for _ in range(single):
+            store.add(random_booking(rng, args.users))
+        report("single insert (1/txn)", single, time.perf_counter() - start)
+
+        print(f"\nQuerying {store.count():,} bookings")
+        user_ids = [str(rng.randrange(args.users)) for _ in range(args.queries)]
+        dates = [(START_DATE + timedelta(days=rng.randrange(DAYS))).isoformat() for _ in range(args.queries)]
+
+        start = time.perf_counter()
+        rows = sum(len(store.for_user(user_id)) for user_id in user_ids)
+        report(f"for_user (~{rows // args.queries} rows)", args.queries, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        rows = 0
+        for day in dates:
+            month = day[:8]
+            rows += len(store.for_service(rng.choice(SERVICE_IDS), month + '01', month + '31'))
+        report(f"for_service month (~{rows // args.queries} rows)", args.queries, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        rows = sum(len(store.on_date(day)) for day in dates)
+        report(f"on_date (~{rows // args.queries} rows)", args.queries, time.perf_counter() - start)
+
+        booking_ids = [str(rng.randrange(1, args.count)) for _ in range(args.queries)]
+        start = time.perf_counter()
+        for booking_id in booking_ids:
+            store.get(booking_id)
+        report("get by id", args.queries, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for booking_id in booking_ids[:single]:
+            store.update_status(booking_id, 'cancelled')
+        report("update_status", single, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        loaded = len(store.confirmed_from((START_DATE + timedelta(days=DAYS - 30)).isoformat()))
+        print(f"  startup load of last 30 days ({loaded:,} rows) {(time.perf_counter() - start) * 1000:10.1f} ms")
+
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark: facet filtering and live counts with bitsets vs scanning the catalog
+
+Usage:
+    python benchmarks/bench_facets.py [--pets 100000] [--reps 50]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_search_index import make_pets, timed
+from models.facets import FACETS, FacetIndex, pet_facets
+
+SELECTIONS = [
+    {},
+    {'species': ['Dog']},
+    {'species': ['Dog'], 'age': ['2-4']},
+    {'species': ['Cat'], 'trait': ['Hypoallergenic', 'Very calm']},
+    {'species': ['Dog'], 'age': ['2-4', '5-8'], 'breed': ['Beagle'], 'trait': ['House trained']},
+]
+
+
+def scan_filter(pets, selection):
+    """Filter with a comprehension over every pet"""
+    return [
+        i for i, pet in enumerate(pets)
+        if all(set(values) & set(pet_facets(pet)[facet]) for facet, values in selection.items())
+    ]
+
+
+def scan_counts(pets, selection):
+    """Count facet values by re-filtering the catalog once per facet"""
+    counts = {}
+    for facet in FACETS:
+        others = {other: values for other, values in selection.items() if other != facet}
+        facet_counts = counts.setdefault(facet, {})
+        for i in scan_filter(pets, others):
+            for value in pet_facets(pets[i])[facet]:
+                facet_counts[value] = facet_counts.get(value, 0) + 1
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pets', type=int, default=100_000)
+    parser.add_argument('--reps', type=int, default=50, help='repetitions per selection')
+    args = parser.parse_args()
+
+    pets = make_pets(args.pets, random.Random(3))
+    index = FacetIndex()
+    start = time.perf_counter()
+    index.build(pets)
+    print(f"Built facet bitsets over {args.pets:,} pets in {time.perf_counter() - start:.2f}s")
+
+    print(f"\n  {'facets':<6} {'matches':>8} {'mask us':>9} {'counts us':>10} {'scan filter ms':>15} {'scan counts ms':>15}")
+    for selection in SELECTIONS:
+        mask, mask_us = timed(args.reps, lambda: index.mask(selection))
+        _, counts_us = timed(args.reps, lambda: index.counts(selection))
+        matches, filter_us = timed(1, lambda: scan_filter(pets, selection))
+        _, scan_counts_us = timed(1, lambda: scan_counts(pets, selection))
+        assert len(matches) == mask.bit_count()
+        print(f"  {len(selection):<6} {len(matches):>8,} {mask_us:9.1f} {counts_us:10.1f} "
+              f"{filter_us / 1000:15.1f} {scan_counts_us / 1000:15.1f}")
+
+
+if __name__ == "__main__":
+    main()
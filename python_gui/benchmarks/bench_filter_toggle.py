@@ -0,0 +1,106 @@
+"""
+Benchmark: adoption page species-filter toggle latency, rebuilding cards vs rebinding pooled cards
+
+Needs a display (run under Xvfb on headless machines).
+
+Usage:
+    python benchmarks/bench_filter_toggle.py [--pets 240] [--rounds 5]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import customtkinter as ctk
+from models.app_state import app_state
+from models.types import Pet
+from views.components.pet_card import PetCard
+
+FILTERS = ["Dog", "Cat", "Bird", "All"]
+
+
+def grow_catalog(count):
+    """Repeat the sample pets until the catalog has count entries"""
+    samples = list(app_state.pets)
+    app_state.set_pets([
+        Pet(id=f"{pet.id}_{i}", name=f"{pet.name} {i}", species=pet.species, breed=pet.breed,
+            age=pet.age, description=pet.description, quick_facts=pet.quick_facts,
+            image_urls=pet.image_urls)
+        for i, pet in ((i, samples[i % len(samples)]) for i in range(count))
+    ])
+
+
+def legacy_display(page, filter_name):
+    """The previous _display_pets: filter with a linear scan, destroy every card and build a full grid"""
+    filtered_pets = app_state.pets
+    if filter_name != "All":
+        filtered_pets = [p for p in filtered_pets if p.species == filter_name]
+
+    for widget in page.pets_container.winfo_children():
+        widget.destroy()
+    pets_grid = ctk.CTkFrame(page.pets_container, fg_color="transparent")
+    pets_grid.pack(fill="both", expand=True)
+    for i in range(4):
+        pets_grid.grid_columnconfigure(i, weight=1)
+    for i, pet in enumerate(filtered_pets):
+        PetCard(pets_grid, pet, page.app).grid(row=i // 4, column=i % 4, padx=15, pady=15, sticky="nsew")
+
+
+def time_toggles(app, label, toggle, rounds):
+    """Print mean and worst latency of a filter click until the UI is drawn"""
+    samples = []
+    for _ in range(rounds):
+        for filter_name in FILTERS:
+            start = time.perf_counter()
+            toggle(filter_name)
+            app.update_idletasks()
+            app.update()
+            samples.append((time.perf_counter() - start) * 1000)
+    print(f"  {label:<28} mean {sum(samples) / len(samples):8.1f} ms   worst {max(samples):8.1f} ms")
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pets', type=int, default=240, help='catalog size')
+    parser.add_argument('--rounds', type=int, default=5, help='passes over the filters')
+    args = parser.parse_args()
+
+    # Keep the app's users and bookings away from the real data directory
+    data_dir = tempfile.TemporaryDirectory()
+    app_state.set_data_dir(data_dir.name)
+
+    try:
+        from main import OnlyPetsApp
+        app = OnlyPetsApp()
+    except tk.TclError as e:
+        print(f"This benchmark needs a display: {e}")
+        return
+
+    grow_catalog(args.pets)
+    app.navigate_to("adoption")
+    app.update()
+    page = app.current_page
+
+    print(f"{args.pets} pets, {args.rounds} passes over {FILTERS}")
+    time_toggles(app, "rebuild every card (before)", lambda f: legacy_display(page, f), args.rounds)
+
+    # Start the pooled run from a fresh page so the legacy grid is gone
+    app.navigate_to("home")
+    app.clear_page_cache()
+    app.navigate_to("adoption")
+    app.update()
+    page = app.current_page
+    time_toggles(app, "pooled cards (after)", page._set_filter, args.rounds)
+    stats = page.pets_grid.stats
+    print(f"  cards created {stats['created']}, rebound {stats['reused']}")
+
+    app.destroy()
+
+
+if __name__ == "__main__":
+    main()
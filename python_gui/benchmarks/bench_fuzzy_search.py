@@ -0,0 +1,50 @@
+"""
+Benchmark: typo-tolerant ranked pet search latency at catalog scale
+
+Usage:
+    python benchmarks/bench_fuzzy_search.py [--pets 100000] [--reps 20] [--budget-ms 25]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_search_index import make_pets
+from models.search_index import SearchIndex
+
+QUERIES = ['retreiver', 'siamees', 'golden retreiver', 'germn shepherd', 'parakete', 'hamstr',
+           'retriever', 'cat calm', 'bamilu', 'zzzz']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pets', type=int, default=100_000)
+    parser.add_argument('--reps', type=int, default=20, help='repetitions per query')
+    parser.add_argument('--budget-ms', type=float, default=25.0, help='ranked search time budget')
+    args = parser.parse_args()
+
+    pets = make_pets(args.pets, random.Random(3))
+    index = SearchIndex()
+    start = time.perf_counter()
+    index.build(pets)
+    print(f"Built index over {args.pets:,} pets in {time.perf_counter() - start:.2f}s")
+
+    print(f"\n  {'query':<20} {'exact':>7} {'ranked':>7} {'mean ms':>8} {'worst ms':>9}  top match")
+    for query in QUERIES:
+        samples = []
+        for _ in range(args.reps):
+            start = time.perf_counter()
+            ids = index.ranked_search(query, budget_ms=args.budget_ms)
+            samples.append((time.perf_counter() - start) * 1000)
+        exact = len(index.search(query))
+        top = f"{pets[ids[0]].name} ({pets[ids[0]].breed})" if ids else "-"
+        print(f"  {query!r:<20} {exact:>7,} {len(ids):>7,} {sum(samples) / len(samples):8.2f} "
+              f"{max(samples):9.2f}  {top}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: Adoption -> Pet Details -> back, rebuilding pages vs showing cached pages
+
+Needs a display (run under Xvfb on headless machines).
+
+Usage:
+    python benchmarks/bench_navigation.py [--pets 240] [--rounds 10]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_filter_toggle import grow_catalog
+from models.app_state import app_state
+
+
+def time_round_trips(app, label, rounds, before_back=None):
+    """Print mean and worst latency of going back to the adoption page until it is drawn"""
+    samples = []
+    for i in range(rounds):
+        app.navigate_to("pet_details", pet_id=app_state.pets[i % len(app_state.pets)].id)
+        app.update()
+        if before_back:
+            before_back()
+        start = time.perf_counter()
+        app.go_back()
+        app.update_idletasks()
+        app.update()
+        samples.append((time.perf_counter() - start) * 1000)
+    print(f"  {label:<28} mean {sum(samples) / len(samples):8.1f} ms   worst {max(samples):8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pets', type=int, default=240, help='catalog size')
+    parser.add_argument('--rounds', type=int, default=10, help='round trips to time')
+    args = parser.parse_args()
+
+    # Keep the app's users and bookings away from the real data directory
+    data_dir = tempfile.TemporaryDirectory()
+    app_state.set_data_dir(data_dir.name)
+
+    try:
+        from main import OnlyPetsApp
+        app = OnlyPetsApp()
+    except tk.TclError as e:
+        print(f"This benchmark needs a display: {e}")
+        return
+
+    grow_catalog(args.pets)
+    app.navigate_to("adoption")
+    app.update()
+
+    print(f"{args.pets} pets, {args.rounds} round trips")
+    time_round_trips(app, "rebuild on back (before)", args.rounds, before_back=app.clear_page_cache)
+    time_round_trips(app, "cached page (after)", args.rounds)
+    stats = app.page_cache_stats
+    print(f"  page cache: {stats['hits']} hits, {stats['misses']} built, {stats['evictions']} evicted")
+
+    app.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark: pet search index vs a linear scan of the catalog
+
+Usage:
+    python benchmarks/bench_search_index.py [--pets 100000] [--reps 200]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.search_index import SearchIndex, mask_to_ids
+from models.types import Pet
+
+SPECIES_BREEDS = {
+    'Dog': ['Golden Retriever', 'German Shepherd', 'Beagle', 'Bulldog', 'Poodle', 'Labrador', 'Husky', 'Corgi'],
+    'Cat': ['Siamese', 'Persian', 'Tabby', 'Maine Coon', 'Bengal', 'Sphynx', 'Ragdoll'],
+    'Bird': ['Canary', 'Cockatiel', 'Parakeet', 'Lovebird', 'Finch'],
+    'Other': ['Rabbit', 'Hamster', 'Guinea Pig', 'Turtle'],
+}
+SYLLABLES = ['ba', 'bu', 'ch', 'co', 'da', 'is', 'lu', 'ma', 'mi', 'na', 'ro', 'sha', 'te', 'wi', 'zo', 'ky']
+FACTS = ['Loves water and swimming', 'House trained', 'Knows basic commands', 'Great with children',
+         'Indoor only', 'Needs daily exercise', 'Very calm', 'Playful and curious', 'Hypoallergenic',
+         'Requires regular grooming', 'Good with other dogs', 'Low maintenance', 'Very talkative']
+WORDS = ['friendly', 'energetic', 'loyal', 'gentle', 'curious', 'affectionate', 'playful', 'quiet',
+         'smart', 'cuddly', 'independent', 'social', 'protective', 'patient', 'adventurous', 'shy']
+
+# Cards a first screen of the adoption grid reads
+PAGE_SIZE = 40
+
+QUERIES = ['b', 'ret', 'retriever', 'golden ret', 'maine', 'bamilu', 'swim', 'hypo', 'cat calm', 'zzz']
+
+
+def make_pets(count, rng):
+    """Generate a varied synthetic catalog"""
+    pets = []
+    for i in range(count):
+        species = rng.choice(list(SPECIES_BREEDS))
+        name = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+        pets.append(Pet(
+            id=f'pet_{i}', name=name, species=species, breed=rng.choice(SPECIES_BREEDS[species]),
+            age=rng.randint(1, 15),
+            description=' '.join(rng.choice(WORDS) for _ in range(12)) + '.',
+            quick_facts=rng.sample(FACTS, 4), image_urls=[]
+        ))
+    return pets
+
+
+def linear_search(pets, query):
+    """The adoption page's previous substring scan"""
+    query = query.lower().strip()
+    return [
+        i for i, p in enumerate(pets)
+        if query in p.name.lower() or query in p.species.lower() or query in p.breed.lower()
+    ]
+
+
+def timed(reps, fn):
+    """Return (result, microseconds per call)"""
+    start = time.perf_counter()
+    for _ in range(reps):
+        result = fn()
+    return result, (time.perf_counter() - start) * 1e6 / reps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pets', type=int, default=100_000)
+    parser.add_argument('--reps', type=int, default=200, help='repetitions per query')
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    pets = make_pets(args.pets, rng)
+
+    index = SearchIndex()
+    start = time.perf_counter()
+    index.build(pets)
+    print(f"Built index over {args.pets:,} pets in {time.perf_counter() - start:.2f}s")
+
+    extra = make_pets(100, rng)
+    start = time.perf_counter()
+    for pet in extra:
+        index.add(pet)
+    print(f"Incremental add: {(time.perf_counter() - start) * 1e6 / len(extra):.0f} us/pet")
+    pets += extra
+
+    # The grid reads only the rows on screen, so a first page is what a search costs the app
+    print(f"\n  {'query':<14} {'matches':>8} {'index mask us':>14} {'first page us':>14} "
+          f"{'all ids us':>11} {'linear scan us':>15}")
+    for query in QUERIES:
+        mask, mask_us = timed(args.reps, lambda: index.query_mask(query))
+        ids, page_us = timed(args.reps, lambda: index.search(query)[:PAGE_SIZE])
+        _, all_us = timed(max(args.reps // 10, 1), lambda: mask_to_ids(index.query_mask(query)))
+        _, linear_us = timed(2, lambda: linear_search(pets, query))
+        print(f"  {query!r:<14} {mask.bit_count():>8,} {mask_us:14.1f} {page_us:14.1f} "
+              f"{all_us:11.1f} {linear_us:15.0f}")
+
+if __name__ == "__main__":
+    main()
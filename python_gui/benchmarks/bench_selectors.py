@@ -0,0 +1,121 @@
+"""
+Benchmark: memoized AppState selectors vs the inline computations views used to run
+
+Usage:
+    python benchmarks/bench_selectors.py [--sizes 100 10000 100000] [--reads 200]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.app_state import AppState
+from models.types import CartItem, Pet, Service
+
+
+def inline_cart_count(state):
+    return sum(item.quantity for item in state.cart)
+
+
+def inline_cart_totals(state):
+    subtotal = sum(item.price * item.quantity for item in state.cart)
+    taxes = subtotal * 0.1
+    return subtotal, taxes, subtotal + taxes
+
+
+def inline_wishlist_by_kind(state):
+    pets = [item for item in state.wishlist if isinstance(item, Pet)]
+    services = [item for item in state.wishlist if isinstance(item, Service)]
+    return pets, services
+
+
+def inline_pets_filtered(state, species, query):
+    pets = state.pets
+    if species != 'All':
+        pets = [p for p in pets if p.species == species]
+    if query:
+        pets = [
+            p for p in pets
+            if query in p.name.lower() or query in p.species.lower() or query in p.breed.lower()
+        ]
+    return pets
+
+
+def make_state(size, rng, data_dir):
+    """Build an AppState with size cart items, wishlist entries and pets, storing its data in data_dir"""
+    state = AppState()
+    state.set_data_dir(data_dir)
+    state.load()
+    state.cart = [
+        CartItem(id=f'product_{i}', name=f'Product {i}', price=rng.uniform(50, 2000),
+                 image='', quantity=rng.randint(1, 5))
+        for i in range(size)
+    ]
+    template_pets = list(state.pets)
+    state.set_pets([
+        Pet(id=f'pet_{i}', name=f'{p.name}{i}', species=p.species, breed=p.breed, age=p.age,
+            description=p.description, quick_facts=p.quick_facts, image_urls=p.image_urls)
+        for i, p in ((i, template_pets[i % len(template_pets)]) for i in range(size))
+    ])
+    state.wishlist = [
+        state.pets[i] if i % 3 else state.services[i % len(state.services)]
+        for i in range(size)
+    ]
+    state.notify_change()
+    return state
+
+
+def measure(reads, fn):
+    """Return microseconds per call of fn over reads calls"""
+    start = time.perf_counter()
+    for _ in range(reads):
+        fn()
+    return (time.perf_counter() - start) * 1e6 / reads
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 10_000, 100_000])
+    parser.add_argument('--reads', type=int, default=200, help='reads per measurement')
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    for size in args.sizes:
+        # Never open or migrate the real user data
+        data_dir = tempfile.TemporaryDirectory()
+        state = make_state(size, rng, data_dir.name)
+        cases = [
+            ('cart_count', 'cart', lambda: inline_cart_count(state), state.cart_count),
+            ('cart_totals', 'cart', lambda: inline_cart_totals(state), state.cart_totals),
+            ('wishlist_by_kind', 'wishlist', lambda: inline_wishlist_by_kind(state),
+             state.wishlist_by_kind),
+            ('pets_filtered(Dog, "re")', 'pets', lambda: inline_pets_filtered(state, 'Dog', 're'),
+             lambda: state.pets_filtered('Dog', 're')),
+        ]
+
+        print(f"\n{size:,} cart items / wishlist entries / pets")
+        print(f"  {'selector':<26} {'inline us':>12} {'memo hit us':>12} {'after change us':>16} {'speedup':>9}")
+        for label, topic, inline, selector in cases:
+            inline_us = measure(args.reads, inline)
+            selector()
+            hit_us = measure(args.reads, selector)
+
+            # A mutation invalidates the selector, so the next read recomputes
+            def changed_read():
+                state.notify_change(topic)
+                selector()
+            miss_us = measure(max(args.reads // 10, 1), changed_read)
+            print(f"  {label:<26} {inline_us:12.2f} {hit_us:12.2f} {miss_us:16.2f} "
+                  f"{inline_us / max(hit_us, 1e-9):8.0f}x")
+
+        state.user_store.close()
+        state.booking_store.close()
+        data_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: cold-start import time, and time to first paint when a display is available
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5]
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+USERS_JSON = os.path.join(APP_DIR, 'data', 'users.json')
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); import main; "
+    "print((time.perf_counter() - start) * 1000)"
+)
+
+
+def run(args):
+    """Run python with args in the app directory and return its stdout"""
+    result = subprocess.run([sys.executable, *args], cwd=APP_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "failed")
+    return result.stdout
+
+
+def cold_start():
+    """Start the app once against a fresh copy of the data directory and return its output
+
+    Each run migrates users.json, creates the databases and writes thumbnails as a
+    first launch does, and none of it touches the real data directory.
+    """
+    with tempfile.TemporaryDirectory() as data_dir:
+        if os.path.exists(USERS_JSON):
+            shutil.copy(USERS_JSON, data_dir)
+        return run(['main.py', '--startup-json', '-', '--exit-after-startup', '--data-dir', data_dir])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters per measurement')
+    args = parser.parse_args()
+
+    imports = [float(run(['-c', IMPORT_SNIPPET]).strip().splitlines()[-1]) for _ in range(args.runs)]
+    print(f"import main: median {statistics.median(imports):.1f} ms, worst {max(imports):.1f} ms "
+          f"over {args.runs} runs")
+
+    try:
+        outputs = [cold_start() for _ in range(args.runs)]
+    except RuntimeError as e:
+        print(f"Skipping first-paint timing, the app could not start: {e}")
+        return
+
+    # The profile is the JSON line among the app's output
+    profiles = [json.loads(next(line for line in output.splitlines() if line.startswith('{')))
+                for output in outputs]
+    marks, phases = {}, {}
+    for profile in profiles:
+        for mark in profile['marks']:
+            marks.setdefault(mark['name'], []).append(mark['at_ms'])
+        for phase in profile['phases']:
+            if phase['duration_ms'] is not None:
+                key = ("  " * phase['depth']) + phase['name']
+                phases.setdefault(key, []).append(phase['duration_ms'])
+    for name, samples in marks.items():
+        print(f"  {name:<14} median {statistics.median(samples):8.1f} ms since start")
+    for name, samples in phases.items():
+        print(f"  {name:<24} median {statistics.median(samples):8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark: adoption grid image loading from full-size sources vs the thumbnail cache
+
+Usage:
+    python benchmarks/bench_thumbnails.py [--size 300 200] [--rounds 5]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.thumbnail_cache import BASE_DIR, ThumbnailCache, resize_image
+
+
+def grid_sources():
+    """First image of every pet folder, as shown on the adoption grid"""
+    pets_dir = os.path.join(BASE_DIR, 'assets', 'pets')
+    sources = []
+    for folder in sorted(os.listdir(pets_dir)):
+        files = sorted(os.listdir(os.path.join(pets_dir, folder)))
+        if files:
+            sources.append(os.path.join(pets_dir, folder, files[0]))
+    return sources
+
+
+def time_grid(label, sources, load, rounds):
+    """Print the mean time to load every grid image once"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for source in sources:
+            load(source)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / rounds
+    print(f"  {label:<32} {elapsed_ms:9.1f} ms/grid  ({elapsed_ms / len(sources):.2f} ms/image)")
+    return elapsed_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, nargs=2, default=[300, 200])
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+    size = tuple(args.size)
+
+    sources = grid_sources()
+    print(f"{len(sources)} grid images at {size[0]}x{size[1]}")
+    with tempfile.TemporaryDirectory() as tmp:
+        full = time_grid('decode + LANCZOS (no cache)', sources,
+                         lambda s: resize_image(s, size), args.rounds)
+
+        for validate in ('stat', 'hash'):
+            cache = ThumbnailCache(os.path.join(tmp, validate), validate=validate)
+            time_grid(f'first run, building ({validate})', sources,
+                      lambda s: cache.load(s, size), 1)
+            warm = time_grid(f'thumbnail hit ({validate})', sources,
+                             lambda s: cache.load(s, size), args.rounds)
+            print(f"  {'speedup':<32} {full / max(warm, 1e-9):9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
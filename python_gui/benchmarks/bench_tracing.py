@@ -0,0 +1,57 @@
+"""
+Benchmark: per-call cost of tracing spans when tracing is off and when it is recording
+
+Usage:
+    python benchmarks/bench_tracing.py [--calls 1000000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.tracing import span, traced, tracer
+
+
+def plain():
+    pass
+
+
+@traced()
+def decorated():
+    pass
+
+
+def with_span():
+    with span("bench", page="home"):
+        pass
+
+
+def per_call_ns(func, calls: int) -> float:
+    """Average nanoseconds per call of func"""
+    start = time.perf_counter_ns()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter_ns() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=1_000_000, help='calls per measurement')
+    args = parser.parse_args()
+
+    baseline = per_call_ns(plain, args.calls)
+    print(f"plain call:                {baseline:7.0f} ns")
+    for enabled in (False, True):
+        if enabled:
+            tracer.start()
+        label = "recording" if enabled else "off"
+        print(f"@traced, tracing {label:<9} {per_call_ns(decorated, args.calls) - baseline:+7.0f} ns")
+        print(f"span(), tracing {label:<10} {per_call_ns(with_span, args.calls) - baseline:+7.0f} ns")
+        tracer.clear()
+    tracer.stop()
+
+
+if __name__ == "__main__":
+    main()
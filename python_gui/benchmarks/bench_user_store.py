@@ -0,0 +1,102 @@
+"""
+Benchmark: JSON vs SQLite user store for the auth actions used by AppState
+
+Usage:
+    python benchmarks/bench_user_store.py [--sizes 1000 100000] [--ops 20]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.types import User
+from models.user_store import JsonUserStore, SqliteUserStore
+
+
+def make_users(count):
+    """Generate user records in the users.json layout"""
+    return [
+        {
+            'id': str(1700000000 + i),
+            'email': f'user{i}@example.com',
+            'username': f'user{i}',
+            'profile_picture': 'assets/default_profile.png',
+            'password': f'secret{i}',
+            'is_current': i == count - 1
+        }
+        for i in range(count)
+    ]
+
+
+def time_ops(label, count, fn):
+    """Run fn count times and return milliseconds per call"""
+    start = time.perf_counter()
+    for i in range(count):
+        fn(i)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / count
+    print(f"    {label:<28} {elapsed_ms:10.3f} ms/op")
+    return elapsed_ms
+
+
+def run_backend(name, store, size, ops):
+    """Time login, signup lookup, profile save and logout against one backend"""
+    print(f"  {name}")
+    step = max(size // ops, 1)
+
+    def login(i):
+        idx = (i * step) % size
+        user = store.find_by_credentials(f'user{idx}@example.com', f'secret{idx}')
+        store.save(user)
+
+    def signup_check(i):
+        store.find_by_email(f'new{i}@example.com')
+
+    def signup(i):
+        store.save(User(id=f'new-{i}', email=f'new{i}@example.com', username=f'new{i}',
+                        profile_picture='assets/default_profile.png', password='pw'))
+
+    def logout(i):
+        store.clear_current()
+
+    results = {
+        'startup': time_ops('startup (get_current)', ops, lambda i: store.get_current()),
+        'login': time_ops('login', ops, login),
+        'signup_check': time_ops('signup email check', ops, signup_check),
+        'signup': time_ops('signup save', ops, signup),
+        'logout': time_ops('logout', ops, logout),
+    }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000])
+    parser.add_argument('--ops', type=int, default=20, help='operations per measurement')
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        print(f"\n{size:,} users")
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = os.path.join(tmp, 'users.json')
+            with open(json_path, 'w') as f:
+                json.dump(make_users(size), f, indent=2)
+
+            start = time.perf_counter()
+            sqlite_store = SqliteUserStore(os.path.join(tmp, 'users.db'), legacy_json_path=json_path)
+            print(f"  one-time migration: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+            json_results = run_backend('json', JsonUserStore(json_path), size, args.ops)
+            sqlite_results = run_backend('sqlite', sqlite_store, size, args.ops)
+            sqlite_store.close()
+
+            print("  speedup")
+            for op, json_ms in json_results.items():
+                print(f"    {op:<28} {json_ms / max(sqlite_results[op], 1e-9):10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
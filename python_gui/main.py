@@ -1,29 +1,57 @@
-import customtkinter as ctk
-import tkinter as tk
-from tkinter import font as tkfont
 import os
 import sys
 
 # Add the project root to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Imported first so the startup clock covers every other import
+from utils.startup import startup_timer
+
+import argparse
+import customtkinter as ctk
+import importlib
+import tkinter as tk
+from tkinter import font as tkfont
+from collections import OrderedDict
+
 from models.app_state import app_state
 from utils.colors import *
+from utils.background import decode_executor, search_executor
+from utils.image_cache import image_cache
+from utils.latency_monitor import latency_monitor, monitor_enabled
+from utils.leak_detector import DEFAULT_CYCLES, leak_cycles, leak_detector
+from utils.thumbnail_cache import thumbnail_cache
+from utils.tracing import span, traced, tracer
+from utils.prewarm import IdleScheduler, page_images, prewarm_pages
 from views.header import Header
-from views.home_page import HomePage
-from views.adoption_page import AdoptionPage
-from views.pet_details_page import PetDetailsPage
-from views.services_page import ServicesPage
-from views.products_page import ProductsPage
-from views.contact_page import ContactPage
-from views.wishlist_page import WishlistPage
-from views.cart_page import CartPage
-from views.booking_page import BookingPage
-from views.manage_bookings_page import ManageBookingsPage
-from views.auth_modal import AuthModal
-from views.profile_modal import ProfileModal
 from views.toast_container import ToastContainer
 
+startup_timer.mark("imports")
+
+# Page name -> (module, class); page modules are imported on first visit
+PAGE_VIEWS = {
+    "home": ("views.home_page", "HomePage"),
+    "adoption": ("views.adoption_page", "AdoptionPage"),
+    "pet_details": ("views.pet_details_page", "PetDetailsPage"),
+    "services": ("views.services_page", "ServicesPage"),
+    "products": ("views.products_page", "ProductsPage"),
+    "contact": ("views.contact_page", "ContactPage"),
+    "wishlist": ("views.wishlist_page", "WishlistPage"),
+    "cart": ("views.cart_page", "CartPage"),
+    "booking": ("views.booking_page", "BookingPage"),
+    "manage_bookings": ("views.manage_bookings_page", "ManageBookingsPage"),
+}
+
+# Hidden pages kept alive so going back shows them instead of rebuilding them
+PAGE_CACHE_SIZE = 6
+
+# Navigation history entries kept for back/forward
+HISTORY_LIMIT = 50
+
+def load_view(module_name: str, class_name: str):
+    """Import a view class on first use"""
+    return getattr(importlib.import_module(module_name), class_name)
+
 class OnlyPetsApp(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -52,6 +80,11 @@ class OnlyPetsApp(ctk.CTk):
         
         # Configure main window colors
         self.configure(fg_color=BG_PRIMARY)
+        startup_timer.mark("window")
+        
+        # Users, bookings and the catalog load once the window exists
+        app_state.load()
+        startup_timer.mark("state")
         
         # Current page tracking
         self.current_page = None
@@ -60,17 +93,44 @@ class OnlyPetsApp(ctk.CTk):
         self.current_booking_type = None
         self.current_booking_id = None
         
+        # Hidden pages by (page_name, pet_id, booking_type, booking_id), least recently shown first.
+        # Each entry also keeps the page's scroll position and state versions when it was hidden.
+        self._current_key = None
+        self._page_cache = OrderedDict()
+        self._unfinished_pages = {}  # key -> build_steps() of a pre-built page still being built
+        self.page_cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'refreshes': 0, 'prebuilt': 0}
+        self._history = []
+        self._history_index = -1
+        
+        # Background image decodes and searches are delivered through this window's event loop
+        decode_executor.attach(self)
+        search_executor.attach(self)
+        
         # Setup UI
         self._create_widgets()
+        startup_timer.mark("widgets")
         
-        # Register state change callback
-        app_state.on_state_change = self._on_state_change
+        # Subscribe to state changes, coalesced into one dispatch per idle turn.
+        # The header and toast container subscribe to their own slices.
+        app_state.dispatcher = self.after_idle
+        app_state.subscribe(self._update_modals, 'modals')
+        app_state.subscribe(self._refresh_current_page)
         
         # Configure window close protocol
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
         
+        # Browser-style back/forward
+        self.bind("<Alt-Left>", lambda e: self.go_back())
+        self.bind("<Alt-Right>", lambda e: self.go_forward())
+        
         # Show initial page
         self.navigate_to("home")
+        startup_timer.mark("home_page")
+        
+        # Pre-build likely next pages while the user reads the home page
+        self.prewarm = IdleScheduler(self)
+        for page_name in prewarm_pages():
+            self.prewarm.add(f"page:{page_name}", self._prewarm_page(page_name))
         
     def _create_widgets(self):
         """Create main UI components"""
@@ -115,25 +175,41 @@ class OnlyPetsApp(ctk.CTk):
         )
         self.content_scroll.pack(fill="both", expand=True)
         
+        # Notify virtualized views whenever the content scrolls or resizes
+        self._scroll_listeners = []
+        self.content_scroll._parent_canvas.configure(yscrollcommand=self._on_content_scroll)
+        
         # Modal containers (will be shown/hidden)
         self.auth_modal = None
         self.profile_modal = None
         self.toast_container = ToastContainer(self)
     
-    def _on_state_change(self):
-        """Handle state changes"""
-        # Update header
-        if hasattr(self, 'header'):
-            self.header.update_display()
-        
-        # Update toast container
-        if hasattr(self, 'toast_container'):
-            self.toast_container.update_toasts()
+    def _on_content_scroll(self, first, last):
+        """Update the scrollbar and tell scroll listeners the viewport moved"""
+        self.content_scroll._scrollbar.set(first, last)
+        for listener in list(self._scroll_listeners):
+            listener()
+    
+    def add_scroll_listener(self, callback):
+        """Call callback() when the content viewport moves; returns a function that removes it"""
+        self._scroll_listeners.append(callback)
         
+        def remove():
+            if callback in self._scroll_listeners:
+                self._scroll_listeners.remove(callback)
+        return remove
+    
+    def content_viewport(self):
+        """Screen y coordinate and height of the visible content area"""
+        canvas = self.content_scroll._parent_canvas
+        return canvas.winfo_rooty(), canvas.winfo_height()
+    
+    def _update_modals(self, changed):
+        """Show or hide modals to match state"""
         # Show/hide auth modal
         if app_state.is_auth_modal_open:
             if not self.auth_modal or not self.auth_modal.winfo_exists():
-                self.auth_modal = AuthModal(self, self)
+                self.auth_modal = load_view("views.auth_modal", "AuthModal")(self, self)
         elif self.auth_modal and self.auth_modal.winfo_exists():
             self.auth_modal.destroy()
             self.auth_modal = None
@@ -141,61 +217,238 @@ class OnlyPetsApp(ctk.CTk):
         # Show/hide profile modal
         if app_state.is_profile_modal_open:
             if not self.profile_modal or not self.profile_modal.winfo_exists():
-                self.profile_modal = ProfileModal(self, self)
+                self.profile_modal = load_view("views.profile_modal", "ProfileModal")(self, self)
         elif self.profile_modal and self.profile_modal.winfo_exists():
             self.profile_modal.destroy()
             self.profile_modal = None
-        
-        # Refresh current page if needed
-        if self.current_page and hasattr(self.current_page, 'refresh'):
+    
+    def _refresh_current_page(self, changed):
+        """Refresh the current page if it reads any of the changed slices"""
+        page_topics = getattr(self.current_page, 'state_topics', ())
+        if self.current_page and hasattr(self.current_page, 'refresh') and changed.intersection(page_topics):
             self.current_page.refresh()
     
     def navigate_to(self, page_name: str, pet_id: str = None, booking_type: str = None, booking_id: str = None):
-        """Navigate to a different page"""
-        # Clear current page
-        if self.current_page:
-            self.current_page.destroy()
+        """Navigate to a different page, recording it in the history"""
+        key = (page_name, pet_id, booking_type, booking_id)
+        if key == self._current_key and self.current_page:
+            return
+        
+        with span("navigate_to", category="navigation", page=page_name):
+            # A new destination drops the forward history
+            del self._history[self._history_index + 1:]
+            self._history.append(key)
+            del self._history[:-HISTORY_LIMIT]
+            self._history_index = len(self._history) - 1
+            self._show_page(key)
+    
+    def go_back(self):
+        """Show the previous page in the history"""
+        if self._history_index > 0:
+            self._history_index -= 1
+            self._show_page(self._history[self._history_index])
+    
+    def go_forward(self):
+        """Show the next page in the history"""
+        if self._history_index < len(self._history) - 1:
+            self._history_index += 1
+            self._show_page(self._history[self._history_index])
+    
+    @traced("show_page", category="navigation")
+    def _show_page(self, key):
+        """Show the page for key, reusing its cached instance when there is one"""
+        self._hide_current_page()
         
         # Store navigation params
-        self.current_page_name = page_name
-        self.current_pet_id = pet_id
-        self.current_booking_type = booking_type
-        self.current_booking_id = booking_id
-        
-        # Reset scroll position
-        self.content_scroll._parent_canvas.yview_moveto(0)
-        
-        # Create new page
-        if page_name == "home":
-            self.current_page = HomePage(self.content_scroll, self)
-        elif page_name == "adoption":
-            self.current_page = AdoptionPage(self.content_scroll, self)
-        elif page_name == "pet_details":
-            self.current_page = PetDetailsPage(self.content_scroll, self, pet_id)
-        elif page_name == "services":
-            self.current_page = ServicesPage(self.content_scroll, self)
-        elif page_name == "products":
-            self.current_page = ProductsPage(self.content_scroll, self)
-        elif page_name == "contact":
-            self.current_page = ContactPage(self.content_scroll, self)
-        elif page_name == "wishlist":
-            self.current_page = WishlistPage(self.content_scroll, self)
-        elif page_name == "cart":
-            self.current_page = CartPage(self.content_scroll, self)
-        elif page_name == "booking":
-            self.current_page = BookingPage(self.content_scroll, self, booking_type, booking_id)
-        elif page_name == "manage_bookings":
-            self.current_page = ManageBookingsPage(self.content_scroll, self)
-        
-        if self.current_page:
-            self.current_page.pack(fill="both", expand=True)
+        self.current_page_name, self.current_pet_id, self.current_booking_type, self.current_booking_id = key
+        self._current_key = key
+        
+        canvas = self.content_scroll._parent_canvas
+        cached = self._page_cache.pop(key, None)
+        if cached:
+            self.page_cache_stats['hits'] += 1
+            page, scroll, versions = cached
+            self.current_page = page
+            steps = self._unfinished_pages.pop(key, None)
+            if steps:
+                # Shown before pre-warming finished building it
+                for _ in steps:
+                    pass
+            page.pack(fill="both", expand=True)
+            
+            # Catch up on state that changed while the page was hidden
+            topics = getattr(page, 'state_topics', ())
+            if hasattr(page, 'refresh') and app_state.topic_versions(topics) != versions:
+                self.page_cache_stats['refreshes'] += 1
+                page.refresh()
+            
+            # Lay the page out now so the saved position maps onto its own scroll region
+            self.update_idletasks()
+            canvas.configure(scrollregion=canvas.bbox("all"))
+            canvas.yview_moveto(scroll)
+            
+            # Grids stop building while their page is hidden
+            for grid in self._page_grids(page):
+                grid.resume()
+        else:
+            self.page_cache_stats['misses'] += 1
+            canvas.yview_moveto(0)
+            self.current_page = self._create_page(key)
+            if self.current_page:
+                self.current_page.pack(fill="both", expand=True)
         
         # Update header to reflect active page
         if hasattr(self, 'header'):
             self.header.update_display()
+        
+        leak_detector.navigated(key[0])
+    
+    def _create_page(self, key):
+        """Build a new page instance, importing its module on first use"""
+        page_name, pet_id, booking_type, booking_id = key
+        if page_name not in PAGE_VIEWS:
+            return None
+        
+        # While startup is profiled each page records its import and constructor time
+        with startup_timer.phase(f"page:{page_name}"):
+            with startup_timer.phase("import"):
+                page_class = load_view(*PAGE_VIEWS[page_name])
+            with startup_timer.phase("construct"):
+                if page_name == "pet_details":
+                    return page_class(self.content_scroll, self, pet_id)
+                elif page_name == "booking":
+                    return page_class(self.content_scroll, self, booking_type, booking_id)
+                return page_class(self.content_scroll, self)
+    
+    def _hide_current_page(self):
+        """Hide the current page in the page cache, or destroy it if it can't be cached"""
+        page = self.current_page
+        self.current_page = None
+        if not page or not page.winfo_exists():
+            return
+        if not getattr(page, 'cacheable', True):
+            page.destroy()
+            return
+        
+        scroll = self.content_scroll._parent_canvas.yview()[0]
+        versions = app_state.topic_versions(getattr(page, 'state_topics', ()))
+        page.pack_forget()
+        self._page_cache[self._current_key] = (page, scroll, versions)
+        while len(self._page_cache) > PAGE_CACHE_SIZE:
+            evicted_key, (evicted, _, _) = self._page_cache.popitem(last=False)
+            self._unfinished_pages.pop(evicted_key, None)
+            self.page_cache_stats['evictions'] += 1
+            evicted.destroy()
+    
+    def prebuild_page(self, page_name: str):
+        """Start building a page ahead of time into the page cache; None if it exists already or there is no room
+        
+        A page with build_steps() is only started here; _prewarm_page builds the rest
+        of it a section per step, or _show_page finishes it if it is shown first.
+        """
+        key = (page_name, None, None, None)
+        if key == self._current_key or key in self._page_cache or len(self._page_cache) >= PAGE_CACHE_SIZE:
+            return None
+        if page_name not in PAGE_VIEWS:
+            return None
+        
+        page_class = load_view(*PAGE_VIEWS[page_name])
+        if not getattr(page_class, 'cacheable', True):
+            return None
+        if hasattr(page_class, 'build_steps'):
+            page = page_class(self.content_scroll, self, staged=True)
+            self._unfinished_pages[key] = page.build_steps()
+        else:
+            page = self._create_page(key)
+        
+        # Speculative pages are the first to go when a visited page needs the room
+        self._page_cache[key] = (page, 0.0, app_state.topic_versions(getattr(page, 'state_topics', ())))
+        self._page_cache.move_to_end(key, last=False)
+        self.page_cache_stats['prebuilt'] += 1
+        return page
+    
+    def _prewarm_page(self, page_name):
+        """Pre-warm job: queue a page's first images for decoding, then build the page and its cells
+        
+        Each step is one image, the view import, one section of the page or one card,
+        so no step should run much past the scheduler's tick budget. Pages without
+        build_steps() are still constructed in a single step.
+        """
+        for path, size in page_images(page_name):
+            image_cache.prefetch(path, size)
+            yield
+        if page_name in PAGE_VIEWS:
+            load_view(*PAGE_VIEWS[page_name])
+            yield
+        
+        page = self.prebuild_page(page_name)
+        if page is None:
+            return
+        key = (page_name, None, None, None)
+        steps = self._unfinished_pages.get(key)
+        if steps:
+            for _ in steps:
+                yield
+                if not page.winfo_exists():
+                    return  # Evicted, or closed
+            self._unfinished_pages.pop(key, None)
+        yield from self._prebuild_cells(page)
+    
+    def _prebuild_cells(self, page):
+        """Pre-warm steps filling in the grids on a hidden page, one cell per step"""
+        for grid in self._page_grids(page):
+            while not grid.prebuild():
+                yield
+                if not page.winfo_exists():
+                    return  # Evicted, or closed
+    
+    @staticmethod
+    def _page_grids(page):
+        """Progressive and virtual grids on a page, found by their prebuild() method"""
+        grids = []
+        pending = [page]
+        while pending:
+            widget = pending.pop()
+            if hasattr(widget, 'prebuild'):
+                grids.append(widget)
+            else:
+                pending.extend(widget.winfo_children())
+        return grids
+    
+    def clear_page_cache(self):
+        """Destroy every hidden page so the next visit builds it fresh"""
+        self._unfinished_pages.clear()
+        while self._page_cache:
+            _, (page, _, _) = self._page_cache.popitem()
+            page.destroy()
     
     def _on_closing(self):
         """Handle window close event"""
+        stats = app_state.notify_stats
+        print(f"State notifications: {stats['requested']} requested, "
+              f"{stats['dispatched']} dispatched, {app_state.coalesced_notifications} coalesced")
+        print(image_cache.summary())
+        print(thumbnail_cache.summary())
+        print(decode_executor.summary())
+        stats = self.page_cache_stats
+        print(f"Page cache: {stats['hits']} hits, {stats['misses']} built, {stats['prebuilt']} pre-built, "
+              f"{stats['evictions']} evicted, {stats['refreshes']} refreshed on show")
+        print(self.prewarm.summary())
+        self.prewarm.stop()
+        if latency_monitor.running:
+            print(latency_monitor.summary())
+            latency_monitor.dump()
+            latency_monitor.stop()
+        if leak_detector.running:
+            print(leak_detector.report())
+            leak_detector.stop()
+        if tracer.enabled:
+            tracer.stop()
+            path = tracer.write()
+            if path:
+                print(f"Trace with {len(tracer)} spans written to {path}")
+        decode_executor.shutdown()
+        search_executor.shutdown()
         try:
             # Clean up any resources if needed
             self.quit()  # Stop the mainloop
@@ -208,6 +461,28 @@ class OnlyPetsApp(ctk.CTk):
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="OnlyPets - Pet Adoption & Services")
+    parser.add_argument('--startup-report', action='store_true',
+                        help='print startup milestones and the phase breakdown up to the first paint')
+    parser.add_argument('--startup-json', metavar='PATH',
+                        help="append the startup timings to PATH as one JSON line ('-' for stdout)")
+    parser.add_argument('--exit-after-startup', action='store_true',
+                        help='quit once the first frame is painted (for timing runs)')
+    parser.add_argument('--trace', metavar='PATH',
+                        help='record tracing spans and write them to PATH as Chrome trace-event JSON on exit '
+                             '(also ONLYPETS_TRACE=PATH)')
+    parser.add_argument('--latency-monitor', action='store_true',
+                        help='report slow Tk callbacks and keep event-loop lag histograms '
+                             '(also ONLYPETS_LATENCY_MONITOR=1)')
+    parser.add_argument('--leak-check', metavar='N', type=int, nargs='?', const=DEFAULT_CYCLES,
+                        help='count widgets, images, after() callbacks and Python memory after each navigation '
+                             f'and flag growth over N visits to a page (default {DEFAULT_CYCLES}; '
+                             'also ONLYPETS_LEAK_CHECK=N; 0 turns it off)')
+    parser.add_argument('--data-dir', metavar='PATH',
+                        help='keep users, bookings and thumbnails under PATH instead of data/ '
+                             '(also ONLYPETS_DATA_DIR=PATH)')
+    args = parser.parse_args()
+    
     # Check for assets directory
     assets_dir = os.path.join(os.path.dirname(__file__), 'assets')
     if not os.path.exists(assets_dir):
@@ -217,7 +492,36 @@ def main():
         os.makedirs(os.path.join(assets_dir, 'products'), exist_ok=True)
         print("Assets directories created. Please add images to the 'assets' folder.")
     
+    if args.trace:
+        tracer.start(args.trace)
+    
+    # The state loads when the window is built, so the data directory is set first
+    data_dir = args.data_dir or os.environ.get('ONLYPETS_DATA_DIR')
+    if data_dir:
+        app_state.set_data_dir(data_dir)
+        thumbnail_cache.cache_dir = os.path.join(data_dir, 'thumbnails')
+    
     app = OnlyPetsApp()
+    if args.latency_monitor or monitor_enabled():
+        # Histograms are dumped on exit and on SIGUSR1
+        latency_monitor.start(app, dump_path=os.path.join(app_state.data_dir, 'latency.json'))
+    cycles = args.leak_check if args.leak_check is not None else leak_cycles()
+    if cycles:
+        leak_detector.start(app, cycles)
+        # The home page was shown before the detector started
+        leak_detector.navigated(app.current_page_name)
+    
+    def on_first_paint():
+        # Idle callbacks queued before this one include the first redraw
+        startup_timer.mark("first_paint")
+        startup_timer.finish()
+        if args.startup_report:
+            print(startup_timer.report())
+        if args.startup_json:
+            startup_timer.write_json(args.startup_json)
+        if args.exit_after_startup:
+            app._on_closing()
+    app.after(0, lambda: app.after_idle(on_first_paint))
     app.mainloop()
 
 if __name__ == "__main__":
@@ -1,11 +1,44 @@
 """
 Central application state manager
 """
-import json
+import calendar
 import os
-from typing import List, Optional, Callable
+from contextlib import contextmanager
+from typing import Dict, FrozenSet, List, Optional, Callable, Sequence, Set, Tuple
 from datetime import datetime, timedelta
-from models.types import Pet, Service, Product, CartItem, Booking, User, Toast, ToastType
+from models.types import Pet, Service, Product, CartItem, Booking, User, Toast, ToastType, TIME_SLOTS
+from models.user_store import SqliteUserStore
+from models.booking_store import BookingStore
+from models.search_index import BitsetIds, SearchIndex
+from models.facets import FacetIndex, Selection, selection_key
+from utils.tracing import traced
+
+# Availability value of a day whose every time slot is booked
+FULLY_BOOKED = (1 << len(TIME_SLOTS)) - 1
+
+# State slices views can subscribe to
+STATE_TOPICS = ('pets', 'cart', 'wishlist', 'bookings', 'toasts', 'auth', 'modals')
+
+TAX_RATE = 0.1
+
+# Memoized selector results kept before the cache is reset
+SELECTOR_CACHE_LIMIT = 256
+
+class PetResults(Sequence):
+    """Pets at the given document ids of a catalog snapshot, looked up as they are read"""
+    
+    def __init__(self, pets: List[Pet], ids: Sequence[int]):
+        self._pets = pets
+        self._ids = ids
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self._pets[doc_id] for doc_id in self._ids[index])
+        return self._pets[self._ids[index]]
+
 
 class AppState:
     def __init__(self):
@@ -14,7 +47,14 @@ class AppState:
         self.services: List[Service] = []
         self.wishlist: List[Pet | Service] = []
         self.cart: List[CartItem] = []
-        self.bookings: List[Booking] = []
+        self.bookings: List[Booking] = []  # upcoming bookings; full history is in booking_store
+        self.search_index = SearchIndex()  # document ids are positions in self.pets
+        self.facet_index = FacetIndex()  # same document ids
+        
+        # Booking indexes, kept in sync by add_booking/cancel_booking
+        self._bookings_by_id: Dict[str, Booking] = {}
+        self._booked_slots: Dict[Tuple[str, str, str], int] = {}  # confirmed bookings per slot
+        self._availability_cache: Dict[Tuple[str, int, int], bytes] = {}  # (service_id, year, month)
         
         # UI State
         self.toasts: List[Toast] = []
@@ -24,67 +64,74 @@ class AppState:
         self.is_auth_modal_open: bool = False
         self.is_profile_modal_open: bool = False
         
-        # Callbacks for UI updates
-        self.on_state_change: Optional[Callable] = None
+        # Subscribers for UI updates: (topics, callback(changed_topics))
+        self._subscribers: List[Tuple[FrozenSet[str], Callable[[FrozenSet[str]], None]]] = []
+        # Schedules a deferred call, e.g. Tk's after_idle; None dispatches synchronously
+        self.dispatcher: Optional[Callable[[Callable], object]] = None
+        self._batch_depth = 0
+        self._pending_topics: Set[str] = set()
+        self._dispatch_scheduled = False
+        self.notify_stats = {'requested': 0, 'dispatched': 0}
+        
+        # Per-topic version counters, bumped by notify_change, invalidate memoized selectors
+        self._versions: Dict[str, int] = dict.fromkeys(STATE_TOPICS, 0)
+        self._selector_cache: Dict[tuple, Tuple[tuple, object]] = {}
         
         # Data file paths
-        self.data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
-        os.makedirs(self.data_dir, exist_ok=True)
+        self.set_data_dir(os.path.join(os.path.dirname(__file__), '..', 'data'))
+        
+        # Stores and data are opened by load(), so importing this module does no file I/O
+        self.user_store: Optional[SqliteUserStore] = None
+        self.booking_store: Optional[BookingStore] = None
+        self.loaded = False
+    
+    def set_data_dir(self, data_dir: str):
+        """Keep users and bookings under data_dir; only takes effect before load()"""
+        self.data_dir = data_dir
         self.users_file = os.path.join(self.data_dir, 'users.json')
+        self.users_db = os.path.join(self.data_dir, 'users.db')
+        self.bookings_db = os.path.join(self.data_dir, 'bookings.db')
+    
+    def load(self):
+        """Open the user and booking stores and load the catalog; later calls do nothing"""
+        if self.loaded:
+            return
+        self.loaded = True
+        os.makedirs(self.data_dir, exist_ok=True)
+        
+        # User accounts live in SQLite; users.json is imported once on first run
+        self.user_store = SqliteUserStore(self.users_db, legacy_json_path=self.users_file)
+        self.booking_store = BookingStore(self.bookings_db)
         
         # Load initial data
         self._load_users()
+        self._load_bookings()
         self._load_sample_data()
     
     def _load_users(self):
-        """Load users from file"""
-        if os.path.exists(self.users_file):
-            try:
-                with open(self.users_file, 'r') as f:
-                    users_data = json.load(f)
-                    # Check for current user
-                    for user_data in users_data:
-                        if user_data.get('is_current'):
-                            self.current_user = User(**{k: v for k, v in user_data.items() if k != 'is_current'})
-                            break
-            except Exception as e:
-                print(f"Error loading users: {e}")
+        """Load the signed-in user from the user store"""
+        try:
+            self.current_user = self.user_store.get_current()
+        except Exception as e:
+            print(f"Error loading users: {e}")
     
     def _save_users(self):
-        """Save users to file"""
+        """Save the current user and mark them as signed in"""
         try:
-            users_data = []
-            if os.path.exists(self.users_file):
-                with open(self.users_file, 'r') as f:
-                    users_data = json.load(f)
-            
-            # Update or add current user
             if self.current_user:
-                user_dict = {
-                    'id': self.current_user.id,
-                    'email': self.current_user.email,
-                    'username': self.current_user.username,
-                    'profile_picture': self.current_user.profile_picture,
-                    'password': self.current_user.password,
-                    'is_current': True
-                }
-                
-                # Remove is_current from all others
-                for user in users_data:
-                    user['is_current'] = False
-                
-                # Update or append
-                existing = next((i for i, u in enumerate(users_data) if u['id'] == self.current_user.id), None)
-                if existing is not None:
-                    users_data[existing] = user_dict
-                else:
-                    users_data.append(user_dict)
-            
-            with open(self.users_file, 'w') as f:
-                json.dump(users_data, f, indent=2)
+                self.user_store.save(self.current_user)
         except Exception as e:
             print(f"Error saving users: {e}")
     
+    def _load_bookings(self):
+        """Load upcoming confirmed bookings into the availability indexes"""
+        try:
+            today = datetime.now().strftime('%Y-%m-%d')
+            for booking in self.booking_store.confirmed_from(today):
+                self._track_booking(booking)
+        except Exception as e:
+            print(f"Error loading bookings: {e}")
+    
     def _load_sample_data(self):
         """Load sample pets and services data"""
         # Sample pets - matching actual asset folder structure
@@ -166,6 +213,8 @@ class AppState:
                 image_urls=image_urls
             )
             self.pets.append(pet)
+        self.search_index.build(self.pets)
+        self.facet_index.build(self.pets)
         
         # Sample services - using actual asset files
         self.services = [
@@ -216,29 +265,191 @@ class AppState:
             )
         ]
         
-        # Add a sample booking for conflict testing
+        # Add a sample booking for conflict testing (kept in memory only)
         today = datetime.now()
         conflict_date = (today + timedelta(days=5)).strftime('%Y-%m-%d')
-        self.bookings.append(Booking(service_id='service_01', date=conflict_date, time_slot='morning'))
+        self._track_booking(Booking(service_id='service_01', date=conflict_date, time_slot='morning'))
+    
+    def subscribe(self, callback: Callable[[FrozenSet[str]], None], *topics: str) -> Callable[[], None]:
+        """Subscribe callback(changed_topics) to topics (all if none); returns an unsubscribe function"""
+        entry = (frozenset(topics or STATE_TOPICS), callback)
+        self._subscribers.append(entry)
+        
+        def unsubscribe():
+            if entry in self._subscribers:
+                self._subscribers.remove(entry)
+        return unsubscribe
+    
+    def notify_change(self, *topics: str):
+        """Notify UI that topics changed (all topics if none given), coalescing repeated calls"""
+        self.notify_stats['requested'] += 1
+        for topic in topics or STATE_TOPICS:
+            self._versions[topic] += 1
+        self._pending_topics.update(topics or STATE_TOPICS)
+        if not self._batch_depth:
+            self._schedule_dispatch()
+    
+    @contextmanager
+    def batch(self):
+        """Group several mutations so the UI is notified once when the block exits"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._pending_topics:
+                self._schedule_dispatch()
+    
+    @property
+    def coalesced_notifications(self) -> int:
+        """Number of notify_change calls folded into another dispatch"""
+        return self.notify_stats['requested'] - self.notify_stats['dispatched']
+    
+    def _schedule_dispatch(self):
+        """Dispatch now, or once per event-loop turn when a dispatcher is set"""
+        if self.dispatcher is None:
+            self._dispatch_change()
+        elif not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            self.dispatcher(self._dispatch_change)
+    
+    @traced(category="state")
+    def _dispatch_change(self):
+        """Deliver pending changes to the subscribers of the changed topics"""
+        self._dispatch_scheduled = False
+        if not self._pending_topics:
+            return
+        changed = frozenset(self._pending_topics)
+        self._pending_topics.clear()
+        self.notify_stats['dispatched'] += 1
+        for topics, callback in list(self._subscribers):
+            if topics & changed:
+                callback(changed)
+    
+    # Pet catalog methods
+    @traced(category="state")
+    def add_pet(self, pet: Pet):
+        """Add a pet to the catalog, the search index and the facet index"""
+        self.pets.append(pet)
+        self.search_index.add(pet)
+        self.facet_index.add(pet)
+        self.notify_change('pets')
+    
+    @traced(category="state")
+    def set_pets(self, pets: List[Pet]):
+        """Replace the pet catalog and rebuild the search and facet indexes"""
+        self.pets = list(pets)
+        self.search_index.build(self.pets)
+        self.facet_index.build(self.pets)
+        self.notify_change('pets')
+    
+    def topic_versions(self, topics) -> Tuple[int, ...]:
+        """Change counters of topics; comparing two snapshots tells whether any changed"""
+        return tuple(self._versions[topic] for topic in topics)
+    
+    # Selectors
+    def _select(self, key: tuple, topics: Tuple[str, ...], compute: Callable[[], object]):
+        """Return compute()'s cached result while none of topics has changed"""
+        version = self.topic_versions(topics)
+        cached = self._selector_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        if len(self._selector_cache) >= SELECTOR_CACHE_LIMIT:
+            self._selector_cache.clear()
+        value = compute()
+        self._selector_cache[key] = (version, value)
+        return value
+    
+    def cart_count(self) -> int:
+        """Total quantity of items in the cart"""
+        return self._select(('cart_count',), ('cart',),
+                            lambda: sum(item.quantity for item in self.cart))
+    
+    def cart_totals(self) -> Tuple[float, float, float]:
+        """Cart subtotal, taxes and total"""
+        def compute():
+            subtotal = sum(item.price * item.quantity for item in self.cart)
+            taxes = subtotal * TAX_RATE
+            return subtotal, taxes, subtotal + taxes
+        return self._select(('cart_totals',), ('cart',), compute)
+    
+    def wishlist_ids(self) -> FrozenSet[str]:
+        """Ids of every wishlisted pet and service"""
+        return self._select(('wishlist_ids',), ('wishlist',),
+                            lambda: frozenset(item.id for item in self.wishlist))
     
-    def notify_change(self):
-        """Notify UI of state changes"""
-        if self.on_state_change:
-            self.on_state_change()
+    def wishlist_by_kind(self) -> Tuple[Tuple[Pet, ...], Tuple[Service, ...]]:
+        """Wishlisted pets and services, in the order they were added"""
+        def compute():
+            pets = tuple(item for item in self.wishlist if isinstance(item, Pet))
+            services = tuple(item for item in self.wishlist if isinstance(item, Service))
+            return pets, services
+        return self._select(('wishlist_by_kind',), ('wishlist',), compute)
+    
+    def pets_filtered(self, species: str = 'All', query: str = '',
+                      facets: Optional[Selection] = None) -> Sequence[Pet]:
+        """Pets of a species ('All' for any) with the selected facets matching query, best matches first"""
+        query = query.lower().strip()
+        selection = self._facet_selection(species, facets)
+        return self._select(('pets_filtered', query, selection_key(selection)), ('pets',),
+                            lambda: self.search_pets(species, query, facets))
+    
+    def facet_counts(self, species: str = 'All', query: str = '',
+                     facets: Optional[Selection] = None) -> Dict[str, Dict[str, int]]:
+        """Pets matching query per facet value, given the other selected facets"""
+        query = query.lower().strip()
+        selection = self._facet_selection(species, facets)
+        return self._select(('facet_counts', query, selection_key(selection)), ('pets',),
+                            lambda: self.count_facets(species, query, facets))
+    
+    @staticmethod
+    def _facet_selection(species: str, facets: Optional[Selection]) -> Dict[str, Tuple[str, ...]]:
+        """Facet selection with the species filter folded in"""
+        selection = {facet: tuple(values) for facet, values in (facets or {}).items() if values}
+        if species != 'All':
+            selection['species'] = (species,)
+        return selection
+    
+    def search_pets(self, species: str = 'All', query: str = '',
+                    facets: Optional[Selection] = None) -> Sequence[Pet]:
+        """Uncached pets_filtered; safe to call from a worker thread"""
+        pets = self.pets
+        selection = self._facet_selection(species, facets)
+        if not query.strip():
+            if not selection:
+                return tuple(pets)
+            # Pets are looked up as the grid reads them, so broad filters cost a popcount
+            return PetResults(pets, BitsetIds(self.facet_index.mask(selection)))
+        
+        within = self.facet_index.mask(selection) if selection else None
+        return tuple(pets[doc_id] for doc_id in self.search_index.ranked_search(query, within))
+    
+    def count_facets(self, species: str = 'All', query: str = '',
+                     facets: Optional[Selection] = None) -> Dict[str, Dict[str, int]]:
+        """Uncached facet_counts; safe to call from a worker thread"""
+        base = None
+        if query.strip():
+            # Every pet search_pets can list for the query, exact and fuzzy, before its page limit
+            base = self.search_index.match_mask(query)
+        return self.facet_index.counts(self._facet_selection(species, facets), base)
     
     # Toast methods
+    @traced(category="state")
     def add_toast(self, message: str, toast_type: ToastType = 'info'):
         """Add a toast notification"""
         toast_id = int(datetime.now().timestamp() * 1000)
         self.toasts.append(Toast(id=toast_id, message=message, type=toast_type))
-        self.notify_change()
+        self.notify_change('toasts')
     
+    @traced(category="state")
     def remove_toast(self, toast_id: int):
         """Remove a toast notification"""
         self.toasts = [t for t in self.toasts if t.id != toast_id]
-        self.notify_change()
+        self.notify_change('toasts')
     
     # Wishlist methods
+    @traced(category="state")
     def toggle_wishlist(self, item: Pet | Service):
         """Add or remove item from wishlist"""
         existing = next((i for i in self.wishlist if i.id == item.id), None)
@@ -246,13 +457,14 @@ class AppState:
             self.wishlist.remove(existing)
         else:
             self.wishlist.append(item)
-        self.notify_change()
+        self.notify_change('wishlist')
     
     def is_in_wishlist(self, item_id: str) -> bool:
         """Check if item is in wishlist"""
-        return any(i.id == item_id for i in self.wishlist)
+        return item_id in self.wishlist_ids()
     
     # Cart methods
+    @traced(category="state")
     def add_to_cart(self, product: Product):
         """Add product to cart"""
         existing = next((item for item in self.cart if item.id == product.id), None)
@@ -266,67 +478,115 @@ class AppState:
                 image=product.image,
                 quantity=1
             ))
-        self.notify_change()
+        self.notify_change('cart')
     
+    @traced(category="state")
     def remove_from_cart(self, product_id: str):
         """Remove product from cart"""
         self.cart = [item for item in self.cart if item.id != product_id]
-        self.notify_change()
+        self.notify_change('cart')
     
+    @traced(category="state")
     def update_cart_quantity(self, product_id: str, new_quantity: int):
         """Update cart item quantity"""
-        if new_quantity <= 0:
-            self.remove_from_cart(product_id)
-        else:
-            for item in self.cart:
-                if item.id == product_id:
-                    item.quantity = new_quantity
-                    break
-        self.notify_change()
+        with self.batch():
+            if new_quantity <= 0:
+                self.remove_from_cart(product_id)
+            else:
+                for item in self.cart:
+                    if item.id == product_id:
+                        item.quantity = new_quantity
+                        break
+            self.notify_change('cart')
     
+    @traced(category="state")
     def clear_cart(self):
         """Clear all items from cart"""
         self.cart.clear()
-        self.notify_change()
+        self.notify_change('cart')
     
     # Booking methods
-    def add_booking(self, booking: Booking):
-        """Add a new booking"""
+    def _track_booking(self, booking: Booking):
+        """Store a booking and add it to the lookup indexes"""
         self.bookings.append(booking)
-        self.notify_change()
+        if booking.id:
+            self._bookings_by_id[booking.id] = booking
+        if booking.status == "confirmed":
+            key = (booking.service_id, booking.date, booking.time_slot)
+            self._booked_slots[key] = self._booked_slots.get(key, 0) + 1
+            self._invalidate_availability(booking)
+    
+    def _release_slot(self, booking: Booking):
+        """Drop a confirmed booking from the slot index"""
+        key = (booking.service_id, booking.date, booking.time_slot)
+        remaining = self._booked_slots.get(key, 0) - 1
+        if remaining > 0:
+            self._booked_slots[key] = remaining
+        else:
+            self._booked_slots.pop(key, None)
+        self._invalidate_availability(booking)
+    
+    def _invalidate_availability(self, booking: Booking):
+        """Forget the cached availability of the month a booking falls in"""
+        try:
+            key = (booking.service_id, int(booking.date[:4]), int(booking.date[5:7]))
+        except ValueError:
+            return
+        self._availability_cache.pop(key, None)
+    
+    @traced(category="state")
+    def add_booking(self, booking: Booking):
+        """Persist a new booking; the store assigns its id"""
+        self.booking_store.add(booking)
+        self._track_booking(booking)
+        self.notify_change('bookings')
     
     def is_slot_booked(self, service_id: str, date: str, time_slot: str) -> bool:
-        """Check if a time slot is already booked"""
-        return any(
-            b.service_id == service_id and b.date == date and b.time_slot == time_slot
-            for b in self.bookings
-        )
+        """Check if a time slot is taken by a confirmed booking"""
+        return (service_id, date, time_slot) in self._booked_slots
+    
+    def get_month_availability(self, service_id: str, year: int, month: int) -> bytes:
+        """Return one byte per day of the month with bit i set when TIME_SLOTS[i] is booked"""
+        # Cached per month until a booking in that month is added or cancelled
+        key = (service_id, year, month)
+        cached = self._availability_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        days_in_month = calendar.monthrange(year, month)[1]
+        availability = bytearray(days_in_month)
+        for day in range(days_in_month):
+            date = f"{year:04d}-{month:02d}-{day + 1:02d}"
+            for bit, slot in enumerate(TIME_SLOTS):
+                if (service_id, date, slot) in self._booked_slots:
+                    availability[day] |= 1 << bit
+        
+        result = bytes(availability)
+        self._availability_cache[key] = result
+        return result
     
     def get_user_bookings(self) -> List[Booking]:
         """Get bookings for the current user"""
         if not self.current_user:
             return []
-        return [b for b in self.bookings if hasattr(b, 'user_id') and b.user_id == self.current_user.id]
+        return self.booking_store.for_user(self.current_user.id)
     
+    @traced(category="state")
     def cancel_booking(self, booking_id: str):
-        """Cancel a booking"""
-        for booking in self.bookings:
-            if booking.id == booking_id:
-                booking.status = "cancelled"
-                break
-        self.notify_change()
+        """Cancel a booking and free its slot"""
+        self.booking_store.update_status(booking_id, "cancelled")
+        booking = self._bookings_by_id.get(booking_id)
+        if booking and booking.status == "confirmed":
+            booking.status = "cancelled"
+            self._release_slot(booking)
+        self.notify_change('bookings')
     
     # Auth methods
+    @traced(category="state")
     def signup(self, email: str, password: str) -> bool:
         """Sign up a new user"""
-        # Load existing users
-        users_data = []
-        if os.path.exists(self.users_file):
-            with open(self.users_file, 'r') as f:
-                users_data = json.load(f)
-        
         # Check if user exists
-        if any(u['email'] == email for u in users_data):
+        if self.user_store.find_by_email(email):
             self.add_toast('An account with this email already exists.', 'error')
             return False
         
@@ -343,29 +603,27 @@ class AppState:
         self._save_users()
         self.is_auth_modal_open = False
         self.is_profile_modal_open = True
-        self.notify_change()
+        self.notify_change('auth', 'modals')
         return True
     
+    @traced(category="state")
     def login(self, email: str, password: str) -> bool:
         """Log in an existing user"""
-        users_data = []
-        if os.path.exists(self.users_file):
-            with open(self.users_file, 'r') as f:
-                users_data = json.load(f)
-        
-        user_data = next((u for u in users_data if u['email'] == email and u['password'] == password), None)
-        
-        if user_data:
-            self.current_user = User(**{k: v for k, v in user_data.items() if k != 'is_current'})
-            self._save_users()
-            self.is_auth_modal_open = False
-            self.add_toast(f'Welcome back, {self.current_user.username}!', 'success')
-            self.notify_change()
-            return True
-        else:
-            self.add_toast('Invalid email or password.', 'error')
-            return False
+        with self.batch():
+            user = self.user_store.find_by_credentials(email, password)
+            
+            if user:
+                self.current_user = user
+                self._save_users()
+                self.is_auth_modal_open = False
+                self.add_toast(f'Welcome back, {self.current_user.username}!', 'success')
+                self.notify_change('auth', 'modals')
+                return True
+            else:
+                self.add_toast('Invalid email or password.', 'error')
+                return False
     
+    @traced(category="state")
     def social_login(self, provider: str):
         """Simulate social login"""
         import random
@@ -385,57 +643,50 @@ class AppState:
         
         data = mock_data.get(provider, mock_data['google'])
         
-        # Check if user exists
-        users_data = []
-        if os.path.exists(self.users_file):
-            with open(self.users_file, 'r') as f:
-                users_data = json.load(f)
-        
-        user_data = next((u for u in users_data if f'@{provider}.com' in u['email']), None)
-        
-        if user_data:
-            self.current_user = User(**{k: v for k, v in user_data.items() if k != 'is_current'})
-            self.add_toast(f'Welcome back, {self.current_user.username}!', 'success')
-        else:
-            self.current_user = User(
-                id=str(int(datetime.now().timestamp())),
-                email=data['email'],
-                username=data['username'],
-                profile_picture=data['profile_picture'],
-                password=''
-            )
-            self.is_profile_modal_open = True
-            self.add_toast('Account created successfully! Please review your profile.', 'success')
-        
-        self._save_users()
-        self.is_auth_modal_open = False
-        self.notify_change()
+        with self.batch():
+            # Check if user exists
+            user = self.user_store.find_by_provider(provider)
+            
+            if user:
+                self.current_user = user
+                self.add_toast(f'Welcome back, {self.current_user.username}!', 'success')
+            else:
+                self.current_user = User(
+                    id=str(int(datetime.now().timestamp())),
+                    email=data['email'],
+                    username=data['username'],
+                    profile_picture=data['profile_picture'],
+                    password=''
+                )
+                self.is_profile_modal_open = True
+                self.add_toast('Account created successfully! Please review your profile.', 'success')
+            
+            self._save_users()
+            self.is_auth_modal_open = False
+            self.notify_change('auth', 'modals')
     
+    @traced(category="state")
     def logout(self):
         """Log out current user"""
-        self.current_user = None
-        # Update users file
-        if os.path.exists(self.users_file):
-            with open(self.users_file, 'r') as f:
-                users_data = json.load(f)
-            for user in users_data:
-                user['is_current'] = False
-            with open(self.users_file, 'w') as f:
-                json.dump(users_data, f, indent=2)
-        self.add_toast('You have been signed out.', 'info')
-        self.notify_change()
+        with self.batch():
+            self.current_user = None
+            self.user_store.clear_current()
+            self.add_toast('You have been signed out.', 'info')
+            self.notify_change('auth')
     
+    @traced(category="state")
     def update_user_profile(self, user_id: str, username: str = None, profile_picture: str = None):
         """Update user profile"""
-        if self.current_user and self.current_user.id == user_id:
-            if username:
-                self.current_user.username = username
-            if profile_picture:
-                self.current_user.profile_picture = profile_picture
+        with self.batch():
+            if self.current_user and self.current_user.id == user_id:
+                if username:
+                    self.current_user.username = username
+                if profile_picture:
+                    self.current_user.profile_picture = profile_picture
             
-            self._save_users()
-            self.add_toast('Profile updated successfully!', 'success')
-            self.notify_change()
+                self._save_users()
+                self.add_toast('Profile updated successfully!', 'success')
+                self.notify_change('auth')
 
 # Global app state instance
 app_state = AppState()
@@ -0,0 +1,150 @@
+"""
+Persistent booking storage
+"""
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterable, List, Optional
+from models.types import Booking
+
+
+class BookingStore:
+    """SQLite booking repository with secondary indexes by user, service and date"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS bookings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            service_id TEXT NOT NULL,
+            date TEXT NOT NULL,
+            time_slot TEXT NOT NULL,
+            user_id TEXT NOT NULL DEFAULT '',
+            status TEXT NOT NULL DEFAULT 'confirmed'
+        );
+        CREATE INDEX IF NOT EXISTS idx_bookings_user ON bookings(user_id, date);
+        CREATE INDEX IF NOT EXISTS idx_bookings_service ON bookings(service_id, date, time_slot);
+        CREATE INDEX IF NOT EXISTS idx_bookings_date ON bookings(date);
+    """
+
+    COLUMNS = "id, service_id, date, time_slot, user_id, status"
+
+    def __init__(self, path: str):
+        self.path = path
+        # Autocommit mode: transactions are opened explicitly with BEGIN IMMEDIATE
+        self.conn = sqlite3.connect(path, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=FULL")
+        self.conn.executescript(self.SCHEMA)
+
+        self._pending: Optional[List[Booking]] = None
+
+    @staticmethod
+    def _row_to_booking(row) -> Booking:
+        return Booking(
+            id=str(row[0]),
+            service_id=row[1],
+            date=row[2],
+            time_slot=row[3],
+            user_id=row[4],
+            status=row[5]
+        )
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Booking]:
+        return [self._row_to_booking(row) for row in self.conn.execute(sql, params)]
+
+    # Writes
+    def add(self, booking: Booking) -> Booking:
+        """Persist a booking and assign it a unique id"""
+        if self._pending is not None:
+            self._pending.append(booking)
+        else:
+            self.add_many([booking])
+        return booking
+
+    def add_many(self, bookings: Iterable[Booking]) -> List[Booking]:
+        """Persist several bookings in one transaction, assigning each a unique id"""
+        bookings = list(bookings)
+        if not bookings:
+            return bookings
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # The write lock is held, so ids above the current maximum are free
+            next_id = self.conn.execute(
+                "SELECT COALESCE(MAX(seq), 0) + 1 FROM sqlite_sequence WHERE name = 'bookings'"
+            ).fetchone()[0]
+            rows = []
+            for offset, booking in enumerate(bookings):
+                rows.append((next_id + offset, booking.service_id, booking.date,
+                             booking.time_slot, booking.user_id, booking.status))
+            self.conn.executemany(
+                f"INSERT INTO bookings ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+        for offset, booking in enumerate(bookings):
+            booking.id = str(next_id + offset)
+        return bookings
+
+    @contextmanager
+    def batch(self):
+        """Queue add() calls and write them in a single transaction on a clean exit"""
+        if self._pending is not None:
+            yield self
+            return
+
+        self._pending = []
+        try:
+            yield self
+            pending = self._pending
+        finally:
+            self._pending = None
+        self.add_many(pending)
+
+    def update_status(self, booking_id: str, status: str) -> bool:
+        """Change a booking's status, returning False if it does not exist"""
+        cursor = self.conn.execute(
+            "UPDATE bookings SET status = ? WHERE id = ?", (status, booking_id)
+        )
+        return cursor.rowcount > 0
+
+    # Reads
+    def get(self, booking_id: str) -> Optional[Booking]:
+        """Get a booking by id"""
+        bookings = self._query(f"SELECT {self.COLUMNS} FROM bookings WHERE id = ?", (booking_id,))
+        return bookings[0] if bookings else None
+
+    def for_user(self, user_id: str) -> List[Booking]:
+        """Get a user's bookings ordered by date"""
+        return self._query(
+            f"SELECT {self.COLUMNS} FROM bookings WHERE user_id = ? ORDER BY date, id",
+            (user_id,)
+        )
+
+    def for_service(self, service_id: str, date_from: str = '', date_to: str = '9999-12-31') -> List[Booking]:
+        """Get a service's bookings between two YYYY-MM-DD dates (inclusive)"""
+        return self._query(
+            f"SELECT {self.COLUMNS} FROM bookings "
+            "WHERE service_id = ? AND date BETWEEN ? AND ? ORDER BY date, time_slot",
+            (service_id, date_from, date_to)
+        )
+
+    def on_date(self, date: str) -> List[Booking]:
+        """Get all bookings on a YYYY-MM-DD date"""
+        return self._query(f"SELECT {self.COLUMNS} FROM bookings WHERE date = ?", (date,))
+
+    def confirmed_from(self, date: str) -> List[Booking]:
+        """Get confirmed bookings on or after a YYYY-MM-DD date"""
+        return self._query(
+            f"SELECT {self.COLUMNS} FROM bookings WHERE date >= ? AND status = 'confirmed'",
+            (date,)
+        )
+
+    def count(self) -> int:
+        """Number of stored bookings"""
+        return self.conn.execute("SELECT COUNT(*) FROM bookings").fetchone()[0]
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
@@ -0,0 +1,134 @@
+"""
+Facet bitsets over the pet catalog
+"""
+import threading
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+from models.search_index import ids_to_mask
+from models.types import Pet
+
+# Facets in display order
+FACETS = ('species', 'age', 'breed', 'trait')
+
+# Age range label, first and last age (None for open-ended)
+AGE_RANGES: Tuple[Tuple[str, int, Optional[int]], ...] = (
+    ("Under 2", 0, 1),
+    ("2-4", 2, 4),
+    ("5-8", 5, 8),
+    ("9+", 9, None),
+)
+
+# A facet selection: {facet: values}; values within a facet are OR'ed, facets are AND'ed
+Selection = Mapping[str, Iterable[str]]
+
+
+def age_range(age: int) -> str:
+    """Label of the age range containing age"""
+    for label, first, last in AGE_RANGES:
+        if age >= first and (last is None or age <= last):
+            return label
+    return AGE_RANGES[0][0]
+
+
+def pet_facets(pet: Pet) -> Dict[str, List[str]]:
+    """Facet values of a pet"""
+    return {
+        'species': [pet.species],
+        'age': [age_range(pet.age)],
+        'breed': [pet.breed],
+        'trait': list(dict.fromkeys(pet.quick_facts)),
+    }
+
+
+def selection_key(selection: Optional[Selection]) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """Hashable, order-independent form of a selection, dropping empty facets"""
+    if not selection:
+        return ()
+    return tuple(sorted((facet, tuple(sorted(set(values)))) for facet, values in selection.items() if values))
+
+
+class FacetIndex:
+    """Bitset of documents per facet value, so combining facets is a bitwise intersection"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._size = 0
+        self._all = 0
+        self._bitsets: Dict[str, Dict[str, int]] = {facet: {} for facet in FACETS}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def build(self, pets: Iterable[Pet]):
+        """Replace the index with the given pets; document ids are their positions"""
+        with self._lock:
+            self._reset()
+            value_ids: Dict[str, Dict[str, List[int]]] = {facet: {} for facet in FACETS}
+            for doc_id, pet in enumerate(pets):
+                self._size += 1
+                for facet, values in pet_facets(pet).items():
+                    for value in values:
+                        value_ids[facet].setdefault(value, []).append(doc_id)
+
+            self._all = (1 << self._size) - 1
+            for facet, ids_by_value in value_ids.items():
+                self._bitsets[facet] = {value: ids_to_mask(ids) for value, ids in ids_by_value.items()}
+
+    def add(self, pet: Pet) -> int:
+        """Index one more pet and return its document id"""
+        with self._lock:
+            doc_id = self._size
+            bit = 1 << doc_id
+            self._size += 1
+            self._all |= bit
+            for facet, values in pet_facets(pet).items():
+                bitsets = self._bitsets[facet]
+                for value in values:
+                    bitsets[value] = bitsets.get(value, 0) | bit
+        return doc_id
+
+    def values(self, facet: str) -> List[str]:
+        """Known values of a facet"""
+        with self._lock:
+            return list(self._bitsets[facet])
+
+    def _facet_mask(self, facet: str, values: Iterable[str]) -> int:
+        """Documents having any of values for facet"""
+        bitsets = self._bitsets[facet]
+        mask = 0
+        for value in values:
+            mask |= bitsets.get(value, 0)
+        return mask
+
+    def mask(self, selection: Optional[Selection] = None, base: Optional[int] = None) -> int:
+        """Bitset of documents in base (everything if None) matching selection"""
+        with self._lock:
+            mask = self._all if base is None else base & self._all
+            for facet, values in (selection or {}).items():
+                if values:
+                    mask &= self._facet_mask(facet, values)
+            return mask
+
+    def counts(self, selection: Optional[Selection] = None, base: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+        """Matching documents per facet value if that value were selected
+
+        Each facet is counted against the other facets' selections, so values of a
+        facet that already has a selection show what adding them would bring in.
+        """
+        selection = {facet: values for facet, values in (selection or {}).items() if values}
+        with self._lock:
+            base = self._all if base is None else base & self._all
+            facet_masks = {facet: self._facet_mask(facet, values) for facet, values in selection.items()}
+            counts = {}
+            for facet in FACETS:
+                within = base
+                for other, mask in facet_masks.items():
+                    if other != facet:
+                        within &= mask
+                counts[facet] = {
+                    value: (bitset & within).bit_count()
+                    for value, bitset in self._bitsets[facet].items()
+                }
+            return counts
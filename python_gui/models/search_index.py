@@ -0,0 +1,405 @@
+"""
+Inverted search index over the pet catalog
+"""
+import bisect
+import heapq
+import re
+import threading
+import time
+from collections import Counter
+from itertools import compress
+from typing import Dict, Iterable, List, Optional, Sequence
+from models.types import Pet
+
+# Substring fields are indexed by 1-, 2- and 3-grams; longer queries are rechecked
+NGRAM_SIZES = (1, 2, 3)
+
+# Cached prefix unions kept before the cache is reset
+PREFIX_CACHE_LIMIT = 1024
+
+WORD_RE = re.compile(r"[a-z0-9']+")
+
+# Fuzzy matching compares padded trigrams of name/species/breed words by Dice similarity
+FUZZY_MIN_LENGTH = 4  # shorter query terms only match exactly
+FUZZY_THRESHOLD = 0.5
+FUZZY_TERMS_LIMIT = 16  # closest words kept per query term
+
+# Ranked searches stop after this many results or milliseconds, whichever comes first
+RANKED_LIMIT = 500
+RANKED_BUDGET_MS = 25.0
+
+_BIT_BYTES = bytes.maketrans(b'01', b'\x00\x01')
+_BYTE_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+def ids_to_mask(ids: Iterable[int]) -> int:
+    """Pack document ids into an int bitset"""
+    ids = list(ids)
+    if not ids:
+        return 0
+    bits = bytearray(max(ids) // 8 + 1)
+    for doc_id in ids:
+        bits[doc_id >> 3] |= 1 << (doc_id & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def mask_to_ids(mask: int) -> List[int]:
+    """Unpack an int bitset into ascending document ids"""
+    if mask.bit_count() * 16 < mask.bit_length():
+        # Sparse: visit only the non-zero bytes
+        data = mask.to_bytes((mask.bit_length() + 7) // 8, 'little')
+        ids = []
+        for pos in compress(range(len(data)), data):
+            base = pos << 3
+            ids.extend([base + bit for bit in _BYTE_BITS[data[pos]]])
+        return ids
+    # Dense: one byte per bit, least significant first, so compress() picks the set positions
+    bits = bin(mask)[:1:-1].encode().translate(_BIT_BYTES)
+    return list(compress(range(len(bits)), bits))
+
+
+class BitsetIds(Sequence):
+    """Ascending document ids of a bitset, decoded a block at a time as they are read
+
+    len() is a popcount and reading a window (e.g. the rows a grid shows) decodes only
+    the blocks it touches, so a broad result costs nothing until it is displayed.
+    """
+
+    BLOCK_BYTES = 128  # 1024 documents per block
+
+    # Results this small are decoded in one go
+    EAGER_LIMIT = 1024
+
+    def __init__(self, mask: int):
+        self.mask = mask
+        self._length = mask.bit_count()
+        self._data = None
+        self._starts: List[int] = []  # index of the first id of each block
+        self._blocks: Dict[int, List[int]] = {}
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _index_blocks(self):
+        if self._length <= self.EAGER_LIMIT:
+            self._data = b''
+            self._starts = [0]
+            self._blocks = {0: mask_to_ids(self.mask)}
+            return
+        data = self.mask.to_bytes((self.mask.bit_length() + 7) // 8, 'little')
+        size = self.BLOCK_BYTES
+        total = 0
+        for offset in range(0, len(data), size):
+            self._starts.append(total)
+            total += int.from_bytes(data[offset:offset + size], 'little').bit_count()
+        self._data = data
+
+    def _block(self, block: int) -> List[int]:
+        ids = self._blocks.get(block)
+        if ids is None:
+            size = self.BLOCK_BYTES
+            chunk = int.from_bytes(self._data[block * size:(block + 1) * size], 'little')
+            base = block * size * 8
+            ids = self._blocks[block] = [base + doc_id for doc_id in mask_to_ids(chunk)]
+        return ids
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            ids: List[int] = []
+            while start < stop:
+                chunk = self._window(start, stop)
+                ids.extend(chunk)
+                start += len(chunk)
+            return ids
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("BitsetIds index out of range")
+        return self._window(index, index + 1)[0]
+
+    def _window(self, start: int, stop: int) -> List[int]:
+        """Ids from start up to stop, within the block holding start"""
+        if self._data is None:
+            self._index_blocks()
+        # Empty blocks share their start with the next block, so the last match holds start
+        block = bisect.bisect_right(self._starts, start) - 1
+        offset = start - self._starts[block]
+        return self._block(block)[offset:offset + stop - start]
+
+
+def _ngrams(text: str) -> set:
+    """Every distinct 1-, 2- and 3-gram of text"""
+    return {text[i:i + n] for n in NGRAM_SIZES for i in range(len(text) - n + 1)}
+
+
+def _padded_trigrams(word: str) -> set:
+    """Trigrams of a word padded so its start and end count as well"""
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """Substring search over name, species and breed plus word-prefix search over description and quick facts"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._size = 0
+        self._all = 0
+        # Distinct lowercase name/species/breed values and the documents that have them
+        self._values: List[str] = []
+        self._value_ids: Dict[str, int] = {}
+        self._value_docs: List[int] = []  # value id -> bitset of documents
+        self._value_trigrams: Dict[str, int] = {}  # trigram -> bitset of value ids, for long queries
+        self._ngrams: Dict[str, int] = {}  # 1-3 gram -> bitset of documents
+        # Description and quick-fact words
+        self._words: Dict[str, int] = {}  # word -> bitset of documents
+        self._vocabulary: List[str] = []  # sorted keys of _words
+        self._prefix_cache: Dict[str, int] = {}
+        # Name/species/breed words for typo-tolerant matching
+        self._terms: List[str] = []
+        self._term_ids: Dict[str, int] = {}
+        self._term_docs: List[int] = []  # term id -> bitset of documents
+        self._term_trigrams: Dict[str, List[int]] = {}  # padded trigram -> term ids
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _field_values(pet: Pet) -> set:
+        return {pet.name.lower(), pet.species.lower(), pet.breed.lower()}
+
+    @staticmethod
+    def _words_of(pet: Pet) -> set:
+        text = " ".join([pet.description, *pet.quick_facts]).lower()
+        return set(WORD_RE.findall(text))
+
+    def _value_id(self, value: str) -> int:
+        """Return the id of a field value, registering it on first sight"""
+        value_id = self._value_ids.get(value)
+        if value_id is None:
+            value_id = len(self._values)
+            self._value_ids[value] = value_id
+            self._values.append(value)
+            self._value_docs.append(0)
+            bit = 1 << value_id
+            for i in range(len(value) - 2):
+                gram = value[i:i + 3]
+                self._value_trigrams[gram] = self._value_trigrams.get(gram, 0) | bit
+        return value_id
+
+    def _term_id(self, term: str) -> int:
+        """Return the id of a field word, registering it on first sight"""
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            term_id = len(self._terms)
+            self._term_ids[term] = term_id
+            self._terms.append(term)
+            self._term_docs.append(0)
+            for gram in _padded_trigrams(term):
+                self._term_trigrams.setdefault(gram, []).append(term_id)
+        return term_id
+
+    def build(self, pets: Iterable[Pet]):
+        """Replace the index with the given pets; document ids are their positions"""
+        with self._lock:
+            self._reset()
+            value_doc_ids: Dict[int, List[int]] = {}
+            word_ids: Dict[str, List[int]] = {}
+            for doc_id, pet in enumerate(pets):
+                self._size += 1
+                for value in self._field_values(pet):
+                    value_doc_ids.setdefault(self._value_id(value), []).append(doc_id)
+                for word in self._words_of(pet):
+                    word_ids.setdefault(word, []).append(doc_id)
+
+            self._all = (1 << self._size) - 1
+            for value_id, ids in value_doc_ids.items():
+                self._value_docs[value_id] = ids_to_mask(ids)
+            # Document n-gram postings are unions over the far fewer distinct values
+            for value, docs in zip(self._values, self._value_docs):
+                for gram in _ngrams(value):
+                    self._ngrams[gram] = self._ngrams.get(gram, 0) | docs
+                for term in WORD_RE.findall(value):
+                    term_id = self._term_id(term)
+                    self._term_docs[term_id] |= docs
+            self._words = {word: ids_to_mask(ids) for word, ids in word_ids.items()}
+            self._vocabulary = sorted(self._words)
+
+    def add(self, pet: Pet) -> int:
+        """Index one more pet and return its document id"""
+        with self._lock:
+            doc_id = self._size
+            bit = 1 << doc_id
+            self._size += 1
+            self._all |= bit
+            for value in self._field_values(pet):
+                value_id = self._value_id(value)
+                self._value_docs[value_id] |= bit
+                for gram in _ngrams(value):
+                    self._ngrams[gram] = self._ngrams.get(gram, 0) | bit
+                for term in WORD_RE.findall(value):
+                    self._term_docs[self._term_id(term)] |= bit
+            for word in self._words_of(pet):
+                if word not in self._words:
+                    bisect.insort(self._vocabulary, word)
+                self._words[word] = self._words.get(word, 0) | bit
+            self._prefix_cache.clear()
+        return doc_id
+
+    def _substring_mask(self, token: str) -> int:
+        """Documents whose name, species or breed contains token"""
+        if len(token) <= NGRAM_SIZES[-1]:
+            return self._ngrams.get(token, 0)
+
+        # Narrow to values holding every trigram, then confirm the substring on each value
+        candidates = (1 << len(self._values)) - 1
+        for i in range(len(token) - 2):
+            candidates &= self._value_trigrams.get(token[i:i + 3], 0)
+            if not candidates:
+                return 0
+        mask = 0
+        for value_id in mask_to_ids(candidates):
+            if token in self._values[value_id]:
+                mask |= self._value_docs[value_id]
+        return mask
+
+    def _prefix_mask(self, prefix: str) -> int:
+        """Documents with a description or quick-fact word starting with prefix"""
+        mask = self._prefix_cache.get(prefix)
+        if mask is None:
+            mask = 0
+            vocabulary = self._vocabulary
+            for i in range(bisect.bisect_left(vocabulary, prefix), len(vocabulary)):
+                if not vocabulary[i].startswith(prefix):
+                    break
+                mask |= self._words[vocabulary[i]]
+            if len(self._prefix_cache) >= PREFIX_CACHE_LIMIT:
+                self._prefix_cache.clear()
+            self._prefix_cache[prefix] = mask
+        return mask
+
+    def query_mask(self, query: str) -> int:
+        """Bitset of documents matching every whitespace-separated term of query"""
+        tokens = query.lower().split()
+        with self._lock:
+            mask = self._all
+            for token in tokens:
+                mask &= self._substring_mask(token) | self._prefix_mask(token)
+                if not mask:
+                    break
+            return mask
+
+    def search(self, query: str) -> BitsetIds:
+        """Ascending document ids matching query, decoded as they are read; an empty query matches everything"""
+        return BitsetIds(self.query_mask(query))
+
+    def _fuzzy_terms(self, token: str, deadline: float) -> List[tuple]:
+        """(similarity, term id) of the field words closest to token, best first"""
+        grams = _padded_trigrams(token)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._term_trigrams.get(gram, ()))
+            if time.perf_counter() > deadline:
+                break
+
+        scored = []
+        for term_id, count in shared.items():
+            term = self._terms[term_id]
+            if term == token:
+                continue  # Already an exact match
+            # Dice coefficient; padded words of length n have n + 1 trigrams
+            similarity = 2 * count / (len(grams) + len(term) + 1)
+            if similarity >= FUZZY_THRESHOLD:
+                scored.append((similarity, term_id))
+        return heapq.nlargest(FUZZY_TERMS_LIMIT, scored)
+
+    def _tiers(self, token: str, within: int, deadline: float) -> List[tuple]:
+        """(score, bitset) groups of documents matching token, best first and disjoint"""
+        exact = (self._substring_mask(token) | self._prefix_mask(token)) & within
+        tiers = [(1.0, exact)] if exact else []
+        if len(token) >= FUZZY_MIN_LENGTH:
+            seen = exact
+            for similarity, term_id in self._fuzzy_terms(token, deadline):
+                docs = self._term_docs[term_id] & within & ~seen
+                if docs:
+                    tiers.append((similarity, docs))
+                    seen |= docs
+        return tiers
+
+    def match_mask(self, query: str, budget_ms: float = RANKED_BUDGET_MS) -> int:
+        """Bitset of every document ranked_search(query) can return, with no limit
+
+        A document matches when each term matches it exactly or with a typo, so
+        narrowing this to a facet selection gives what ranked_search lists for it.
+        """
+        deadline = time.perf_counter() + budget_ms / 1000
+        tokens = query.lower().split()
+        with self._lock:
+            mask = self._all
+            for token in tokens:
+                token_mask = 0
+                for _, docs in self._tiers(token, self._all, deadline):
+                    token_mask |= docs
+                mask &= token_mask
+                if not mask:
+                    break
+            return mask
+
+    def ranked_search(self, query: str, within: Optional[int] = None, limit: int = RANKED_LIMIT,
+                      budget_ms: float = RANKED_BUDGET_MS) -> List[int]:
+        """Document ids matching query exactly or with typos, best first
+
+        Each term scores 1 for an exact substring or word-prefix match and its Dice
+        similarity for a misspelled name, species or breed word. Documents are ranked by
+        the sum over terms; equal scores keep catalog order. The search stops once limit
+        documents are found or budget_ms has passed, returning the best found so far.
+        """
+        deadline = time.perf_counter() + budget_ms / 1000
+        tokens = query.lower().split()
+        with self._lock:
+            within = self._all if within is None else within & self._all
+            if not tokens:
+                return BitsetIds(within)[:limit]
+
+            # Exact matches alone fill the page: skip the fuzzy pass and decode only the first limit
+            exact = within
+            for token in tokens:
+                exact &= self._substring_mask(token) | self._prefix_mask(token)
+            if exact.bit_count() >= limit:
+                return BitsetIds(exact)[:limit]
+
+            token_tiers = [self._tiers(token, within, deadline) for token in tokens]
+            if not all(token_tiers):
+                return []
+
+            # Visit combinations of per-term tiers in descending total score
+            start = (0,) * len(tokens)
+            heap = [(-sum(tiers[0][0] for tiers in token_tiers), start)]
+            queued = {start}
+            results: List[int] = []
+            while heap and len(results) < limit:
+                _, combo = heapq.heappop(heap)
+                mask = within
+                for tiers, i in zip(token_tiers, combo):
+                    mask &= tiers[i][1]
+                    if not mask:
+                        break
+                if mask:
+                    results.extend(BitsetIds(mask)[:limit - len(results)])
+                if time.perf_counter() > deadline:
+                    break
+
+                for position, i in enumerate(combo):
+                    if i + 1 < len(token_tiers[position]):
+                        following = combo[:position] + (i + 1,) + combo[position + 1:]
+                        if following not in queued:
+                            queued.add(following)
+                            score = sum(tiers[j][0] for tiers, j in zip(token_tiers, following))
+                            heapq.heappush(heap, (-score, following))
+            return results
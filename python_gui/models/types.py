@@ -41,6 +41,8 @@ class CartItem:
     image: str
     quantity: int
 
+TIME_SLOTS = ('morning', 'afternoon')
+
 @dataclass
 class Booking:
     service_id: str
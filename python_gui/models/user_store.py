@@ -0,0 +1,216 @@
+"""
+User account storage backends
+"""
+import json
+import os
+import sqlite3
+from typing import List, Optional
+from models.types import User
+from utils.tracing import traced
+
+USER_FIELDS = ('id', 'email', 'username', 'profile_picture', 'password')
+
+
+def _user_from_dict(user_data: dict) -> User:
+    """Build a User from a stored record, ignoring bookkeeping keys"""
+    return User(**{k: v for k, v in user_data.items() if k in USER_FIELDS})
+
+
+def _email_domain(email: str) -> str:
+    """Return the lowercase domain part of an email address"""
+    return email.rsplit('@', 1)[-1].lower() if '@' in email else ''
+
+
+class JsonUserStore:
+    """Legacy backend that re-reads and rewrites the whole users.json on every call"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @traced(category="io")
+    def all_users(self) -> List[dict]:
+        """Return every stored user record"""
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, 'r') as f:
+            return json.load(f)
+
+    @traced(category="io")
+    def _write(self, users_data: List[dict]):
+        """Rewrite the users file"""
+        with open(self.path, 'w') as f:
+            json.dump(users_data, f, indent=2)
+
+    def get_current(self) -> Optional[User]:
+        """Return the user marked as signed in, if any"""
+        user_data = next((u for u in self.all_users() if u.get('is_current')), None)
+        return _user_from_dict(user_data) if user_data else None
+
+    def find_by_email(self, email: str) -> Optional[User]:
+        """Find a user by email"""
+        user_data = next((u for u in self.all_users() if u['email'] == email), None)
+        return _user_from_dict(user_data) if user_data else None
+
+    def find_by_credentials(self, email: str, password: str) -> Optional[User]:
+        """Find a user by email and password"""
+        user_data = next(
+            (u for u in self.all_users() if u['email'] == email and u['password'] == password),
+            None
+        )
+        return _user_from_dict(user_data) if user_data else None
+
+    def find_by_provider(self, provider: str) -> Optional[User]:
+        """Find the first user whose email belongs to a social login provider"""
+        user_data = next((u for u in self.all_users() if f'@{provider}.com' in u['email']), None)
+        return _user_from_dict(user_data) if user_data else None
+
+    def save(self, user: User):
+        """Insert or update a user and mark them as the current user"""
+        users_data = self.all_users()
+        user_dict = {field: getattr(user, field) for field in USER_FIELDS}
+        user_dict['is_current'] = True
+
+        for existing in users_data:
+            existing['is_current'] = False
+
+        index = next((i for i, u in enumerate(users_data) if u['id'] == user.id), None)
+        if index is not None:
+            users_data[index] = user_dict
+        else:
+            users_data.append(user_dict)
+        self._write(users_data)
+
+    def clear_current(self):
+        """Mark every user as signed out"""
+        if not os.path.exists(self.path):
+            return
+        users_data = self.all_users()
+        for user in users_data:
+            user['is_current'] = False
+        self._write(users_data)
+
+    def close(self):
+        """Nothing to release for the JSON backend"""
+
+
+class SqliteUserStore:
+    """SQLite backend with indexed lookups and a single-row current-user pointer"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS users (
+            id TEXT PRIMARY KEY,
+            email TEXT NOT NULL,
+            email_domain TEXT NOT NULL,
+            username TEXT NOT NULL,
+            profile_picture TEXT NOT NULL,
+            password TEXT NOT NULL DEFAULT ''
+        );
+        CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
+        CREATE INDEX IF NOT EXISTS idx_users_email_domain ON users(email_domain);
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    def __init__(self, path: str, legacy_json_path: Optional[str] = None):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+
+        if legacy_json_path:
+            self._migrate_from_json(legacy_json_path)
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row['value'] if row else None
+
+    def _set_meta(self, key: str, value: Optional[str]):
+        self.conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value)
+        )
+
+    @traced(category="io")
+    def _migrate_from_json(self, json_path: str):
+        """Import users.json once, the first time the database is opened"""
+        if self._get_meta('migrated_from_json') or not os.path.exists(json_path):
+            return
+
+        try:
+            users_data = JsonUserStore(json_path).all_users()
+        except Exception as e:
+            print(f"Error migrating users from {json_path}: {e}")
+            return
+
+        current_id = None
+        with self.conn:
+            for user_data in users_data:
+                self._upsert(_user_from_dict(user_data))
+                if user_data.get('is_current'):
+                    current_id = user_data['id']
+            if current_id is not None:
+                self._set_meta('current_user_id', current_id)
+            self._set_meta('migrated_from_json', '1')
+
+    def _upsert(self, user: User):
+        self.conn.execute(
+            "INSERT INTO users (id, email, email_domain, username, profile_picture, password) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET email = excluded.email, "
+            "email_domain = excluded.email_domain, username = excluded.username, "
+            "profile_picture = excluded.profile_picture, password = excluded.password",
+            (user.id, user.email, _email_domain(user.email), user.username,
+             user.profile_picture, user.password)
+        )
+
+    def _fetch_user(self, sql: str, params: tuple) -> Optional[User]:
+        row = self.conn.execute(sql, params).fetchone()
+        return User(**{field: row[field] for field in USER_FIELDS}) if row else None
+
+    @traced(category="io")
+    def get_current(self) -> Optional[User]:
+        """Return the user marked as signed in, if any"""
+        current_id = self._get_meta('current_user_id')
+        if current_id is None:
+            return None
+        return self._fetch_user("SELECT * FROM users WHERE id = ?", (current_id,))
+
+    def find_by_email(self, email: str) -> Optional[User]:
+        """Find a user by email"""
+        return self._fetch_user("SELECT * FROM users WHERE email = ? LIMIT 1", (email,))
+
+    def find_by_credentials(self, email: str, password: str) -> Optional[User]:
+        """Find a user by email and password"""
+        return self._fetch_user(
+            "SELECT * FROM users WHERE email = ? AND password = ? LIMIT 1",
+            (email, password)
+        )
+
+    def find_by_provider(self, provider: str) -> Optional[User]:
+        """Find the first user whose email belongs to a social login provider"""
+        return self._fetch_user(
+            "SELECT * FROM users WHERE email_domain = ? ORDER BY rowid LIMIT 1",
+            (f'{provider}.com',)
+        )
+
+    @traced(category="io")
+    def save(self, user: User):
+        """Insert or update a user and mark them as the current user"""
+        with self.conn:
+            self._upsert(user)
+            self._set_meta('current_user_id', user.id)
+
+    @traced(category="io")
+    def clear_current(self):
+        """Mark every user as signed out"""
+        with self.conn:
+            self.conn.execute("DELETE FROM meta WHERE key = 'current_user_id'")
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
@@ -0,0 +1,141 @@
+"""
+Background work executor that delivers results on the Tk thread
+"""
+import os
+import queue
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+# Milliseconds between checks for finished work while tasks are pending
+POLL_INTERVAL_MS = 15
+
+
+class TaskHandle:
+    """A submitted task; cancel() drops its callback even if the work already finished"""
+
+    def __init__(self, future: Future, owner=None):
+        self.future = future
+        self.owner = owner
+        self.cancelled = False
+
+    def cancel(self):
+        """Cancel the task, skipping its callback"""
+        self.cancelled = True
+        self.future.cancel()
+
+    def is_stale(self) -> bool:
+        """True once cancelled or once the owning widget has been destroyed"""
+        if self.cancelled:
+            return True
+        if self.owner is None:
+            return False
+        try:
+            return not self.owner.winfo_exists()
+        except Exception:
+            return True
+
+
+class TkExecutor:
+    """Thread or process pool whose callbacks are marshalled back onto the Tk event loop"""
+
+    def __init__(self, kind: str = 'thread', max_workers: Optional[int] = None):
+        if kind not in ('thread', 'process'):
+            raise ValueError(f"Unknown executor kind: {kind}")
+        self.kind = kind
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._pool = None
+        self._done: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._pending = 0
+        self._root = None
+        self._poll_scheduled = False
+        self.stats = {'submitted': 0, 'delivered': 0, 'cancelled': 0, 'failed': 0}
+
+    def _get_pool(self):
+        if self._pool is None:
+            pool_class = ThreadPoolExecutor if self.kind == 'thread' else ProcessPoolExecutor
+            self._pool = pool_class(max_workers=self.max_workers)
+        return self._pool
+
+    def attach(self, root):
+        """Use root's event loop to deliver results"""
+        self._root = root
+
+    def submit(self, fn: Callable, *args, callback: Callable[[Any], None] = None,
+               on_error: Callable[[Exception], None] = None, owner=None) -> TaskHandle:
+        """Run fn(*args) in the pool and call callback(result) on the Tk thread"""
+        # Must be called on the Tk thread
+        if self._root is None and owner is not None:
+            self._root = owner.winfo_toplevel()
+
+        future = self._get_pool().submit(fn, *args)
+        handle = TaskHandle(future, owner)
+        self._pending += 1
+        self.stats['submitted'] += 1
+        # Worker threads only touch the queue; Tk is polled from the main loop
+        future.add_done_callback(lambda f: self._done.put((handle, callback, on_error)))
+        self._schedule_poll()
+        return handle
+
+    def _schedule_poll(self):
+        if not self._poll_scheduled and self._root is not None:
+            self._poll_scheduled = True
+            self._root.after(POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self):
+        """Deliver finished results, then keep polling while work is outstanding"""
+        self._poll_scheduled = False
+        while True:
+            try:
+                handle, callback, on_error = self._done.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            self._deliver(handle, callback, on_error)
+
+        if self._pending > 0:
+            self._schedule_poll()
+
+    def _deliver(self, handle: TaskHandle, callback, on_error):
+        """Run a task's callback unless it is stale"""
+        if handle.is_stale() or handle.future.cancelled():
+            self.stats['cancelled'] += 1
+            return
+
+        try:
+            result = handle.future.result()
+        except Exception as e:
+            self.stats['failed'] += 1
+            if on_error:
+                on_error(e)
+            else:
+                print(f"Error in background task: {e}")
+            return
+
+        self.stats['delivered'] += 1
+        if callback:
+            try:
+                callback(result)
+            except Exception as e:
+                print(f"Error delivering background result: {e}")
+
+    def shutdown(self):
+        """Stop the pool without waiting for queued work"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def summary(self) -> str:
+        """One-line description of executor activity"""
+        stats = self.stats
+        return (f"Background {self.kind} pool: {stats['submitted']} submitted, "
+                f"{stats['delivered']} delivered, {stats['cancelled']} cancelled, {stats['failed']} failed")
+
+
+# Image decoding executor; ONLYPETS_DECODE_EXECUTOR=process decodes in worker processes
+decode_executor = TkExecutor(
+    kind=os.environ.get('ONLYPETS_DECODE_EXECUTOR', 'thread'),
+    max_workers=int(os.environ.get('ONLYPETS_DECODE_WORKERS', '0')) or None
+)
+
+# Search-as-you-type runs queries one at a time, off the Tk thread
+search_executor = TkExecutor(kind='thread', max_workers=1)
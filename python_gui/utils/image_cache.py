@@ -0,0 +1,216 @@
+"""
+Process-wide LRU cache of decoded and resized images
+"""
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+from utils.background import TaskHandle, decode_executor
+from utils.thumbnail_cache import thumbnail_cache
+from utils.tracing import traced
+
+if TYPE_CHECKING:
+    from PIL import Image, ImageTk  # imported on first decode, keeping PIL off the startup path
+
+# Directory relative asset paths such as "assets/pets/..." are resolved against
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+ImageKey = Tuple[str, Tuple[int, int], Optional[str]]
+
+
+class ImageRequest:
+    """A pending load_async request; cancel() stops its callback from running"""
+
+    def __init__(self, cache: "ImageCache", key: "ImageKey", owner=None, prefetch: bool = False):
+        self.cache = cache
+        self.key = key
+        self.owner = owner
+        self.prefetch = prefetch
+        self.cancelled = False
+
+    def cancel(self):
+        """Drop the request, and the decode itself if nobody else is waiting for it"""
+        if not self.cancelled:
+            self.cancelled = True
+            self.cache._cancel_if_unwanted(self.key)
+
+    def is_stale(self) -> bool:
+        """True once cancelled or once the owning widget has been destroyed"""
+        if self.cancelled:
+            return True
+        try:
+            return self.owner is not None and not self.owner.winfo_exists()
+        except Exception:
+            return True
+
+    def wants_image(self) -> bool:
+        """True while the decoded image should still be cached; a prefetch outlives its owner"""
+        return not self.cancelled if self.prefetch else not self.is_stale()
+
+
+def resolve_asset_path(path: str) -> str:
+    """Return an absolute path for an asset path relative to the app directory"""
+    if os.path.isabs(path):
+        return path
+    return os.path.join(BASE_DIR, path)
+
+
+class ImageCache:
+    """LRU cache of Tk photo images keyed by (path, size, mode) within a byte budget"""
+
+    def __init__(self, max_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries: "OrderedDict[ImageKey, Tuple[ImageTk.PhotoImage, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        # Requests waiting on a background decode, by key (Tk thread only)
+        self._waiters: Dict[ImageKey, List[Tuple[ImageRequest, Callable]]] = {}
+        self._tasks: Dict[ImageKey, TaskHandle] = {}
+
+    @staticmethod
+    def make_key(path: str, size: Tuple[int, int], mode: Optional[str] = None) -> ImageKey:
+        """Normalize a cache key"""
+        return (os.path.abspath(resolve_asset_path(path)), tuple(size), mode)
+
+    @staticmethod
+    @traced(category="image")
+    def decode(path: str, size: Tuple[int, int], mode: Optional[str] = None) -> "Image.Image":
+        """Load a resized image via the on-disk thumbnail cache; touches no Tk state, so safe off the UI thread"""
+        return thumbnail_cache.load(resolve_asset_path(path), size, mode)
+
+    def get(self, path: str, size: Tuple[int, int], mode: Optional[str] = None) -> "ImageTk.PhotoImage":
+        """Return the photo for path at size, decoding it on a miss (UI thread only)"""
+        key = self.make_key(path, size, mode)
+        photo = self.lookup(key)
+        if photo is not None:
+            return photo
+        return self.put(key, self.decode(key[0], key[1], mode))
+
+    def load_async(self, path: str, size: Tuple[int, int], on_ready: Callable[["ImageTk.PhotoImage"], None],
+                   owner=None, mode: Optional[str] = None) -> Optional[ImageRequest]:
+        """Call on_ready(photo) now on a hit, or on the Tk thread once a background decode finishes"""
+        key = self.make_key(path, size, mode)
+        photo = self.lookup(key)
+        if photo is not None:
+            on_ready(photo)
+            return None
+        
+        return self._wait_for(ImageRequest(self, key, owner), on_ready, mode)
+
+    def _wait_for(self, request: ImageRequest, on_ready: Callable, mode: Optional[str]) -> ImageRequest:
+        """Queue request behind the decode of its image, starting the decode if none is running"""
+        key = request.key
+        waiters = self._waiters.get(key)
+        if waiters is not None:
+            # Another widget already asked for this image, share its decode
+            waiters.append((request, on_ready))
+            return request
+        
+        self._waiters[key] = [(request, on_ready)]
+        self._tasks[key] = decode_executor.submit(
+            self.decode, key[0], key[1], mode,
+            callback=lambda image: self._deliver(key, image),
+            on_error=lambda e: self._fail(key, e)
+        )
+        return request
+
+    def prefetch(self, path: str, size: Tuple[int, int], mode: Optional[str] = None,
+                 owner=None) -> Optional[ImageRequest]:
+        """Start decoding an image into the cache with no widget waiting to show it"""
+        key = self.make_key(path, size, mode)
+        with self._lock:
+            if key in self._entries:
+                return None
+        if key in self._waiters or not os.path.exists(key[0]):
+            return None
+        # Cached even if owner is destroyed first; only cancel() drops it
+        return self._wait_for(ImageRequest(self, key, owner, prefetch=True), lambda photo: None, mode)
+
+    def _cancel_if_unwanted(self, key: ImageKey):
+        """Cancel a pending decode once every widget waiting for it is gone"""
+        waiters = self._waiters.get(key)
+        if waiters is not None and not any(request.wants_image() for request, _ in waiters):
+            del self._waiters[key]
+            self._tasks.pop(key).cancel()
+
+    def _deliver(self, key: ImageKey, image: "Image.Image"):
+        """Cache a decoded image and hand it to every live waiter"""
+        self._tasks.pop(key, None)
+        waiters = self._waiters.pop(key, [])
+        if not any(request.wants_image() for request, _ in waiters):
+            return
+        live = [(request, on_ready) for request, on_ready in waiters if not request.is_stale()]
+        with self._lock:
+            entry = self._entries.get(key)
+        photo = entry[0] if entry is not None else self.put(key, image)
+        for _, on_ready in live:
+            on_ready(photo)
+
+    def _fail(self, key: ImageKey, error: Exception):
+        """Drop the waiters of a decode that raised; they keep their placeholders"""
+        self._tasks.pop(key, None)
+        self._waiters.pop(key, None)
+        print(f"Error loading image {key[0]}: {error}")
+
+    def lookup(self, key: ImageKey) -> Optional["ImageTk.PhotoImage"]:
+        """Return a cached photo and mark it recently used, counting the hit or miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return entry[0]
+
+    @traced(category="image")
+    def put(self, key: ImageKey, image: "Image.Image") -> "ImageTk.PhotoImage":
+        """Wrap a decoded image in a Tk photo and cache it (UI thread only)"""
+        from PIL import ImageTk
+        photo = ImageTk.PhotoImage(image)
+        # Tk stores photo pixels as 32-bit RGBA regardless of the source mode
+        size = image.width * image.height * 4
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            self._entries[key] = (photo, size)
+            self.current_bytes += size
+            self._evict()
+        return photo
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits its budget"""
+        # Widgets holding an evicted photo keep their own reference to it
+        while self.current_bytes > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.current_bytes -= size
+            self.stats['evictions'] += 1
+
+    def set_budget(self, max_bytes: int):
+        """Change the byte budget, evicting entries that no longer fit"""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        """Forget every cached image"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def summary(self) -> str:
+        """One-line description of cache usage"""
+        stats = self.stats
+        return (f"Image cache: {len(self._entries)} images, {self.current_bytes / 1024 / 1024:.1f} MB, "
+                f"{stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions")
+
+
+# Global image cache instance
+image_cache = ImageCache()
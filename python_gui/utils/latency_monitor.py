@@ -0,0 +1,271 @@
+"""
+Opt-in event-loop latency monitor and long-task detector
+"""
+import bisect
+import json
+import os
+import signal
+import sys
+import threading
+import time
+import tkinter as tk
+import traceback
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+# Milliseconds between heartbeats; lag is how late each one runs
+HEARTBEAT_MS = 100
+
+# Callbacks running longer than this are reported with their stack
+LONG_TASK_MS = 50
+
+# Upper bucket bounds in milliseconds; the last bucket holds everything slower
+BUCKET_BOUNDS_MS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048)
+
+# Histograms keep one slot per SLOT_SECONDS for the last WINDOW_SECONDS
+SLOT_SECONDS = 60
+WINDOW_SECONDS = 3600
+
+# Most recent long tasks kept for dumps
+LONG_TASKS_KEPT = 50
+
+
+def monitor_enabled() -> bool:
+    """True if ONLYPETS_LATENCY_MONITOR asks for the monitor"""
+    return os.environ.get('ONLYPETS_LATENCY_MONITOR', '').lower() not in ('', '0', 'false', 'no')
+
+
+def callback_name(func: Callable) -> str:
+    """Readable name of a Tk callback, looking through the wrapper that after() adds"""
+    code = getattr(func, '__code__', None)
+    if code is not None and code.co_name == 'callit' and 'func' in code.co_freevars:
+        func = func.__closure__[code.co_freevars.index('func')].cell_contents
+        code = getattr(func, '__code__', None)
+
+    name = getattr(func, '__qualname__', None) or type(func).__qualname__
+    if code is not None and '<' in name:
+        # Lambdas and local functions are told apart by where they are defined
+        name = f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    return name
+
+
+class RollingHistogram:
+    """Counts of millisecond samples per bucket over a sliding time window"""
+
+    def __init__(self, bounds=BUCKET_BOUNDS_MS, slot_seconds: int = SLOT_SECONDS,
+                 window_seconds: int = WINDOW_SECONDS):
+        self.bounds = tuple(bounds)
+        self.slot_seconds = slot_seconds
+        self._slots = deque(maxlen=max(1, window_seconds // slot_seconds))  # (slot start, counts, total ms, max ms)
+
+    def add(self, value_ms: float, now: float = None):
+        """Record one sample"""
+        now = time.time() if now is None else now
+        slot_start = int(now // self.slot_seconds) * self.slot_seconds
+        if not self._slots or self._slots[-1][0] != slot_start:
+            self._slots.append([slot_start, [0] * (len(self.bounds) + 1), 0.0, 0.0])
+        slot = self._slots[-1]
+        slot[1][bisect.bisect_left(self.bounds, value_ms)] += 1
+        slot[2] += value_ms
+        slot[3] = max(slot[3], value_ms)
+
+    def counts(self, now: float = None) -> List[int]:
+        """Samples per bucket within the window"""
+        now = time.time() if now is None else now
+        oldest = now - self._slots.maxlen * self.slot_seconds
+        totals = [0] * (len(self.bounds) + 1)
+        for slot_start, counts, _, _ in self._slots:
+            if slot_start > oldest:
+                totals = [a + b for a, b in zip(totals, counts)]
+        return totals
+
+    def percentile(self, fraction: float, now: float = None) -> Optional[float]:
+        """Upper bound of the bucket holding the given fraction of samples (inf for the last bucket)"""
+        counts = self.counts(now)
+        total = sum(counts)
+        if not total:
+            return None
+        running = 0
+        for i, count in enumerate(counts):
+            running += count
+            if running >= fraction * total:
+                return self.bounds[i] if i < len(self.bounds) else float('inf')
+        return float('inf')
+
+    def to_dict(self, now: float = None) -> Dict:
+        """Window totals plus the per-slot breakdown"""
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return {
+            'bucket_ms': labels,
+            'counts': self.counts(now),
+            'slots': [
+                {'start': slot_start, 'counts': counts, 'mean_ms': round(total_ms / max(1, sum(counts)), 3),
+                 'max_ms': round(max_ms, 3)}
+                for slot_start, counts, total_ms, max_ms in self._slots
+            ],
+        }
+
+
+class LatencyMonitor:
+    """Measures event-loop lag with an after() heartbeat and times every Tk callback
+
+    Callbacks are timed by wrapping tkinter.CallWrapper, which every command, binding and
+    after() callback passes through. A watchdog thread captures the Tk thread's stack
+    while a callback overruns, so the report shows where it was stuck rather than
+    where it returned.
+    """
+
+    def __init__(self, heartbeat_ms: int = None, long_task_ms: float = None):
+        self.heartbeat_ms = heartbeat_ms or int(os.environ.get('ONLYPETS_HEARTBEAT_MS', HEARTBEAT_MS))
+        self.long_task_ms = long_task_ms or float(os.environ.get('ONLYPETS_LONG_TASK_MS', LONG_TASK_MS))
+        self.lag = RollingHistogram()
+        self.callbacks = RollingHistogram()
+        self.long_tasks = deque(maxlen=LONG_TASKS_KEPT)
+        self.long_task_count = 0
+        self.dump_path = None
+        self.running = False
+        self._root = None
+        self._after_id = None
+        self._due = 0.0
+        self._skip_callback = False
+        self._original_call = None
+        self._depth = 0  # nesting of the Tk callbacks now running
+        # (start, stack) of the outermost running callback; written on the Tk thread, read by the watchdog
+        self._current = None
+        self._tk_thread = None
+        self._stop = threading.Event()
+
+    def start(self, root, dump_path: str = None):
+        """Install the callback wrapper, heartbeat and watchdog on root's event loop"""
+        if self.running:
+            return
+        self.running = True
+        self._root = root
+        self.dump_path = os.environ.get('ONLYPETS_LATENCY_DUMP') or dump_path
+        self._tk_thread = threading.get_ident()
+        self._install()
+        self._stop.clear()
+        threading.Thread(target=self._watch, name="latency-watchdog", daemon=True).start()
+        if self.dump_path and hasattr(signal, 'SIGUSR1'):
+            # `kill -USR1 <pid>` dumps the histograms from a running kiosk
+            signal.signal(signal.SIGUSR1, lambda signum, frame: self.dump())
+        self._due = time.perf_counter() + self.heartbeat_ms / 1000
+        self._after_id = root.after(self.heartbeat_ms, self._beat)
+
+    def stop(self):
+        """Remove the wrapper and stop the heartbeat and watchdog"""
+        if not self.running:
+            return
+        self.running = False
+        self._stop.set()
+        if self._original_call is not None:
+            tk.CallWrapper.__call__ = self._original_call
+            self._original_call = None
+        if self._after_id is not None:
+            try:
+                self._root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def _install(self):
+        original = self._original_call = tk.CallWrapper.__call__
+        monitor = self
+
+        def timed_call(wrapper, *args):
+            if monitor._depth:
+                # Nested callbacks (e.g. from update()) count towards the outer one
+                monitor._depth += 1
+                try:
+                    return original(wrapper, *args)
+                finally:
+                    monitor._depth -= 1
+            entry = [time.perf_counter(), None]
+            monitor._current = entry
+            monitor._depth = 1
+            try:
+                return original(wrapper, *args)
+            finally:
+                monitor._depth = 0
+                monitor._current = None
+                if monitor._skip_callback:
+                    monitor._skip_callback = False
+                else:
+                    monitor._record(wrapper.func, entry)
+
+        tk.CallWrapper.__call__ = timed_call
+
+    def _record(self, func, entry):
+        duration_ms = (time.perf_counter() - entry[0]) * 1000
+        self.callbacks.add(duration_ms)
+        if duration_ms < self.long_task_ms:
+            return
+        self.long_task_count += 1
+        name = callback_name(func)
+        stack = entry[1] or []
+        self.long_tasks.append({'callback': name, 'duration_ms': round(duration_ms, 1),
+                                'at': time.time(), 'stack': stack})
+        print(f"Long task: {name} took {duration_ms:.0f} ms")
+        for line in stack:
+            print(f"    {line}")
+
+    def _watch(self):
+        """Watchdog thread: grab the Tk thread's stack once a callback passes the threshold"""
+        interval = max(0.005, self.long_task_ms / 2000)
+        while not self._stop.wait(interval):
+            entry = self._current
+            if entry is None or entry[1] is not None:
+                continue
+            if (time.perf_counter() - entry[0]) * 1000 < self.long_task_ms:
+                continue
+            frame = sys._current_frames().get(self._tk_thread)
+            if frame is not None and entry is self._current:
+                entry[1] = "".join(traceback.format_stack(frame)).splitlines()
+
+    def _beat(self):
+        """Heartbeat: record how late this tick ran and schedule the next"""
+        now = time.perf_counter()
+        self.lag.add(max(0.0, (now - self._due) * 1000))
+        # Heartbeats would swamp the callback histogram; one nested in another callback
+        # (e.g. run by update()) is part of that callback's time instead
+        if self._depth == 1:
+            self._skip_callback = True
+        if self.running:
+            self._due = now + self.heartbeat_ms / 1000
+            self._after_id = self._root.after(self.heartbeat_ms, self._beat)
+
+    def to_dict(self) -> Dict:
+        """Histograms and recent long tasks as plain data"""
+        return {
+            'recorded_at': time.time(),
+            'heartbeat_ms': self.heartbeat_ms,
+            'long_task_ms': self.long_task_ms,
+            'lag': self.lag.to_dict(),
+            'callbacks': self.callbacks.to_dict(),
+            'long_task_count': self.long_task_count,
+            'long_tasks': list(self.long_tasks),
+        }
+
+    def dump(self, path: str = None):
+        """Write the histograms and long tasks as JSON to path (the dump path by default)"""
+        path = path or self.dump_path
+        if not path:
+            return
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, indent=2)
+        except OSError as e:
+            print(f"Error writing latency dump {path}: {e}")
+
+    def summary(self) -> str:
+        """One-line description of event-loop latency"""
+        def fmt(value):
+            return "-" if value is None else f"<={value:g} ms"
+        return (f"Event loop: lag p50 {fmt(self.lag.percentile(0.5))}, "
+                f"p99 {fmt(self.lag.percentile(0.99))}; "
+                f"{sum(self.callbacks.counts())} callbacks, "
+                f"{self.long_task_count} over {self.long_task_ms:g} ms")
+
+
+# Global latency monitor; started by main when enabled
+latency_monitor = LatencyMonitor()
@@ -0,0 +1,180 @@
+"""
+Diagnostics mode that watches for Tk and memory leaks across navigations
+"""
+import gc
+import os
+import tkinter as tk
+import tracemalloc
+from collections import deque
+from typing import Dict, List, Optional
+
+# Consecutive visits to the same page over which steady growth is flagged
+DEFAULT_CYCLES = 5
+
+# Milliseconds to wait after a navigation so progressive builds, image loads and toasts settle
+SETTLE_MS = 1500
+
+# Allocation sites listed in reports
+TOP_ALLOCATIONS = 10
+
+# Traceback depth recorded for each allocation; deeper is slower but easier to trace back
+TRACEMALLOC_FRAMES = 1
+
+METRICS = ('tk_widgets', 'widget_objects', 'images', 'after_ids', 'tcl_commands', 'python_bytes')
+
+
+def leak_cycles() -> int:
+    """Cycles requested by ONLYPETS_LEAK_CHECK (0 when diagnostics are off)"""
+    value = os.environ.get('ONLYPETS_LEAK_CHECK', '').strip().lower()
+    if value in ('', '0', 'false', 'no'):
+        return 0
+    return int(value) if value.isdigit() else DEFAULT_CYCLES
+
+
+def _count_tk_widgets(root) -> int:
+    """Widgets in the Tk widget tree, toplevels included"""
+    count = 0
+    pending = ['.']
+    while pending:
+        children = root.tk.splitlist(root.tk.call('winfo', 'children', pending.pop()))
+        count += len(children)
+        pending.extend(children)
+    return count
+
+
+def _snapshot_filter(snapshot: tracemalloc.Snapshot) -> tracemalloc.Snapshot:
+    """Drop allocations made by tracemalloc, this module and the import machinery"""
+    return snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ))
+
+
+class LeakDetector:
+    """Samples live Tk widgets, images, after() callbacks and Python memory after each navigation
+
+    Samples are grouped by page. A metric that grew on each of the last `cycles` returns
+    to the same page is reported as a possible leak: the page cache fills up within a
+    few navigations, so from then on revisiting a page should leave the counts flat.
+    """
+
+    def __init__(self, cycles: int = DEFAULT_CYCLES, settle_ms: int = SETTLE_MS):
+        self.cycles = cycles
+        self.settle_ms = settle_ms
+        self.running = False
+        self.samples = 0
+        self._root = None
+        self._after_id = None
+        self._pending_page = None
+        self._history: Dict[str, Dict[str, deque]] = {}  # page -> metric -> recent values
+        self._flagged: Dict[tuple, str] = {}  # (page, metric) -> message
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._latest: Optional[tracemalloc.Snapshot] = None
+        self._started_tracing = False  # stop() leaves tracing started by someone else running
+
+    def start(self, root, cycles: int = None):
+        """Start tracing allocations and sampling after navigations on root"""
+        if self.running:
+            return
+        self.running = True
+        self._root = root
+        self.cycles = cycles or self.cycles
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+
+    def stop(self):
+        """Stop sampling and tracing allocations"""
+        if not self.running:
+            return
+        self.running = False
+        if self._after_id is not None:
+            try:
+                self._root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._baseline = self._latest = None
+
+    def navigated(self, page_name: str):
+        """Sample once the page just shown has settled; a quicker navigation replaces the pending sample"""
+        if not self.running:
+            return
+        if self._after_id is not None:
+            self._root.after_cancel(self._after_id)
+        self._pending_page = page_name
+        self._after_id = self._root.after(self.settle_ms, self._sample)
+
+    def measure(self) -> Dict[str, int]:
+        """Current value of each metric"""
+        root = self._root
+        # Count what is actually reachable, not garbage waiting for the collector
+        gc.collect()
+        snapshot = _snapshot_filter(tracemalloc.take_snapshot())
+        if self._baseline is None:
+            self._baseline = snapshot
+        self._latest = snapshot
+        return {
+            'tk_widgets': _count_tk_widgets(root),
+            'widget_objects': sum(1 for obj in gc.get_objects() if isinstance(obj, tk.Misc)),
+            'images': len(root.tk.splitlist(root.tk.call('image', 'names'))),
+            'after_ids': len(root.tk.splitlist(root.tk.call('after', 'info'))),
+            'tcl_commands': len(root.tk.splitlist(root.tk.call('info', 'commands'))),
+            'python_bytes': sum(stat.size for stat in snapshot.statistics('filename')),
+        }
+
+    def _sample(self):
+        self._after_id = None
+        page = self._pending_page
+        try:
+            values = self.measure()
+        except Exception as e:
+            print(f"Error sampling leak diagnostics: {e}")
+            return
+        self.samples += 1
+
+        history = self._history.setdefault(
+            page, {metric: deque(maxlen=self.cycles + 1) for metric in METRICS})
+        for metric, value in values.items():
+            recent = history[metric]
+            recent.append(value)
+            if len(recent) <= self.cycles or (page, metric) in self._flagged:
+                continue
+            if all(later > earlier for earlier, later in zip(recent, list(recent)[1:])):
+                message = (f"{metric} grew on each of the last {self.cycles} visits to {page}: "
+                           f"{recent[0]} -> {recent[-1]}")
+                self._flagged[(page, metric)] = message
+                print(f"Possible leak: {message}")
+                if metric == 'python_bytes':
+                    for line in self.top_allocations():
+                        print(f"    {line}")
+
+    def top_allocations(self, limit: int = TOP_ALLOCATIONS) -> List[str]:
+        """Source lines whose allocations grew most since the first sample"""
+        if self._baseline is None or self._latest is None:
+            return []
+        stats = self._latest.compare_to(self._baseline, 'lineno')
+        return [str(stat) for stat in stats[:limit] if stat.size_diff > 0]
+
+    def report(self) -> str:
+        """Flagged growth, the latest values per page and the top allocation growth"""
+        lines = [f"Leak check: {self.samples} samples, {len(self._flagged)} possible leaks "
+                 f"(growth on {self.cycles} consecutive visits)"]
+        lines.extend(f"  {message}" for message in self._flagged.values())
+        for page, history in self._history.items():
+            latest = ", ".join(f"{metric}={recent[-1]}" for metric, recent in history.items() if recent)
+            lines.append(f"  {page}: {latest}")
+        allocations = self.top_allocations()
+        if allocations:
+            lines.append("  Allocation growth since the first sample:")
+            lines.extend(f"    {line}" for line in allocations)
+        return "\n".join(lines)
+
+
+# Global leak detector; started by main in diagnostics mode
+leak_detector = LeakDetector()
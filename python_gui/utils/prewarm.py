@@ -0,0 +1,132 @@
+"""
+Idle-time pre-warming of likely next pages and their images
+"""
+import os
+import time
+from typing import Iterable, Iterator, List, Tuple
+from models.app_state import app_state
+
+# Pages pre-built after startup, most likely first; ONLYPETS_PREWARM="" turns pre-warming off
+DEFAULT_PREWARM_PAGES = ('adoption', 'services', 'products')
+
+# Milliseconds of pre-warming work per idle tick, and the pause between ticks
+TICK_BUDGET_MS = 8
+TICK_INTERVAL_MS = 50
+
+# Milliseconds to stay out of the way after keyboard or mouse input
+INPUT_BACKOFF_MS = 400
+
+# Input that pauses pre-warming
+INPUT_EVENTS = ("<KeyPress>", "<ButtonPress>", "<MouseWheel>")
+
+# Pet card images warmed for the adoption page, about two screens' worth
+ADOPTION_PREWARM_IMAGES = 24
+
+
+def prewarm_pages() -> Tuple[str, ...]:
+    """Pages to pre-build, in priority order"""
+    configured = os.environ.get('ONLYPETS_PREWARM')
+    if configured is None:
+        return DEFAULT_PREWARM_PAGES
+    return tuple(name.strip() for name in configured.split(',') if name.strip())
+
+
+def page_images(page_name: str) -> List[Tuple[str, Tuple[int, int]]]:
+    """(path, size) of the images a page shows first, at the sizes its cards request"""
+    if page_name == 'adoption':
+        return [(pet.image_urls[0], (300, 200))
+                for pet in app_state.pets[:ADOPTION_PREWARM_IMAGES] if pet.image_urls]
+    if page_name == 'services':
+        return [(service.image_url, (350, 400)) for service in app_state.services]
+    return []
+
+
+class IdleScheduler:
+    """Runs queued jobs a step at a time in short slices while the event loop is idle
+
+    A job is an iterator; each next() does one small unit of work. A tick runs steps
+    until budget_ms is spent, and ticks pause for backoff_ms after any user input.
+    A step can't be interrupted, so one that runs past budget_ms holds up input by as
+    much. Jobs keep each step to about one section or card; steps that still run
+    over are counted as overruns.
+    """
+
+    def __init__(self, root, budget_ms: float = None, interval_ms: int = TICK_INTERVAL_MS,
+                 backoff_ms: int = INPUT_BACKOFF_MS):
+        self.root = root
+        self.budget_ms = budget_ms or float(os.environ.get('ONLYPETS_PREWARM_BUDGET_MS', TICK_BUDGET_MS))
+        self.interval_ms = interval_ms
+        self.backoff_ms = backoff_ms
+        self._jobs: List[Tuple[str, Iterator]] = []  # run in order, first job first
+        self._after_id = None
+        self._last_input = 0.0
+        self.stats = {'ticks': 0, 'steps': 0, 'deferred': 0, 'completed': 0, 'failed': 0,
+                      'overruns': 0, 'busy_ms': 0.0}
+
+        for sequence in INPUT_EVENTS:
+            root.bind_all(sequence, self._on_input, add="+")
+
+    def add(self, name: str, steps: Iterable):
+        """Queue a job behind the ones already queued"""
+        self._jobs.append((name, iter(steps)))
+        self._schedule(self.interval_ms)
+
+    def _on_input(self, event):
+        self._last_input = time.perf_counter()
+
+    def _schedule(self, delay_ms: float):
+        if self._after_id is None and self._jobs:
+            self._after_id = self.root.after(int(delay_ms), self._wait_for_idle)
+
+    def _wait_for_idle(self):
+        """Run the next tick once pending events and redraws are handled"""
+        self._after_id = self.root.after_idle(self._tick)
+
+    def _tick(self):
+        """Run job steps until the tick's budget is spent"""
+        self._after_id = None
+        quiet_ms = (time.perf_counter() - self._last_input) * 1000
+        if quiet_ms < self.backoff_ms:
+            self.stats['deferred'] += 1
+            self._schedule(self.backoff_ms - quiet_ms)
+            return
+
+        self.stats['ticks'] += 1
+        start = time.perf_counter()
+        deadline = start + self.budget_ms / 1000
+        step_start = start
+        while self._jobs and step_start < deadline:
+            name, steps = self._jobs[0]
+            try:
+                next(steps)
+                self.stats['steps'] += 1
+            except StopIteration:
+                self._jobs.pop(0)
+                self.stats['completed'] += 1
+            except Exception as e:
+                self._jobs.pop(0)
+                self.stats['failed'] += 1
+                print(f"Error pre-warming {name}: {e}")
+            step_end = time.perf_counter()
+            if (step_end - step_start) * 1000 > self.budget_ms:
+                self.stats['overruns'] += 1
+            step_start = step_end
+        self.stats['busy_ms'] += (time.perf_counter() - start) * 1000
+        self._schedule(self.interval_ms)
+
+    def stop(self):
+        """Drop queued jobs and cancel the next tick"""
+        self._jobs.clear()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def summary(self) -> str:
+        """One-line description of pre-warming activity"""
+        stats = self.stats
+        return (f"Pre-warm: {stats['completed']} jobs done, {stats['steps']} steps in {stats['ticks']} ticks "
+                f"({stats['busy_ms']:.0f} ms), {stats['overruns']} steps over budget, "
+                f"{stats['deferred']} ticks deferred for input, {stats['failed']} failed")
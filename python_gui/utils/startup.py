@@ -0,0 +1,117 @@
+"""
+Startup profiler: timestamps of startup phases up to the first painted frame
+"""
+import json
+import platform
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional, Tuple
+
+_NOT_RECORDING = nullcontext()
+
+
+class StartupTimer:
+    """Monotonic timestamps of startup milestones and nested phases, relative to when timing started
+
+    Milestones split startup into consecutive steps; phases time blocks within them,
+    such as page constructors and their sections. Phases are recorded until finish()
+    is called, after which phase() costs one attribute check.
+    """
+
+    def __init__(self, start: float = None):
+        self.start = time.perf_counter() if start is None else start
+        self.marks: List[Tuple[str, float]] = []
+        self.phases: List[Dict] = []  # {name, depth, start, end} in start order
+        self.recording = True
+        self._depth = 0
+
+    def mark(self, name: str):
+        """Record that a milestone was reached now"""
+        self.marks.append((name, time.perf_counter()))
+
+    def phase(self, name: str):
+        """Context manager timing a block as a phase, nested under any phase already open"""
+        if not self.recording:
+            return _NOT_RECORDING
+        return self._phase(name)
+
+    @contextmanager
+    def _phase(self, name: str):
+        entry = {'name': name, 'depth': self._depth, 'start': time.perf_counter(), 'end': None}
+        self.phases.append(entry)
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            entry['end'] = time.perf_counter()
+
+    def finish(self):
+        """Stop recording phases"""
+        self.recording = False
+
+    def elapsed_ms(self, name: str) -> float:
+        """Milliseconds from the start to a milestone"""
+        for mark_name, timestamp in self.marks:
+            if mark_name == name:
+                return (timestamp - self.start) * 1000
+        raise KeyError(name)
+
+    def _ms(self, timestamp: Optional[float]) -> Optional[float]:
+        return None if timestamp is None else round((timestamp - self.start) * 1000, 3)
+
+    def report(self) -> str:
+        """Milestones, then the phase tree with start offsets and durations"""
+        lines = ["Startup timing:"]
+        previous = self.start
+        for name, timestamp in self.marks:
+            step = f"+{(timestamp - previous) * 1000:.1f}"
+            lines.append(f"  {name:<14} {step:>9} ms {(timestamp - self.start) * 1000:9.1f} ms")
+            previous = timestamp
+
+        if self.phases:
+            lines.append(f"Startup phases:{'start ms':>29} {'took ms':>9}")
+            for entry in self.phases:
+                label = "  " * (entry['depth'] + 1) + entry['name']
+                took = "-" if entry['end'] is None else f"{(entry['end'] - entry['start']) * 1000:.1f}"
+                lines.append(f"{label:<34} {self._ms(entry['start']):9.1f} {took:>9}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict:
+        """Timings as plain data, one record per run for trend tracking"""
+        return {
+            'recorded_at': time.time(),
+            'python': platform.python_version(),
+            'platform': sys.platform,
+            'marks': [
+                {'name': name, 'at_ms': self._ms(timestamp), 'step_ms': round((timestamp - previous) * 1000, 3)}
+                for (name, timestamp), previous in zip(self.marks, [self.start] + [t for _, t in self.marks])
+            ],
+            'phases': [
+                {
+                    'name': entry['name'],
+                    'depth': entry['depth'],
+                    'start_ms': self._ms(entry['start']),
+                    'duration_ms': None if entry['end'] is None
+                    else round((entry['end'] - entry['start']) * 1000, 3),
+                }
+                for entry in self.phases
+            ],
+        }
+
+    def write_json(self, path: str):
+        """Append this run as one JSON line to path ('-' for stdout)"""
+        line = json.dumps(self.to_dict())
+        if path == '-':
+            print(line)
+            return
+        try:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+        except OSError as e:
+            print(f"Error writing startup profile {path}: {e}")
+
+
+# Global startup timer; importing this module first starts the clock
+startup_timer = StartupTimer()
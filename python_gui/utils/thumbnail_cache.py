@@ -0,0 +1,176 @@
+"""
+Persistent on-disk cache of resized image derivatives
+
+Usage:
+    python -m utils.thumbnail_cache build [--validate hash]
+    python -m utils.thumbnail_cache clear
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
+from utils.tracing import traced
+
+if TYPE_CHECKING:
+    from PIL import Image  # imported on first use, keeping PIL off the startup path
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_DIR = os.path.join(BASE_DIR, 'data', 'thumbnails')
+
+# Sizes the views request for each asset folder
+ASSET_SIZES: Dict[str, Tuple[Tuple[int, int], ...]] = {
+    'pets': ((300, 200), (380, 380)),
+    'services': ((350, 400),),
+    'products': ((250, 200), (80, 80)),
+}
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp')
+
+# PNG text chunk holding the signature of the source the thumbnail was made from
+SIGNATURE_KEY = 'onlypets-source'
+
+
+class ThumbnailCache:
+    """Resized copies of source images stored as PNG files, validated against their source"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, validate: str = 'stat'):
+        if validate not in ('stat', 'hash'):
+            raise ValueError(f"Unknown validation mode: {validate}")
+        self.cache_dir = cache_dir
+        self.validate = validate
+        self.enabled = True
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'write_errors': 0}
+
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def signature(self, source: str) -> str:
+        """Identify the current contents of a source file by mtime/size or content hash"""
+        if self.validate == 'hash':
+            digest = hashlib.sha256()
+            with open(source, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+            return f"sha256:{digest.hexdigest()}"
+        st = os.stat(source)
+        return f"stat:{st.st_mtime_ns}:{st.st_size}"
+
+    def thumbnail_path(self, source: str, size: Tuple[int, int], mode: Optional[str] = None) -> str:
+        """Path of the cached derivative of source at size and mode"""
+        name = hashlib.sha1(f"{os.path.abspath(source)}|{mode}".encode()).hexdigest()[:20]
+        return os.path.join(self.cache_dir, f"{name}_{size[0]}x{size[1]}.png")
+
+    @traced(category="image")
+    def load(self, source: str, size: Tuple[int, int], mode: Optional[str] = None) -> "Image.Image":
+        """Return source resized to size, reading a valid thumbnail or rebuilding it"""
+        if not self.enabled:
+            return resize_image(source, size, mode)
+
+        from PIL import Image
+        signature = self.signature(source)
+        thumb_path = self.thumbnail_path(source, size, mode)
+        try:
+            with Image.open(thumb_path) as thumb:
+                if thumb.info.get(SIGNATURE_KEY) == signature and thumb.size == tuple(size):
+                    thumb.load()
+                    self._count('hits')
+                    return thumb
+        except (OSError, ValueError):
+            pass  # Missing or unreadable thumbnail, rebuild it
+
+        self._count('misses')
+        image = resize_image(source, size, mode)
+        self._store(thumb_path, image, signature)
+        return image
+
+    def _store(self, thumb_path: str, image: "Image.Image", signature: str):
+        """Write a thumbnail atomically so concurrent readers never see a partial file"""
+        from PIL.PngImagePlugin import PngInfo
+        info = PngInfo()
+        info.add_text(SIGNATURE_KEY, signature)
+        tmp_path = f"{thumb_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            image.save(tmp_path, 'PNG', pnginfo=info, compress_level=1)
+            os.replace(tmp_path, thumb_path)
+        except (OSError, ValueError) as e:
+            self._count('write_errors')
+            print(f"Error writing thumbnail {thumb_path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def build(self, jobs: Iterable[Tuple[str, Tuple[int, int]]]) -> Tuple[int, int]:
+        """Make sure a thumbnail exists for each (source, size); returns (built, up to date)"""
+        misses_before = self.stats['misses']
+        total = 0
+        for source, size in jobs:
+            try:
+                self.load(source, size)
+                total += 1
+            except Exception as e:
+                print(f"Error building thumbnail for {source}: {e}")
+        built = self.stats['misses'] - misses_before
+        return built, total - built
+
+    def clear(self):
+        """Delete every cached thumbnail"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def summary(self) -> str:
+        """One-line description of cache usage"""
+        stats = self.stats
+        return (f"Thumbnail cache: {stats['hits']} hits, {stats['misses']} rebuilt, "
+                f"{stats['write_errors']} write errors")
+
+
+@traced(category="image")
+def resize_image(source: str, size: Tuple[int, int], mode: Optional[str] = None) -> "Image.Image":
+    """Decode a full-size image and resize it"""
+    from PIL import Image
+    with Image.open(source) as img:
+        if mode and img.mode != mode:
+            img = img.convert(mode)
+        return img.resize(size, Image.Resampling.LANCZOS)
+
+
+def asset_jobs(assets_dir: str = os.path.join(BASE_DIR, 'assets')):
+    """Yield (source, size) for every asset image at the sizes the views use"""
+    for folder, sizes in ASSET_SIZES.items():
+        for root, _, files in os.walk(os.path.join(assets_dir, folder)):
+            for filename in sorted(files):
+                if filename.lower().endswith(IMAGE_EXTENSIONS):
+                    for size in sizes:
+                        yield os.path.join(root, filename), size
+
+
+# Global thumbnail cache instance
+thumbnail_cache = ThumbnailCache()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the on-disk thumbnail cache")
+    parser.add_argument('command', choices=['build', 'clear'])
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+    parser.add_argument('--validate', choices=['stat', 'hash'], default='stat',
+                        help='compare sources by mtime/size or by content hash')
+    args = parser.parse_args()
+
+    cache = ThumbnailCache(args.cache_dir, validate=args.validate)
+    if args.command == 'clear':
+        cache.clear()
+        print(f"Cleared {args.cache_dir}")
+        return
+
+    start = time.perf_counter()
+    built, fresh = cache.build(asset_jobs())
+    print(f"Built {built} thumbnails, {fresh} already up to date "
+          f"in {time.perf_counter() - start:.2f}s ({args.cache_dir})")
+
+
+if __name__ == "__main__":
+    main()
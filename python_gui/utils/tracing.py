@@ -0,0 +1,136 @@
+"""
+Tracing spans exported as Chrome trace-event JSON
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import Callable, Dict, Optional
+
+# Completed spans kept in memory; the oldest are dropped first
+MAX_EVENTS = 100_000
+
+DEFAULT_CATEGORY = 'app'
+
+_DISABLED = nullcontext()
+
+
+class _Span:
+    """One timed block; recorded as a complete ("X") event when it exits"""
+
+    __slots__ = ('tracer', 'name', 'category', 'args', 'start')
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: Optional[Dict]):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        self.tracer._record(self.name, self.category, self.start, end, self.args, exc_type)
+        return False
+
+
+class Tracer:
+    """Collects spans from any thread while enabled; does one attribute check per span otherwise"""
+
+    def __init__(self, max_events: int = MAX_EVENTS):
+        self.enabled = False
+        self.path: Optional[str] = None
+        self._events = deque(maxlen=max_events)
+        self._threads: Dict[int, str] = {}
+        self._pid = os.getpid()
+
+    def start(self, path: str = None):
+        """Start recording spans; path is where write() saves them"""
+        self.path = path or self.path
+        self.enabled = True
+
+    def stop(self):
+        """Stop recording; spans recorded so far are kept"""
+        self.enabled = False
+
+    def span(self, name: str, category: str = DEFAULT_CATEGORY, **args):
+        """Context manager timing a block as a span named name"""
+        if not self.enabled:
+            return _DISABLED
+        return _Span(self, name, category, args or None)
+
+    def _record(self, name: str, category: str, start_ns: int, end_ns: int, args: Optional[Dict], exc_type):
+        tid = threading.get_native_id()
+        if tid not in self._threads:
+            self._threads[tid] = threading.current_thread().name
+        event = {
+            'name': name, 'cat': category, 'ph': 'X', 'pid': self._pid, 'tid': tid,
+            'ts': start_ns / 1000, 'dur': (end_ns - start_ns) / 1000,
+        }
+        if args or exc_type:
+            event['args'] = dict(args or {})
+            if exc_type:
+                event['args']['error'] = exc_type.__name__
+        # deque.append is atomic, so worker threads need no lock
+        self._events.append(event)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def clear(self):
+        """Drop every recorded span"""
+        self._events.clear()
+
+    def to_chrome(self) -> Dict:
+        """Recorded spans in Chrome trace-event format (chrome://tracing, Perfetto)"""
+        metadata = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': tid, 'args': {'name': name}}
+            for tid, name in list(self._threads.items())
+        ]
+        return {'traceEvents': metadata + list(self._events), 'displayTimeUnit': 'ms'}
+
+    def write(self, path: str = None) -> Optional[str]:
+        """Save the recorded spans as trace-event JSON; returns the path written"""
+        path = path or self.path
+        if not path:
+            return None
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_chrome(), f)
+        except OSError as e:
+            print(f"Error writing trace {path}: {e}")
+            return None
+        return path
+
+
+# Global tracer; ONLYPETS_TRACE=<path> starts it at import so startup is traced too
+tracer = Tracer()
+if os.environ.get('ONLYPETS_TRACE'):
+    tracer.start(os.environ['ONLYPETS_TRACE'])
+
+
+def span(name: str, category: str = DEFAULT_CATEGORY, **args):
+    """Context manager timing a block on the global tracer"""
+    if not tracer.enabled:
+        return _DISABLED
+    return _Span(tracer, name, category, args or None)
+
+
+def traced(name: Optional[str] = None, category: str = DEFAULT_CATEGORY) -> Callable:
+    """Decorator recording each call as a span, named after the function by default"""
+    def decorate(func: Callable) -> Callable:
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with _Span(tracer, label, category, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
@@ -3,19 +3,81 @@ Adoption page with search and filters
 """
 import customtkinter as ctk
 from models.app_state import app_state
+from models.facets import AGE_RANGES
+from utils.background import search_executor
 from utils.colors import *
+from utils.tracing import traced
 from views.components.pet_card import PetCard
+from views.components.virtual_grid import VirtualGrid
+
+# Quiet period after the last keystroke before a search runs
+SEARCH_DEBOUNCE_MS = 150
+
+# Facet rows under the species buttons; species stays the button row
+FACET_LABELS = {'age': "Age", 'breed': "Breed", 'trait': "Traits"}
+FACET_CHIP_LIMIT = 12  # most common values shown per facet, plus any selected
+FACET_CHIP_COLUMNS = 6
+
+
+def _search(species, query, facets):
+    """Matching pets and facet counts, computed on the search worker"""
+    return (app_state.search_pets(species, query, facets),
+            app_state.count_facets(species, query, facets))
 
 class AdoptionPage(ctk.CTkFrame):
-    def __init__(self, parent, app):
+    # State slices that trigger refresh(); wishlist changes only update the hearts
+    state_topics = ('pets',)
+    
+    def __init__(self, parent, app, staged: bool = False):
         super().__init__(parent, fg_color="transparent")
         self.app = app
         self.current_filter = "All"
         self.search_query = ""
-        self._create_widgets()
+        self.pets_grid = None
+        self.no_results = None
+        
+        # Selected values per facet, and the chips currently shown for each
+        self.facet_selection = {facet: set() for facet in FACET_LABELS}
+        self._facet_values = {facet: [] for facet in FACET_LABELS}
+        self._facet_chips = {facet: {} for facet in FACET_LABELS}
+        
+        # Search-as-you-type: each request bumps the generation so older results are ignored
+        self._search_generation = 0
+        self._search_after_id = None
+        self._search_task = None
+        self._unsubscribe_wishlist = app_state.subscribe(lambda changed: self._refresh_wishlist(), 'wishlist')
+        if not staged:
+            self._create_widgets()
     
+    @traced(category="view")
     def _create_widgets(self):
         """Create adoption page widgets"""
+        for _ in self.build_steps():
+            pass
+    
+    def build_steps(self):
+        """Create the widgets a section per step, so pre-building can spread them over idle ticks"""
+        self._create_title()
+        yield
+        self._create_filters()
+        yield
+        self._create_facet_rows()
+        yield
+        
+        # Pets grid
+        self.pets_container = ctk.CTkFrame(self, fg_color="transparent")
+        self.pets_container.pack(fill="both", expand=True)
+        facets = self._facets()
+        self._show_pets(app_state.pets_filtered(self.current_filter, self.search_query, facets))
+        
+        counts = app_state.facet_counts(self.current_filter, self.search_query, facets)
+        self._update_species_counts(counts['species'])
+        for facet in FACET_LABELS:
+            yield
+            self._update_facet_row(facet, counts[facet])
+    
+    def _create_title(self):
+        """Create the title and the search bar"""
         # Title section
         title = ctk.CTkLabel(
             self,
@@ -48,10 +110,12 @@ class AdoptionPage(ctk.CTkFrame):
         )
         self.search_entry.pack(fill="x")
         self.search_entry.bind("<KeyRelease>", self._on_search)
-        
+    
+    def _create_filters(self):
+        """Create the species filter buttons"""
         # Filter buttons
         filter_frame = ctk.CTkFrame(self, fg_color="transparent")
-        filter_frame.pack(pady=(0, 30))
+        filter_frame.pack(pady=(0, 15))
         
         filters = ["All", "Dog", "Cat", "Bird", "Other"]
         self.filter_buttons = {}
@@ -71,17 +135,68 @@ class AdoptionPage(ctk.CTkFrame):
             )
             btn.pack(side="left", padx=5)
             self.filter_buttons[filter_name] = btn
+    
+    def _create_facet_rows(self):
+        """Create the facet rows; their chips are filled in with the counts"""
+        # Facet chips with live counts
+        facets_frame = ctk.CTkFrame(self, fg_color="transparent")
+        facets_frame.pack(pady=(0, 30))
         
-        # Pets grid
-        self.pets_container = ctk.CTkFrame(self, fg_color="transparent")
-        self.pets_container.pack(fill="both", expand=True)
-        
-        self._display_pets()
+        self.facet_rows = {}
+        for facet, label in FACET_LABELS.items():
+            row = ctk.CTkFrame(facets_frame, fg_color="transparent")
+            row.pack(fill="x", pady=3)
+            
+            ctk.CTkLabel(
+                row,
+                text=label,
+                font=ctk.CTkFont(size=13, weight="bold"),
+                text_color=TEXT_GRAY_400,
+                width=60,
+                anchor="w"
+            ).pack(side="left", anchor="n", pady=3)
+            
+            chips = ctk.CTkFrame(row, fg_color="transparent")
+            chips.pack(side="left", fill="x")
+            self.facet_rows[facet] = chips
     
     def _on_search(self, event):
-        """Handle search input"""
-        self.search_query = self.search_entry.get().lower().strip()
-        self._display_pets()
+        """Handle search input, waiting for typing to pause before searching"""
+        query = self.search_entry.get().lower().strip()
+        if query == self.search_query:
+            return  # Navigation keys and modifiers don't change the query
+        self.search_query = query
+        
+        self._cancel_search()
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._start_search)
+    
+    def _cancel_search(self):
+        """Drop a pending debounce and supersede any search in flight"""
+        self._search_generation += 1
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        if self._search_task:
+            self._search_task.cancel()
+            self._search_task = None
+    
+    def _start_search(self):
+        """Run the current query on the search worker"""
+        self._search_after_id = None
+        generation = self._search_generation
+        self._search_task = search_executor.submit(
+            _search, self.current_filter, self.search_query, self._facets(),
+            callback=lambda result: self._apply_search(generation, *result),
+            owner=self
+        )
+    
+    def _apply_search(self, generation, pets, counts):
+        """Show a search result unless a newer query or filter superseded it"""
+        if generation != self._search_generation:
+            return
+        self._search_task = None
+        self._show_pets(pets)
+        self._update_facets(counts)
     
     def _set_filter(self, filter_name):
         """Set species filter"""
@@ -104,60 +219,132 @@ class AdoptionPage(ctk.CTkFrame):
         
         self._display_pets()
     
+    def refresh(self):
+        """Re-run the current search and filters against the latest catalog"""
+        self._display_pets()
+    
+    def _refresh_wishlist(self):
+        """Update the wishlist hearts on the cards in view; recycled cards update as they are rebound"""
+        if self.pets_grid:
+            for card in self.pets_grid.cells:
+                card.refresh_wishlist()
+    
+    def _toggle_facet(self, facet, value):
+        """Add or remove a facet value from the selection"""
+        self.facet_selection[facet] ^= {value}
+        self._display_pets()
+    
+    def _facets(self):
+        """Snapshot of the facet selection, safe to hand to the search worker"""
+        return {facet: tuple(values) for facet, values in self.facet_selection.items() if values}
+    
     def _display_pets(self):
-        """Display filtered pets"""
-        # Clear existing pets
-        for widget in self.pets_container.winfo_children():
-            widget.destroy()
-        
-        # Filter pets
-        filtered_pets = app_state.pets
-        
-        if self.current_filter != "All":
-            filtered_pets = [p for p in filtered_pets if p.species == self.current_filter]
+        """Display filtered pets right away, superseding any pending search"""
+        self._cancel_search()
+        facets = self._facets()
+        self._show_pets(app_state.pets_filtered(self.current_filter, self.search_query, facets))
+        self._update_facets(app_state.facet_counts(self.current_filter, self.search_query, facets))
+    
+    def _update_facets(self, counts):
+        """Show live counts on the species buttons and facet chips"""
+        self._update_species_counts(counts['species'])
+        for facet in FACET_LABELS:
+            self._update_facet_row(facet, counts[facet])
+    
+    def _update_species_counts(self, species_counts):
+        """Show live counts on the species buttons"""
+        for fname, btn in self.filter_buttons.items():
+            count = sum(species_counts.values()) if fname == "All" else species_counts.get(fname, 0)
+            btn.configure(text=f"{fname} ({count})")
+    
+    def _update_facet_row(self, facet, facet_counts):
+        """Show a facet's most common values as chips with live counts"""
+        selected = self.facet_selection[facet]
+        if facet == 'age':
+            ordered = [label for label, _, _ in AGE_RANGES]
+        else:
+            ordered = sorted(facet_counts, key=lambda value: (-facet_counts[value], value))
+        shown = [value for value in ordered if facet_counts.get(value) or value in selected]
+        shown = [value for i, value in enumerate(shown) if i < FACET_CHIP_LIMIT or value in selected]
         
-        if self.search_query:
-            filtered_pets = [
-                p for p in filtered_pets
-                if self.search_query in p.name.lower() or
-                   self.search_query in p.species.lower() or
-                   self.search_query in p.breed.lower()
-            ]
+        if shown != self._facet_values[facet]:
+            self._build_facet_chips(facet, shown)
+        for value, chip in self._facet_chips[facet].items():
+            is_selected = value in selected
+            chip.configure(
+                text=f"{value} ({facet_counts.get(value, 0)})",
+                fg_color=YELLOW_PRIMARY if is_selected else BG_SECONDARY,
+                hover_color=YELLOW_HOVER if is_selected else HOVER_GRAY,
+                text_color="black" if is_selected else TEXT_GRAY_300
+            )
+    
+    def _build_facet_chips(self, facet, values):
+        """Replace a facet row's chips with one per value"""
+        for chip in self._facet_chips[facet].values():
+            chip.destroy()
+        self._facet_chips[facet] = {}
+        self._facet_values[facet] = values
         
-        if not filtered_pets:
-            # No results
-            no_results = ctk.CTkFrame(
-                self.pets_container,
-                fg_color=BG_SECONDARY,
-                corner_radius=20
+        for i, value in enumerate(values):
+            chip = ctk.CTkButton(
+                self.facet_rows[facet],
+                text=value,
+                font=ctk.CTkFont(size=12),
+                corner_radius=15,
+                height=30,
+                width=60,
+                command=lambda v=value: self._toggle_facet(facet, v)
             )
-            no_results.pack(fill="x", pady=20)
-            
-            ctk.CTkLabel(
-                no_results,
-                text="No Pets Found",
-                font=ctk.CTkFont(size=24, weight="bold"),
-                text_color=TEXT_WHITE
-            ).pack(pady=(40, 10))
-            
-            ctk.CTkLabel(
-                no_results,
-                text="Try adjusting your search or filters.",
-                font=ctk.CTkFont(size=14),
-                text_color=TEXT_GRAY_400
-            ).pack(pady=(0, 40))
+            chip.grid(row=i // FACET_CHIP_COLUMNS, column=i % FACET_CHIP_COLUMNS, padx=3, pady=3, sticky="w")
+            self._facet_chips[facet][value] = chip
+    
+    def _show_pets(self, filtered_pets):
+        """Display filtered pets, reusing the cards already on screen"""
+        if not filtered_pets:
+            if self.pets_grid:
+                self.pets_grid.pack_forget()
+            if not self.no_results:
+                self._create_no_results()
+            self.no_results.pack(fill="x", pady=20)
         else:
-            # Display pets in grid
-            pets_grid = ctk.CTkFrame(self.pets_container, fg_color="transparent")
-            pets_grid.pack(fill="both", expand=True)
-            
-            cols = 4
-            for i in range(cols):
-                pets_grid.grid_columnconfigure(i, weight=1)
-            
-            for i, pet in enumerate(filtered_pets):
-                row = i // cols
-                col = i % cols
-                
-                pet_card = PetCard(pets_grid, pet, self.app)
-                pet_card.grid(row=row, column=col, padx=15, pady=15, sticky="nsew")
+            if self.no_results:
+                self.no_results.pack_forget()
+            if not self.pets_grid:
+                # Only cards near the viewport are built; scrolled-out cards are rebound to new pets
+                self.pets_grid = VirtualGrid(
+                    self.pets_container,
+                    self.app,
+                    create_cell=lambda parent, pet: PetCard(parent, pet, self.app),
+                    update_cell=lambda card, pet: card.set_pet(pet),
+                    columns=4
+                )
+            self.pets_grid.pack(fill="x", expand=True)
+            self.pets_grid.set_items(filtered_pets)
+    
+    def _create_no_results(self):
+        """Create the message shown when no pet matches"""
+        self.no_results = ctk.CTkFrame(
+            self.pets_container,
+            fg_color=BG_SECONDARY,
+            corner_radius=20
+        )
+        
+        ctk.CTkLabel(
+            self.no_results,
+            text="No Pets Found",
+            font=ctk.CTkFont(size=24, weight="bold"),
+            text_color=TEXT_WHITE
+        ).pack(pady=(40, 10))
+        
+        ctk.CTkLabel(
+            self.no_results,
+            text="Try adjusting your search or filters.",
+            font=ctk.CTkFont(size=14),
+            text_color=TEXT_GRAY_400
+        ).pack(pady=(0, 40))
+    
+    def destroy(self):
+        """Cancel pending searches and stop listening to the wishlist before destroying the page"""
+        self._cancel_search()
+        self._unsubscribe_wishlist()
+        super().destroy()
@@ -303,5 +303,5 @@ class AuthModal(ctk.CTkToplevel):
     def _close(self):
         """Close modal"""
         app_state.is_auth_modal_open = False
-        app_state.notify_change()
+        app_state.notify_change('modals')
         self.destroy()
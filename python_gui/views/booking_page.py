@@ -4,12 +4,16 @@ Booking page for pet adoption and service booking with multi-step forms
 import customtkinter as ctk
 from datetime import datetime, timedelta
 import calendar
-from models.app_state import app_state
+from models.app_state import app_state, FULLY_BOOKED
 from models.types import Booking
 from utils.colors import *
+from utils.tracing import traced
 from views.components.breadcrumbs import Breadcrumbs
 
 class BookingPage(ctk.CTkFrame):
+    # A half-filled form shouldn't come back on a later visit
+    cacheable = False
+    
     def __init__(self, parent, app, booking_type, booking_id):
         super().__init__(parent, fg_color="transparent")
         self.app = app
@@ -40,6 +44,7 @@ class BookingPage(ctk.CTkFrame):
         
         self._create_widgets()
     
+    @traced(category="view")
     def _create_widgets(self):
         """Create booking page widgets"""
         # Title
@@ -316,6 +321,7 @@ class BookingPage(ctk.CTkFrame):
         month = self.calendar_date.month
         first_day = calendar.monthrange(year, month)[0]
         days_in_month = calendar.monthrange(year, month)[1]
+        availability = app_state.get_month_availability(self.booking_id, year, month)
         
         day_num = 1
         for week in range(6):
@@ -327,20 +333,24 @@ class BookingPage(ctk.CTkFrame):
                 
                 date_obj = datetime(year, month, day_num)
                 is_past = date_obj.date() < datetime.now().date()
+                is_full = availability[day_num - 1] == FULLY_BOOKED
                 date_str = date_obj.strftime('%Y-%m-%d')
                 is_selected = self.form_data['appointment_date'] == date_str
+                is_unavailable = is_past or is_full
                 
                 btn = ctk.CTkButton(
                     cal_grid,
                     text=str(day_num),
                     font=ctk.CTkFont(size=14, weight="bold" if is_selected else "normal"),
-                    fg_color=YELLOW_PRIMARY if is_selected else ("transparent" if not is_past else BG_DARK),
-                    hover_color=YELLOW_HOVER if not is_past else BG_DARK,
-                    text_color="black" if is_selected else (TEXT_GRAY_600 if is_past else TEXT_WHITE),
+                    fg_color=YELLOW_PRIMARY if is_selected else ("transparent" if not is_unavailable else BG_DARK),
+                    hover_color=YELLOW_HOVER if not is_unavailable else BG_DARK,
+                    text_color="black" if is_selected else (
+                        TEXT_GRAY_600 if is_past else (RED_ERROR if is_full else TEXT_WHITE)
+                    ),
                     width=40,
                     height=40,
                     corner_radius=20,
-                    state="disabled" if is_past else "normal",
+                    state="disabled" if is_unavailable else "normal",
                     command=lambda d=date_str: self._select_date(d)
                 )
                 btn.grid(row=week+1, column=day_col, padx=2, pady=2)
@@ -793,18 +803,17 @@ class BookingPage(ctk.CTkFrame):
         if self.current_step == len(self.steps) - 2:
             # Submit
             if self.booking_type == "service":
-                from datetime import datetime
                 booking = Booking(
-                    id=str(int(datetime.now().timestamp())),
                     service_id=self.booking_id,
                     date=self.form_data['appointment_date'],
                     time_slot=self.form_data['appointment_time'],
                     user_id=app_state.current_user.id if app_state.current_user else "",
                     status="confirmed"
                 )
-                app_state.add_booking(booking)
-                # Add success toast notification
-                app_state.add_toast(f"Service booking confirmed! Your {self.item.name} appointment is scheduled.", "success")
+                with app_state.batch():
+                    app_state.add_booking(booking)
+                    # Add success toast notification
+                    app_state.add_toast(f"Service booking confirmed! Your {self.item.name} appointment is scheduled.", "success")
             else:
                 # Pet adoption submission
                 app_state.add_toast(f"Adoption application submitted! We'll contact you about {self.item.name} soon.", "success")
@@ -819,6 +828,7 @@ class BookingPage(ctk.CTkFrame):
         """Go to previous month"""
         self.calendar_date = self.calendar_date.replace(day=1) - timedelta(days=1)
         self._render_step()
+        self.after_idle(self._prefetch_adjacent_months)
     
     def _next_month(self):
         """Go to next month"""
@@ -829,6 +839,14 @@ class BookingPage(ctk.CTkFrame):
             next_year += 1
         self.calendar_date = self.calendar_date.replace(year=next_year, month=next_month, day=1)
         self._render_step()
+        self.after_idle(self._prefetch_adjacent_months)
+    
+    def _prefetch_adjacent_months(self):
+        """Warm the availability cache for the months either side of the calendar"""
+        year, month = self.calendar_date.year, self.calendar_date.month
+        for offset in (-1, 1):
+            prefetch_year, prefetch_month = divmod(year * 12 + month - 1 + offset, 12)
+            app_state.get_month_availability(self.booking_id, prefetch_year, prefetch_month + 1)
     
     def _select_date(self, date_str):
         """Select appointment date"""
@@ -2,17 +2,22 @@
 Shopping cart page
 """
 import customtkinter as ctk
-from PIL import Image, ImageTk
 import os
 from models.app_state import app_state
 from utils.colors import *
+from utils.image_cache import image_cache, resolve_asset_path
+from utils.tracing import traced
 
 class CartPage(ctk.CTkFrame):
+    # State slices that trigger refresh()
+    state_topics = ('cart',)
+    
     def __init__(self, parent, app):
         super().__init__(parent, fg_color="transparent")
         self.app = app
         self._create_widgets()
     
+    @traced(category="view")
     def _create_widgets(self):
         """Create cart page widgets"""
         # Title
@@ -107,9 +112,7 @@ class CartPage(ctk.CTkFrame):
         summary_title.pack(pady=(30, 20), padx=30)
         
         # Calculate totals
-        subtotal = sum(item.price * item.quantity for item in app_state.cart)
-        taxes = subtotal * 0.1
-        total = subtotal + taxes
+        subtotal, taxes, total = app_state.cart_totals()
         
         # Subtotal
         subtotal_row = ctk.CTkFrame(summary_frame, fg_color="transparent")
@@ -195,11 +198,10 @@ class CartPage(ctk.CTkFrame):
         image_frame.pack(side="left", padx=(0, 15))
         image_frame.pack_propagate(False)
         
-        if os.path.exists(item.image):
+        image_path = resolve_asset_path(item.image)
+        if os.path.exists(image_path):
             try:
-                img = Image.open(item.image)
-                img = img.resize((80, 80), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
+                photo = image_cache.get(image_path, (80, 80))
                 
                 img_label = ctk.CTkLabel(image_frame, image=photo, text="")
                 img_label.image = photo
@@ -289,20 +291,18 @@ class CartPage(ctk.CTkFrame):
     def _update_quantity(self, product_id, new_quantity):
         """Update item quantity"""
         app_state.update_cart_quantity(product_id, new_quantity)
-        self._refresh()
     
     def _remove_item(self, product_id):
         """Remove item from cart"""
         app_state.remove_from_cart(product_id)
-        self._refresh()
     
     def _checkout(self):
         """Handle checkout"""
-        app_state.add_toast("Checkout successful! Thank you for your order. (Simulated)", "success")
-        app_state.clear_cart()
-        self._refresh()
+        with app_state.batch():
+            app_state.add_toast("Checkout successful! Thank you for your order. (Simulated)", "success")
+            app_state.clear_cart()
     
-    def _refresh(self):
+    def refresh(self):
         """Refresh the page"""
         for widget in self.winfo_children():
             widget.destroy()
@@ -2,11 +2,15 @@
 Pet card component
 """
 import customtkinter as ctk
-from PIL import Image, ImageTk
 import os
+import tkinter as tk
 from models.app_state import app_state
 from models.types import Pet
 from utils.colors import *
+from utils.image_cache import image_cache, resolve_asset_path
+
+# Milliseconds the pointer must rest on a card before its gallery is prefetched
+HOVER_INTENT_MS = 150
 
 class PetCard(ctk.CTkFrame):
     def __init__(self, parent, pet: Pet, app):
@@ -19,51 +23,60 @@ class PetCard(ctk.CTkFrame):
         self.pet = pet
         self.app = app
         self.image_label = None
+        self._image_request = None
+        self._hover_after_id = None
+        self._prefetched_pet = None
         
         self._create_widgets()
         
         # Bind click to navigate to details
         self.bind("<Button-1>", self._on_click)
         self._bind_click_to_children(self)
+        
+        # Bound on the frame itself (CTk's bind targets its canvas) so moving onto child widgets still counts
+        tk.Frame.bind(self, "<Enter>", self._on_enter, add="+")
+        tk.Frame.bind(self, "<Leave>", self._on_leave, add="+")
     
     def _create_widgets(self):
         """Create card widgets"""
         # Image placeholder
-        image_frame = ctk.CTkFrame(
+        self.image_frame = ctk.CTkFrame(
             self,
             fg_color=BG_DARK,
             height=200,
             corner_radius=0
         )
-        image_frame.pack(fill="x")
-        image_frame.pack_propagate(False)
+        self.image_frame.pack(fill="x")
+        self.image_frame.pack_propagate(False)
+        
+        self.placeholder_label = self._create_placeholder(self.image_frame)
         
         # Try to load image
-        self._load_image(image_frame)
+        self._load_image()
         
         # Content section
         content_frame = ctk.CTkFrame(self, fg_color="transparent")
         content_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
         # Pet name
-        name_label = ctk.CTkLabel(
+        self.name_label = ctk.CTkLabel(
             content_frame,
             text=self.pet.name,
             font=ctk.CTkFont(size=20, weight="bold"),
             text_color=TEXT_WHITE,
             anchor="w"
         )
-        name_label.pack(fill="x")
+        self.name_label.pack(fill="x")
         
         # Breed
-        breed_label = ctk.CTkLabel(
+        self.breed_label = ctk.CTkLabel(
             content_frame,
             text=self.pet.breed,
             font=ctk.CTkFont(size=14),
             text_color=TEXT_GRAY_400,
             anchor="w"
         )
-        breed_label.pack(fill="x", pady=(5, 0))
+        self.breed_label.pack(fill="x", pady=(5, 0))
         
         # Spacer
         spacer = ctk.CTkFrame(content_frame, fg_color="transparent", height=10)
@@ -85,47 +98,76 @@ class PetCard(ctk.CTkFrame):
         # Wishlist button (top right)
         self.wishlist_btn = ctk.CTkButton(
             self,
-            text="♥" if app_state.is_in_wishlist(self.pet.id) else "♡",
+            text="♡",
             font=ctk.CTkFont(size=20),
             fg_color="#1a1a1a",  # semi-transparent effect
             hover_color="#2a2a2a",
-            text_color=YELLOW_PRIMARY if app_state.is_in_wishlist(self.pet.id) else TEXT_WHITE,
+            text_color=TEXT_WHITE,
             width=40,
             height=40,
             corner_radius=20,
             command=self._toggle_wishlist
         )
         self.wishlist_btn.place(relx=0.9, rely=0.05, anchor="center")
+        self.refresh_wishlist()
     
-    def _load_image(self, frame):
-        """Load pet image"""
-        image_path = self.pet.image_urls[0] if self.pet.image_urls else None
+    def set_pet(self, pet: Pet):
+        """Rebind the card to another pet, reusing its widgets"""
+        if pet is self.pet:
+            self.refresh_wishlist()
+            return
         
+        if self._image_request:
+            self._image_request.cancel()
+            self._image_request = None
+        self._cancel_hover()
+        
+        self.pet = pet
+        self.name_label.configure(text=pet.name)
+        self.breed_label.configure(text=pet.breed)
+        self.refresh_wishlist()
+        self._load_image()
+    
+    def refresh_wishlist(self):
+        """Show whether the pet is in the wishlist"""
+        is_in_wishlist = app_state.is_in_wishlist(self.pet.id)
+        self.wishlist_btn.configure(
+            text="♥" if is_in_wishlist else "♡",
+            text_color=YELLOW_PRIMARY if is_in_wishlist else TEXT_WHITE
+        )
+    
+    def _load_image(self):
+        """Show the placeholder and swap in the pet image once it is decoded"""
+        if self.image_label:
+            self.image_label.pack_forget()
+        self.placeholder_label.configure(text=f"🐾\n{self.pet.name}")
+        self.placeholder_label.pack(expand=True)
+        
+        image_path = self.pet.image_urls[0] if self.pet.image_urls else None
         if image_path:
-            # Convert relative path to absolute path
-            if not os.path.isabs(image_path):
-                base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-                image_path = os.path.join(base_dir, image_path)
+            image_path = resolve_asset_path(image_path)
             
             if os.path.exists(image_path):
-                try:
-                    img = Image.open(image_path)
-                    img = img.resize((300, 200), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(img)
-                    
-                    self.image_label = ctk.CTkLabel(
-                        frame,
-                        image=photo,
-                        text=""
-                    )
-                    self.image_label.image = photo  # Keep reference
-                    self.image_label.pack(fill="both", expand=True)
-                    return
-                except Exception as e:
-                    print(f"Error loading image {image_path}: {e}")
-        
-        # Fallback to placeholder
-        self._create_placeholder(frame)
+                self._image_request = image_cache.load_async(
+                    image_path, (300, 200), self._show_image, owner=self
+                )
+    
+    def _show_image(self, photo):
+        """Replace the placeholder with the decoded image"""
+        self._image_request = None
+        self.placeholder_label.pack_forget()
+        
+        if self.image_label:
+            self.image_label.configure(image=photo)
+        else:
+            self.image_label = ctk.CTkLabel(
+                self.image_frame,
+                image=photo,
+                text=""
+            )
+            self.image_label.bind("<Button-1>", self._on_click)
+        self.image_label.image = photo  # Keep reference
+        self.image_label.pack(fill="both", expand=True)
     
     def _create_placeholder(self, frame):
         """Create placeholder when image not available"""
@@ -136,6 +178,7 @@ class PetCard(ctk.CTkFrame):
             text_color=TEXT_GRAY_500
         )
         placeholder.pack(expand=True)
+        return placeholder
     
     def _bind_click_to_children(self, widget):
         """Recursively bind click event to all child widgets"""
@@ -150,14 +193,45 @@ class PetCard(ctk.CTkFrame):
     
     def _toggle_wishlist(self):
         """Toggle wishlist status"""
-        app_state.toggle_wishlist(self.pet)
-        is_in_wishlist = app_state.is_in_wishlist(self.pet.id)
-        self.wishlist_btn.configure(
-            text="♥" if is_in_wishlist else "♡",
-            text_color=YELLOW_PRIMARY if is_in_wishlist else TEXT_WHITE
-        )
-        message = f"{self.pet.name} {'added to' if is_in_wishlist else 'removed from'} wishlist!"
-        app_state.add_toast(message, 'success')
+        with app_state.batch():
+            app_state.toggle_wishlist(self.pet)
+            is_in_wishlist = app_state.is_in_wishlist(self.pet.id)
+            self.refresh_wishlist()
+            message = f"{self.pet.name} {'added to' if is_in_wishlist else 'removed from'} wishlist!"
+            app_state.add_toast(message, 'success')
+    
+    def _on_enter(self, event):
+        """Start the hover-intent timer when the pointer reaches the card"""
+        if self._hover_after_id is None and self._prefetched_pet is not self.pet:
+            self._hover_after_id = self.after(HOVER_INTENT_MS, self._prefetch_details)
+    
+    def _on_leave(self, event):
+        """Stop the hover-intent timer once the pointer leaves the card"""
+        x, y = self.winfo_pointerxy()
+        inside = (self.winfo_rootx() <= x < self.winfo_rootx() + self.winfo_width()
+                  and self.winfo_rooty() <= y < self.winfo_rooty() + self.winfo_height())
+        if not inside:
+            self._cancel_hover()
+    
+    def _cancel_hover(self):
+        if self._hover_after_id is not None:
+            self.after_cancel(self._hover_after_id)
+            self._hover_after_id = None
+    
+    def _prefetch_details(self):
+        """Decode the pet's gallery ahead of a likely click"""
+        self._hover_after_id = None
+        self._prefetched_pet = self.pet
+        # Imported here so loading a card doesn't load the details view with it
+        from views.pet_details_page import PetDetailsPage
+        PetDetailsPage.prefetch_gallery(self.pet, owner=self)
+    
+    def destroy(self):
+        """Cancel a pending image load before destroying the card"""
+        if self._image_request:
+            self._image_request.cancel()
+        self._cancel_hover()
+        super().destroy()
     
     def _on_click(self, event):
         """Handle card click"""
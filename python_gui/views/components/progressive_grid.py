@@ -0,0 +1,92 @@
+"""
+Grid component that builds its cells in time-sliced batches
+"""
+import time
+import customtkinter as ctk
+from typing import Any, Callable, Sequence
+
+# Milliseconds of cell construction per batch, about one frame at 60 Hz
+FRAME_BUDGET_MS = 16
+
+# Pause between batches so Tk can redraw and handle input
+BATCH_GAP_MS = 1
+
+
+class ProgressiveGrid(ctk.CTkFrame):
+    """Grid whose cells are created a batch per event-loop tick so the window repaints between batches
+
+    Batches stop while the grid is not viewable (e.g. its page was navigated away from
+    or pre-built but not shown yet) until resume() is called as the page is shown;
+    meanwhile prebuild() can fill it in from idle time. Building stops for good when
+    the grid is destroyed.
+    """
+
+    def __init__(self, parent, items: Sequence, create_cell: Callable[[Any, Any], Any],
+                 columns: int = 4, padx: int = 15, pady: int = 15, budget_ms: float = FRAME_BUDGET_MS):
+        super().__init__(parent, fg_color="transparent")
+        self.items = items
+        self.create_cell = create_cell  # (parent, item) -> widget
+        self.columns = columns
+        self.padx = padx
+        self.pady = pady
+        self.budget_ms = budget_ms
+        self.built = 0
+        self.cells = []
+        self._after_id = None
+
+        for i in range(columns):
+            self.grid_columnconfigure(i, weight=1)
+
+        # The first batch runs once the page around the grid has been laid out and painted
+        self._schedule(0)
+
+    @property
+    def done(self) -> bool:
+        return self.built >= len(self.items)
+
+    def _schedule(self, delay_ms: int = BATCH_GAP_MS):
+        if self._after_id is None and not self.done:
+            self._after_id = self.after(delay_ms, self._wait_for_idle)
+
+    def _wait_for_idle(self):
+        """Run the next batch after pending redraws"""
+        self._after_id = self.after_idle(self._build_batch)
+
+    def _build_batch(self):
+        """Create a batch of cells, then yield to the event loop"""
+        self._after_id = None
+        if not self.winfo_exists() or not self.winfo_viewable():
+            # Hidden, e.g. its page was navigated away from: resume() picks up when it is shown
+            return
+        self._build(self.budget_ms)
+        self._schedule()
+
+    def resume(self):
+        """Continue building once the grid's page is shown again"""
+        self._schedule(0)
+
+    def prebuild(self, budget_ms: float = 0) -> bool:
+        """Create cells for up to budget_ms (at least one) while the grid is not shown; True once all are built"""
+        if not self.winfo_exists() or self.winfo_viewable():
+            return True  # Gone, or shown and building in its own batches
+        self._build(budget_ms)
+        return self.done
+
+    def _build(self, budget_ms: float):
+        """Create cells until budget_ms is spent"""
+        deadline = time.perf_counter() + budget_ms / 1000
+        while not self.done:
+            row, col = divmod(self.built, self.columns)
+            cell = self.create_cell(self, self.items[self.built])
+            cell.grid(row=row, column=col, padx=self.padx, pady=self.pady, sticky="nsew")
+            self.cells.append(cell)
+            self.built += 1
+            if time.perf_counter() >= deadline:
+                break
+
+    def destroy(self):
+        """Abandon any remaining batches before destroying the grid"""
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        super().destroy()
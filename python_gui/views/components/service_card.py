@@ -2,11 +2,11 @@
 Service card component
 """
 import customtkinter as ctk
-from PIL import Image, ImageTk
 import os
 from models.app_state import app_state
 from models.types import Service
 from utils.colors import *
+from utils.image_cache import image_cache, resolve_asset_path
 
 class ServiceCard(ctk.CTkFrame):
     def __init__(self, parent, service: Service, app):
@@ -19,6 +19,7 @@ class ServiceCard(ctk.CTkFrame):
         self.service = service
         self.app = app
         self.is_expanded = False
+        self._image_request = None
         
         self._create_widgets()
     
@@ -143,17 +144,25 @@ class ServiceCard(ctk.CTkFrame):
     
     def _load_background(self):
         """Load background image"""
-        if os.path.exists(self.service.image_url):
-            try:
-                img = Image.open(self.service.image_url)
-                img = img.resize((350, 400), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                
-                bg_label = ctk.CTkLabel(self.bg_frame, image=photo, text="")
-                bg_label.image = photo
-                bg_label.place(relx=0, rely=0, relwidth=1, relheight=1)
-            except:
-                pass
+        image_path = resolve_asset_path(self.service.image_url)
+        if os.path.exists(image_path):
+            self._image_request = image_cache.load_async(
+                image_path, (350, 400), self._show_background, owner=self
+            )
+    
+    def _show_background(self, photo):
+        """Place the decoded background image beneath the overlay"""
+        self._image_request = None
+        bg_label = ctk.CTkLabel(self.bg_frame, image=photo, text="")
+        bg_label.image = photo
+        bg_label.place(relx=0, rely=0, relwidth=1, relheight=1)
+        bg_label.lower()
+    
+    def destroy(self):
+        """Cancel a pending image load before destroying the card"""
+        if self._image_request:
+            self._image_request.cancel()
+        super().destroy()
     
     def _book(self):
         """Navigate to booking page"""
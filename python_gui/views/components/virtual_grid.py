@@ -0,0 +1,177 @@
+"""
+Virtualized grid component that only builds cells near the viewport
+"""
+import time
+import customtkinter as ctk
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from views.components.progressive_grid import BATCH_GAP_MS, FRAME_BUDGET_MS
+
+
+class VirtualGrid(ctk.CTkFrame):
+    """Grid of fixed-height rows whose cells are created or recycled as they scroll into view"""
+
+    def __init__(self, parent, app, create_cell: Callable[[Any, Any], Any],
+                 update_cell: Optional[Callable[[Any, Any], None]] = None,
+                 columns: int = 4, row_height: int = 370, padx: int = 15, pady: int = 15,
+                 overscan_rows: int = 1, budget_ms: float = FRAME_BUDGET_MS):
+        super().__init__(parent, fg_color="transparent", height=row_height)
+        self.app = app
+        self.create_cell = create_cell  # (parent, item) -> widget
+        self.update_cell = update_cell  # (widget, item), rebinds a recycled cell; None destroys instead
+        self.columns = columns
+        self.row_height = row_height
+        self.padx = padx
+        self.pady = pady
+        self.overscan_rows = overscan_rows
+        self.budget_ms = budget_ms  # cell construction per tick before yielding to the event loop
+
+        self.items: Sequence = ()
+        self._cells: Dict[int, Any] = {}  # item index -> visible cell
+        self._spare: List[Any] = []  # hidden cells waiting to be rebound
+        self._measured = False
+        self._refresh_scheduled = False
+        self._batch_after_id = None
+        self.stats = {'created': 0, 'reused': 0}
+
+        self._remove_scroll_listener = app.add_scroll_listener(self._schedule_refresh)
+        self.bind("<Configure>", lambda event: self._schedule_refresh(), add="+")
+        self.bind("<Map>", lambda event: self._schedule_refresh(), add="+")
+
+    @property
+    def cells(self) -> List[Any]:
+        """Cells currently placed in the grid"""
+        return list(self._cells.values())
+
+    def set_items(self, items: Sequence):
+        """Show a new list of items, reusing the cells already built"""
+        self.items = items
+        for index in list(self._cells):
+            if self.update_cell and index < len(items):
+                # Rebind visible cells where they stand instead of re-placing them
+                self.update_cell(self._cells[index], items[index])
+                self.stats['reused'] += 1
+            else:
+                self._release(index)
+        self._update_height()
+        self._refresh()
+
+    def _update_height(self):
+        """Size the frame to the full grid so the scrollbar reflects every row"""
+        rows = -(-len(self.items) // self.columns)
+        height = max(rows * self.row_height, 1)
+        # place() works in pixels while CTk scales the frame height
+        self.configure(height=height / ctk.ScalingTracker.get_widget_scaling(self))
+
+    def _visible_range(self):
+        """Indexes of the items in or near the viewport"""
+        viewport_top, viewport_height = self.app.content_viewport()
+        top = viewport_top - self.winfo_rooty()
+        first_row = max(top // self.row_height - self.overscan_rows, 0)
+        last_row = (top + viewport_height) // self.row_height + 1 + self.overscan_rows
+        return first_row * self.columns, min(last_row * self.columns, len(self.items))
+
+    def _schedule_refresh(self):
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            self.after_idle(self._refresh)
+
+    def _refresh(self):
+        """Materialize cells for visible items and recycle the rest"""
+        self._refresh_scheduled = False
+        if not self.winfo_exists() or not self.winfo_viewable():
+            return  # Hidden grids (e.g. on a cached page) catch up on resume() when the page is shown
+
+        first, last = self._visible_range()
+        for index in [i for i in self._cells if not first <= i < last]:
+            self._release(index)
+
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        for index in range(first, last):
+            if index not in self._cells:
+                self._cells[index] = self._acquire(self.items[index])
+                self._place(index)
+                if time.perf_counter() >= deadline:
+                    # Build the rest next tick so the rows done so far get painted
+                    self._schedule_batch()
+                    break
+
+        if self._cells and not self._measured:
+            self._measure(next(iter(self._cells.values())))
+
+    def resume(self):
+        """Catch up with the viewport once the grid's page is shown again"""
+        self._schedule_refresh()
+
+    def prebuild(self, budget_ms: float = 0) -> bool:
+        """Create first-screen cells for up to budget_ms (at least one) while the grid is not shown; True once built
+
+        Pre-built pages are shown scrolled to the top, so the first rows are the ones
+        _refresh() keeps when the grid is mapped.
+        """
+        if not self.winfo_exists() or self.winfo_viewable():
+            return True  # Gone, or shown and refreshed from the viewport
+        _, viewport_height = self.app.content_viewport()
+        rows = viewport_height // self.row_height + 1 + self.overscan_rows
+        missing = [i for i in range(min(rows * self.columns, len(self.items))) if i not in self._cells]
+        deadline = time.perf_counter() + budget_ms / 1000
+        for count, index in enumerate(missing, 1):
+            self._cells[index] = self._acquire(self.items[index])
+            self._place(index)
+            if count < len(missing) and time.perf_counter() >= deadline:
+                return False
+        return True
+
+    def _schedule_batch(self):
+        if self._batch_after_id is None:
+            self._batch_after_id = self.after(BATCH_GAP_MS, self._continue_batch)
+
+    def _continue_batch(self):
+        self._batch_after_id = None
+        self._refresh()
+
+    def _acquire(self, item):
+        """Rebind a spare cell to item, or create one"""
+        if self._spare:
+            cell = self._spare.pop()
+            self.update_cell(cell, item)
+            self.stats['reused'] += 1
+            return cell
+
+        self.stats['created'] += 1
+        return self.create_cell(self, item)
+
+    def _release(self, index: int):
+        """Hide the cell showing index so it can be reused"""
+        cell = self._cells.pop(index)
+        if self.update_cell:
+            cell.place_forget()
+            self._spare.append(cell)
+        else:
+            cell.destroy()
+
+    def _place(self, index: int):
+        row, col = divmod(index, self.columns)
+        self._cells[index].place(
+            relx=col / self.columns, x=self.padx,
+            relwidth=1 / self.columns, width=-2 * self.padx,
+            y=row * self.row_height + self.pady
+        )
+
+    def _measure(self, cell):
+        """Use the first cell's real height as the row height"""
+        self._measured = True
+        cell.update_idletasks()
+        row_height = cell.winfo_reqheight() + 2 * self.pady
+        if row_height > 2 * self.pady and row_height != self.row_height:
+            self.row_height = row_height
+            self._update_height()
+            for index in self._cells:
+                self._place(index)
+            self._schedule_refresh()
+
+    def destroy(self):
+        """Stop listening to scroll events before destroying the grid"""
+        self._remove_scroll_listener()
+        if self._batch_after_id is not None:
+            self.after_cancel(self._batch_after_id)
+        super().destroy()
@@ -4,6 +4,7 @@ Contact page with form
 import customtkinter as ctk
 from models.app_state import app_state
 from utils.colors import *
+from utils.tracing import traced
 
 class ContactPage(ctk.CTkFrame):
     def __init__(self, parent, app):
@@ -11,6 +12,7 @@ class ContactPage(ctk.CTkFrame):
         self.app = app
         self._create_widgets()
     
+    @traced(category="view")
     def _create_widgets(self):
         """Create contact page widgets"""
         # Title
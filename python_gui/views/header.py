@@ -2,8 +2,6 @@
 Header component with navigation and user profile
 """
 import customtkinter as ctk
-from tkinter import PhotoImage
-from PIL import Image, ImageTk
 import os
 from models.app_state import app_state
 from utils.colors import *
@@ -16,6 +14,9 @@ class Header(ctk.CTkFrame):
         self.dropdown_menu = None
         
         self._create_widgets()
+        
+        # Badges and the profile button only depend on these slices
+        app_state.subscribe(lambda changed: self.update_display(), 'cart', 'wishlist', 'auth')
     
     def _create_widgets(self):
         """Create header widgets"""
@@ -153,7 +154,7 @@ class Header(ctk.CTkFrame):
             self.wishlist_badge.place(relx=0.7, rely=0.2, anchor="center")
         
         # Update cart badge
-        cart_count = sum(item.quantity for item in app_state.cart)
+        cart_count = app_state.cart_count()
         if self.cart_badge:
             self.cart_badge.destroy()
             self.cart_badge = None
@@ -215,7 +216,7 @@ class Header(ctk.CTkFrame):
     def _open_auth_modal(self):
         """Open authentication modal"""
         app_state.is_auth_modal_open = True
-        app_state.notify_change()
+        app_state.notify_change('modals')
     
     def _toggle_dropdown(self):
         """Toggle profile dropdown menu"""
@@ -4,16 +4,35 @@ Home page view
 import customtkinter as ctk
 from models.app_state import app_state
 from utils.colors import *
+from utils.startup import startup_timer
+from utils.tracing import traced
 from views.components.pet_card import PetCard
+from views.components.progressive_grid import ProgressiveGrid
 
 class HomePage(ctk.CTkFrame):
+    # Featured pet cards show whether each pet is wishlisted
+    state_topics = ('wishlist',)
+    
     def __init__(self, parent, app):
         super().__init__(parent, fg_color="transparent")
         self.app = app
+        self.featured_grid = None
         self._create_widgets()
     
+    @traced(category="view")
     def _create_widgets(self):
-        """Create home page widgets"""
+        """Create home page widgets, timing each section while startup is profiled"""
+        with startup_timer.phase("hero"):
+            self._create_hero()
+        with startup_timer.phase("features"):
+            self._create_features()
+        with startup_timer.phase("featured_pets"):
+            self._create_featured_pets()
+        with startup_timer.phase("testimonials"):
+            self._create_testimonials()
+    
+    def _create_hero(self):
+        """Create the hero banner with its call-to-action buttons"""
         # Hero Section
         hero_frame = ctk.CTkFrame(
             self,
@@ -78,7 +97,9 @@ class HomePage(ctk.CTkFrame):
             command=lambda: self.app.navigate_to("services")
         )
         services_btn.pack(side="left")
-        
+    
+    def _create_features(self):
+        """Create the "Why Choose OnlyPets?" section"""
         # Why Choose Us Section
         section_title = ctk.CTkLabel(
             self,
@@ -132,7 +153,9 @@ class HomePage(ctk.CTkFrame):
                 wraplength=300
             )
             feature_desc.pack(pady=(0, 30), padx=20)
-        
+    
+    def _create_featured_pets(self):
+        """Create the featured pets section"""
         # Featured Pets Section
         if app_state.pets:
             featured_title = ctk.CTkLabel(
@@ -143,17 +166,24 @@ class HomePage(ctk.CTkFrame):
             )
             featured_title.pack(pady=(0, 40))
             
-            pets_grid = ctk.CTkFrame(self, fg_color="transparent")
-            pets_grid.pack(fill="x", pady=(0, 80))
-            
-            for i in range(4):
-                pets_grid.grid_columnconfigure(i, weight=1)
-            
-            # Show first 4 pets
-            for i, pet in enumerate(app_state.pets[:4]):
-                pet_card = PetCard(pets_grid, pet, self.app)
-                pet_card.grid(row=0, column=i, padx=15, pady=10, sticky="nsew")
-        
+            # Show first 4 pets, built after the rest of the page has painted
+            self.featured_grid = ProgressiveGrid(
+                self,
+                app_state.pets[:4],
+                create_cell=lambda parent, pet: PetCard(parent, pet, self.app),
+                columns=4,
+                pady=10
+            )
+            self.featured_grid.pack(fill="x", pady=(0, 80))
+    
+    def refresh(self):
+        """Update the wishlist hearts on the featured pet cards"""
+        if self.featured_grid:
+            for card in self.featured_grid.cells:
+                card.refresh_wishlist()
+    
+    def _create_testimonials(self):
+        """Create the testimonials section"""
         # Testimonials Section
         testimonials_title = ctk.CTkLabel(
             self,
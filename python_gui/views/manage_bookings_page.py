@@ -4,13 +4,18 @@ Manage Bookings page for viewing and canceling existing bookings
 import customtkinter as ctk
 from models.app_state import app_state
 from utils.colors import *
+from utils.tracing import traced
 
 class ManageBookingsPage(ctk.CTkFrame):
+    # State slices that trigger refresh()
+    state_topics = ('bookings', 'auth')
+    
     def __init__(self, parent, app):
         super().__init__(parent, fg_color="transparent")
         self.app = app
         self._create_widgets()
     
+    @traced(category="view")
     def _create_widgets(self):
         """Create manage bookings page widgets"""
         # Title
@@ -290,10 +295,13 @@ class ManageBookingsPage(ctk.CTkFrame):
     
     def _confirm_cancel_booking(self, booking):
         """Confirm and execute booking cancellation"""
-        app_state.cancel_booking(booking.id)
-        app_state.add_toast("Booking cancelled successfully.", "success")
+        with app_state.batch():
+            app_state.cancel_booking(booking.id)
+            app_state.add_toast("Booking cancelled successfully.", "success")
         self._close_cancel_modal()
-        # Refresh the page
+    
+    def refresh(self):
+        """Refresh the page"""
         for widget in self.winfo_children():
             widget.destroy()
         self._create_widgets()
@@ -2,18 +2,27 @@
 Pet details page with image carousel and adoption button
 """
 import customtkinter as ctk
-from PIL import Image, ImageTk
 import os
 from models.app_state import app_state
 from utils.colors import *
+from models.types import Pet
+from utils.image_cache import image_cache, resolve_asset_path
+from utils.tracing import traced
+
+# Size of the gallery images
+GALLERY_SIZE = (380, 380)
 
 class PetDetailsPage(ctk.CTkFrame):
+    # Shows a pet from the catalog, which may be replaced while the page is cached
+    state_topics = ('pets',)
+    
     def __init__(self, parent, app, pet_id):
         super().__init__(parent, fg_color="transparent")
         self.app = app
         print(f"PetDetailsPage: Looking for pet with ID: {pet_id}")  # Debug
         self.pet = next((p for p in app_state.pets if p.id == pet_id), None)
         self.active_image_index = 0
+        self._image_request = None
         
         if not self.pet:
             print(f"PetDetailsPage: Pet not found with ID: {pet_id}")  # Debug
@@ -24,7 +33,11 @@ class PetDetailsPage(ctk.CTkFrame):
         
         print(f"PetDetailsPage: Found pet: {self.pet.name}")  # Debug
         self._create_widgets()
+        
+        # Decode the rest of the gallery so flipping through the dots is instant
+        self.prefetch_gallery(self.pet, owner=self)
     
+    @traced(category="view")
     def _create_widgets(self):
         """Create pet details widgets"""
         # Container with dark background
@@ -175,31 +188,32 @@ class PetDetailsPage(ctk.CTkFrame):
         adopt_btn.pack(anchor="w")
     
     def _display_image(self):
-        """Display current image"""
+        """Display current image, showing the placeholder until it is decoded"""
+        if self._image_request:
+            self._image_request.cancel()
+            self._image_request = None
+        
         for widget in self.image_display.winfo_children():
             widget.destroy()
         
-        image_path = self.pet.image_urls[self.active_image_index]
-        
-        # Convert relative path to absolute path
-        if not os.path.isabs(image_path):
-            base_dir = os.path.dirname(os.path.dirname(__file__))
-            image_path = os.path.join(base_dir, image_path)
+        image_path = resolve_asset_path(self.pet.image_urls[self.active_image_index])
+        placeholder = self._create_placeholder()
         
         if os.path.exists(image_path):
-            try:
-                img = Image.open(image_path)
-                img = img.resize((380, 380), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                
-                image_label = ctk.CTkLabel(self.image_display, image=photo, text="")
-                image_label.image = photo
-                image_label.pack(expand=True)
-                return
-            except Exception as e:
-                print(f"Error loading image {image_path}: {e}")
-        
-        self._create_placeholder()
+            self._image_request = image_cache.load_async(
+                image_path, GALLERY_SIZE,
+                lambda photo: self._show_image(placeholder, photo),
+                owner=self
+            )
+    
+    def _show_image(self, placeholder, photo):
+        """Replace the placeholder with the decoded image"""
+        self._image_request = None
+        placeholder.destroy()
+        
+        image_label = ctk.CTkLabel(self.image_display, image=photo, text="")
+        image_label.image = photo
+        image_label.pack(expand=True)
     
     def _create_placeholder(self):
         """Create placeholder image"""
@@ -210,6 +224,7 @@ class PetDetailsPage(ctk.CTkFrame):
             text_color=TEXT_GRAY_500
         )
         placeholder.pack(expand=True)
+        return placeholder
     
     def _change_image(self, index):
         """Change active image"""
@@ -220,6 +235,44 @@ class PetDetailsPage(ctk.CTkFrame):
         for i, dot in enumerate(self.dot_buttons):
             dot.configure(text_color=YELLOW_PRIMARY if i == index else TEXT_GRAY_500)
     
+    def refresh(self):
+        """Rebuild the page if the catalog now holds a different record for the pet"""
+        if not self.pet:
+            return
+        pet = next((p for p in app_state.pets if p.id == self.pet.id), None)
+        if pet is self.pet:
+            return
+        if not pet:
+            # The pet left the catalog: go back to adoption once this navigation is done
+            self.after_idle(self._leave_if_current)
+            return
+        
+        if self._image_request:
+            self._image_request.cancel()
+            self._image_request = None
+        for widget in self.winfo_children():
+            widget.destroy()
+        self.pet = pet
+        self.active_image_index = 0
+        self._create_widgets()
+        self.prefetch_gallery(self.pet, owner=self)
+    
+    def _leave_if_current(self):
+        if self.winfo_exists() and self.app.current_page is self:
+            self.app.navigate_to("adoption")
+    
+    @staticmethod
+    def prefetch_gallery(pet: Pet, owner=None) -> list:
+        """Start decoding a pet's gallery images into the image cache"""
+        requests = [image_cache.prefetch(path, GALLERY_SIZE, owner=owner) for path in pet.image_urls]
+        return [request for request in requests if request]
+    
+    def destroy(self):
+        """Cancel a pending image load before destroying the page"""
+        if self._image_request:
+            self._image_request.cancel()
+        super().destroy()
+    
     def _adopt(self):
         """Navigate to adoption booking"""
         self.app.navigate_to("booking", booking_type="pet", booking_id=self.pet.id)
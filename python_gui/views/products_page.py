@@ -2,14 +2,15 @@
 Products page with product cards
 """
 import customtkinter as ctk
-from PIL import Image, ImageTk
 import os
 from models.app_state import app_state
 from models.types import Product
 from utils.colors import *
+from utils.image_cache import image_cache, resolve_asset_path
+from utils.tracing import traced
 
 class ProductsPage(ctk.CTkFrame):
-    def __init__(self, parent, app):
+    def __init__(self, parent, app, staged: bool = False):
         super().__init__(parent, fg_color="transparent")
         self.app = app
         self.products = [
@@ -18,10 +19,18 @@ class ProductsPage(ctk.CTkFrame):
             Product(id='prod_03', name='Organic Pet Food', price=1800.00, image='assets/products/petfood.png'),
             Product(id='prod_04', name='Gourmet Pet Food', price=2000.00, image='assets/products/petfood.png'),
         ]
-        self._create_widgets()
+        self._image_requests = []
+        if not staged:
+            self._create_widgets()
     
+    @traced(category="view")
     def _create_widgets(self):
         """Create products page widgets"""
+        for _ in self.build_steps():
+            pass
+    
+    def build_steps(self):
+        """Create the widgets a step per section and per product card"""
         # Title
         title = ctk.CTkLabel(
             self,
@@ -48,6 +57,7 @@ class ProductsPage(ctk.CTkFrame):
         
         for i, product in enumerate(self.products):
             col = i % 4
+            yield
             
             product_card = self._create_product_card(products_grid, product)
             product_card.grid(row=0, column=col, padx=15, pady=15, sticky="nsew")
@@ -61,27 +71,20 @@ class ProductsPage(ctk.CTkFrame):
         image_frame.pack(fill="x")
         image_frame.pack_propagate(False)
         
-        # Convert relative path to absolute path
-        image_path = product.image
-        if not os.path.isabs(image_path):
-            base_dir = os.path.dirname(os.path.dirname(__file__))
-            image_path = os.path.join(base_dir, image_path)
+        image_path = resolve_asset_path(product.image)
+        placeholder = self._create_product_placeholder(image_frame, product)
         
         if os.path.exists(image_path):
-            try:
-                img = Image.open(image_path)
-                img = img.resize((250, 200), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                
-                img_label = ctk.CTkLabel(image_frame, image=photo, text="")
-                img_label.image = photo
-                img_label.pack(expand=True)
-            except Exception as e:
-                print(f"Error loading product image {image_path}: {e}")
-                self._create_product_placeholder(image_frame, product)
+            # Cards showing the same image share one background decode
+            request = image_cache.load_async(
+                image_path, (250, 200),
+                lambda photo: self._show_product_image(image_frame, placeholder, photo),
+                owner=image_frame
+            )
+            if request:
+                self._image_requests.append(request)
         else:
             print(f"Product image not found: {image_path}")
-            self._create_product_placeholder(image_frame, product)
         
         # Content
         content_frame = ctk.CTkFrame(card, fg_color="transparent")
@@ -133,8 +136,23 @@ class ProductsPage(ctk.CTkFrame):
             text_color=TEXT_GRAY_500
         )
         placeholder.pack(expand=True)
+        return placeholder
+    
+    def _show_product_image(self, frame, placeholder, photo):
+        """Replace a product placeholder with the decoded image"""
+        placeholder.destroy()
+        img_label = ctk.CTkLabel(frame, image=photo, text="")
+        img_label.image = photo
+        img_label.pack(expand=True)
     
     def _add_to_cart(self, product: Product):
         """Add product to cart"""
-        app_state.add_to_cart(product)
-        app_state.add_toast(f"{product.name} added to cart!", "success")
+        with app_state.batch():
+            app_state.add_to_cart(product)
+            app_state.add_toast(f"{product.name} added to cart!", "success")
+    
+    def destroy(self):
+        """Cancel pending image loads before destroying the page"""
+        for request in self._image_requests:
+            request.cancel()
+        super().destroy()
@@ -3,10 +3,10 @@ Profile setup modal
 """
 import customtkinter as ctk
 from tkinter import filedialog
-from PIL import Image, ImageTk
 import os
 from models.app_state import app_state
 from utils.colors import *
+from utils.image_cache import image_cache
 
 class ProfileModal(ctk.CTkToplevel):
     def __init__(self, parent, app):
@@ -148,9 +148,7 @@ class ProfileModal(ctk.CTkToplevel):
         if file_path:
             try:
                 # Load and display image
-                img = Image.open(file_path)
-                img = img.resize((120, 120), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
+                photo = image_cache.get(file_path, (120, 120))
                 
                 self.profile_image_label.configure(image=photo, text="")
                 self.profile_image_label.image = photo
@@ -185,5 +183,5 @@ class ProfileModal(ctk.CTkToplevel):
     def _close(self):
         """Close modal"""
         app_state.is_profile_modal_open = False
-        app_state.notify_change()
+        app_state.notify_change('modals')
         self.destroy()
@@ -4,17 +4,25 @@ Services page
 import customtkinter as ctk
 from models.app_state import app_state
 from utils.colors import *
+from utils.tracing import traced
+from views.components.progressive_grid import ProgressiveGrid
 from views.components.service_card import ServiceCard
 
 class ServicesPage(ctk.CTkFrame):
-    def __init__(self, parent, app):
+    def __init__(self, parent, app, staged: bool = False):
         super().__init__(parent, fg_color="transparent")
         self.app = app
-        self._create_widgets()
+        if not staged:
+            self._create_widgets()
     
+    @traced(category="view")
     def _create_widgets(self):
         """Create services page widgets"""
-        
+        for _ in self.build_steps():
+            pass
+    
+    def build_steps(self):
+        """Create the widgets a section per step; the service cards fill in as the grid builds"""
         # Title
         title = ctk.CTkLabel(
             self,
@@ -31,6 +39,7 @@ class ServicesPage(ctk.CTkFrame):
             text_color=TEXT_GRAY_400
         )
         subtitle.pack(pady=(0, 40))
+        yield
         
         # Check if services exist
         if not app_state.services:
@@ -43,22 +52,16 @@ class ServicesPage(ctk.CTkFrame):
             no_services_label.pack(pady=50)
             return
         
-        # Services grid
-        services_grid = ctk.CTkFrame(self, fg_color="transparent")
+        # Services grid, built a batch of cards per tick
+        services_grid = ProgressiveGrid(
+            self,
+            app_state.services,
+            create_cell=lambda parent, service: ServiceCard(parent, service, self.app),
+            columns=3
+        )
         services_grid.pack(fill="both", expand=True)
         
-        # Configure grid
-        for i in range(3):
-            services_grid.grid_columnconfigure(i, weight=1)
-        
         # Calculate number of rows needed
         num_rows = (len(app_state.services) + 2) // 3
         for i in range(num_rows):
             services_grid.grid_rowconfigure(i, minsize=480)
-        
-        for i, service in enumerate(app_state.services):
-            row = i // 3
-            col = i % 3
-            
-            service_card = ServiceCard(services_grid, service, self.app)
-            service_card.grid(row=row, column=col, padx=15, pady=15, sticky="nsew")
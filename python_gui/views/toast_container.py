@@ -16,6 +16,7 @@ class ToastContainer(ctk.CTkFrame):
         self.place_forget()
         
         self.update_toasts()
+        app_state.subscribe(lambda changed: self.update_toasts(), 'toasts')
     
     def update_toasts(self):
         """Update displayed toasts"""
@@ -3,17 +3,22 @@ Wishlist page displaying favorite pets and services
 """
 import customtkinter as ctk
 from models.app_state import app_state
-from models.types import Pet, Service
 from utils.colors import *
+from utils.tracing import traced
 from views.components.pet_card import PetCard
+from views.components.progressive_grid import ProgressiveGrid
 from views.components.service_card import ServiceCard
 
 class WishlistPage(ctk.CTkFrame):
+    # State slices that trigger refresh()
+    state_topics = ('wishlist',)
+    
     def __init__(self, parent, app):
         super().__init__(parent, fg_color="transparent")
         self.app = app
         self._create_widgets()
     
+    @traced(category="view")
     def _create_widgets(self):
         """Create wishlist page widgets"""
         # Title
@@ -74,8 +79,7 @@ class WishlistPage(ctk.CTkFrame):
     def _create_wishlist_content(self):
         """Display wishlist items"""
         # Separate pets and services
-        pets = [item for item in app_state.wishlist if isinstance(item, Pet)]
-        services = [item for item in app_state.wishlist if isinstance(item, Service)]
+        pets, services = app_state.wishlist_by_kind()
         
         # Pets section
         if pets:
@@ -88,18 +92,13 @@ class WishlistPage(ctk.CTkFrame):
             )
             pets_title.pack(fill="x", pady=(0, 20))
             
-            pets_grid = ctk.CTkFrame(self, fg_color="transparent")
+            pets_grid = ProgressiveGrid(
+                self,
+                pets,
+                create_cell=lambda parent, pet: PetCard(parent, pet, self.app),
+                columns=4
+            )
             pets_grid.pack(fill="x", pady=(0, 60))
-            
-            for i in range(4):
-                pets_grid.grid_columnconfigure(i, weight=1)
-            
-            for i, pet in enumerate(pets):
-                row = i // 4
-                col = i % 4
-                
-                pet_card = PetCard(pets_grid, pet, self.app)
-                pet_card.grid(row=row, column=col, padx=15, pady=15, sticky="nsew")
         
         # Services section
         if services:
@@ -112,18 +111,13 @@ class WishlistPage(ctk.CTkFrame):
             )
             services_title.pack(fill="x", pady=(0, 20))
             
-            services_grid = ctk.CTkFrame(self, fg_color="transparent")
+            services_grid = ProgressiveGrid(
+                self,
+                services,
+                create_cell=lambda parent, service: ServiceCard(parent, service, self.app),
+                columns=3
+            )
             services_grid.pack(fill="x")
-            
-            for i in range(3):
-                services_grid.grid_columnconfigure(i, weight=1)
-            
-            for i, service in enumerate(services):
-                row = i // 3
-                col = i % 3
-                
-                service_card = ServiceCard(services_grid, service, self.app)
-                service_card.grid(row=row, column=col, padx=15, pady=15, sticky="nsew")
     
     def refresh(self):
         """Refresh the page"""